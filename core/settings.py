@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 from environ import Env
 from django.contrib.messages import constants as messages
@@ -67,6 +68,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'src.web.middleware.TokenBucketMiddleware',# Token bucket для HTMX-эндпоинтов, после Authentication
     # 'src.users.middleware.UserLanguageMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -148,10 +150,46 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication', # Этот класс ищет заголовок "Token ..."
+        'src.api.authentication.CachedTokenAuthentication', # Заголовок "Token ...", пользователь из кеша
         'rest_framework.authentication.SessionAuthentication', # Позволяет логиниться через админку в браузере
     ],
+    # orjson — JSON с тем же выводом, что и стандартный рендерер (без orjson работает как JSONRenderer);
+    # MessagePack — только если установлен msgpack, выбирается по Accept: application/msgpack
+    'DEFAULT_RENDERER_CLASSES': [
+        'src.api.renderers.ORJSONRenderer',
+        *(['src.api.renderers.MessagePackRenderer'] if find_spec('msgpack') else []),
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'src.api.renderers.ORJSONParser',
+        *(['src.api.renderers.MessagePackParser'] if find_spec('msgpack') else []),
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Token bucket (src/common/rate_limit.py); scope задаётся во view (throttle_scope / throttle_scopes)
+    'DEFAULT_THROTTLE_CLASSES': [
+        'src.api.throttling.TokenBucketThrottle',
+    ],
+    # IP для вёдер (get_ident): приложение стоит за одним nginx, он дописывает адрес клиента
+    # в конец X-Forwarded-For. Без NUM_PROXIES DRF берёт заголовок целиком — клиент подставил бы любой IP.
+    'NUM_PROXIES': env.int('NUM_PROXIES', default=1),
+}
+
+# Вёдра по эндпоинтам: "<запросов>/<s|min|h|d>" на пользователя и на IP.
+# Ёмкость ведра = число запросов (допустимый всплеск). IP-лимит с запасом: класс сидит за одним NAT.
+THROTTLE_BUCKETS = {
+    # next-card дороже ответа (выбор карточки + сборка), клиент в цикле не должен его молотить
+    'training-next-card': {'user': '60/min', 'ip': '1200/min'},
+    'training-answer': {'user': '60/min', 'ip': '1200/min'},
+    'training-batch': {'user': '30/h', 'ip': '600/h'},
 }
+# Обычные view (TokenBucketMiddleware): url_name -> scope
+THROTTLE_URL_SCOPES = {
+    'submit-answer': 'training-answer',
+}
+
+# Кеш token -> user для CachedTokenAuthentication (src/users/services.py: TokenCacheService)
+AUTH_TOKEN_CACHE_ALIAS = "default"
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -165,6 +203,12 @@ LANGUAGES = [
     ('uk', 'Українська'),
 ]
 
+# Markdown-страницы /docs/<slug>/ (src/common/markdown_pages.py); /docs/ — MARKDOWN_DEFAULT_PAGE
+MARKDOWN_PAGES = {
+    'work-1c': {'path': BASE_DIR / 'content' / 'work_1c.md', 'title': 'Работы по 1С'},
+}
+MARKDOWN_DEFAULT_PAGE = 'work-1c'
+
 LOCALE_PATHS = [
     BASE_DIR / 'locale',
 ]
@@ -246,6 +290,10 @@ STATICFILES_DIRS = [ BASE_DIR / "static"]
 # Для продакшена (когда будете делать collectstatic)
 STATIC_ROOT = BASE_DIR / 'staticfiles' # Для сбора статики в продакшене
 
+# Версия релиза (Dockerfile: --build-arg RELEASE_VERSION=<git sha>) — часть ключа кеша страниц,
+# новый деплой не читает страницы предыдущего (src/common/page_cache.py)
+RELEASE_VERSION = env("RELEASE_VERSION", default="dev")
+
 # Redis URLs (через django-environ)
 REDIS_CACHE_URL = env(
     "REDIS_CACHE_URL",
@@ -24,6 +24,9 @@ echo "Redis started"
 # --- 4. Миграции и сбор статики ---
 python manage.py migrate --noinput
 python manage.py collectstatic --noinput
+python manage.py build_form_index --missing
+python manage.py render_markdown_pages
+python manage.py warm_page_cache
 
 # --- 5. Запуск приложения от django ---
 exec gosu django "$@"
\ No newline at end of file
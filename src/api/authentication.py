@@ -0,0 +1,29 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from src.users.services import TokenCacheService
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication без JOIN authtoken_token -> users_user на каждом запросе:
+    пользователь берётся из кеша (TokenCacheService), в БД — только при промахе.
+    """
+
+    def authenticate_credentials(self, key):
+        user = TokenCacheService.get_user(key)
+        if user is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related("user").get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+            user = token.user
+            TokenCacheService.set_user(key, user)
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        # request.auth остаётся объектом Token, как у TokenAuthentication (без обращения к БД)
+        return user, self.get_model()(key=key, user=user)
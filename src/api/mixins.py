@@ -1,5 +1,12 @@
+import hashlib
+
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
 from rest_framework.exceptions import PermissionDenied
-from src.personal_forms.services import LearningUnitProgressService
+from rest_framework.response import Response
+
+from src.personal_forms.services import ContentVersionService, LearningUnitProgressService
 
 
 class StudentAccessMixin:
@@ -17,4 +24,60 @@ class StudentAccessMixin:
             )
         except (PermissionError, ValueError) as e:
             # Превращаем любую ошибку сервиса в 403 ошибку API
-            raise PermissionDenied(str(e))
\ No newline at end of file
+            raise PermissionDenied(str(e))
+
+
+class ConditionalResponseMixin:
+    """
+    ETag / If-None-Match для тяжёлых read-only эндпоинтов.
+    ETag считается из дешёвых штампов версий (ContentVersionService), а не из тела ответа,
+    поэтому при совпадении возвращается 304 без вызова сервисов прогресса.
+    """
+
+    def build_etag(self, target_user, *parts) -> str:
+        versions = ContentVersionService()
+        raw = ":".join(
+            str(p) for p in (
+                target_user.pk,
+                versions.get_progress_stamp(target_user.pk),
+                versions.get_catalog_version(),
+                self.request.accepted_renderer.format,
+                *parts,
+            )
+        )
+        return quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+
+    def conditional_response(self, etag: str, build_data):
+        """build_data вызывается только если клиентская версия устарела"""
+        not_modified = get_conditional_response(self.request, etag=etag)
+        response = not_modified if not_modified is not None else Response(build_data())
+        response["ETag"] = etag
+        # Ответ зависит от пользователя: общие кеши не должны его хранить, клиент обязан перепроверять
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization", "Cookie"])
+        return response
+
+
+class VersionedResponseCacheMixin:
+    """
+    Кеш тел ответов по ключу (endpoint, user, params, progress version, catalog version).
+    Инвалидация — инкремент версии (ProgressService.record_answer, signals.py), без поиска ключей.
+    """
+
+    RESPONSE_CACHE_TTL = 60 * 60
+
+    def get_cached_data(self, target_user, endpoint: str, build_data):
+        versions = ContentVersionService()
+        params = hashlib.sha1(
+            repr(sorted(self.request.query_params.lists())).encode()
+        ).hexdigest()[:16]
+        key = (
+            f"api:{endpoint}:{target_user.pk}:{params}"
+            f":{versions.get_progress_version(target_user.pk)}:{versions.get_catalog_version()}"
+        )
+
+        data = cache.get(key)
+        if data is None:
+            data = build_data()
+            cache.set(key, data, self.RESPONSE_CACHE_TTL)
+        return data
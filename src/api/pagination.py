@@ -0,0 +1,102 @@
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset-пагинация по (updated_at, id).
+    В отличие от OFFSET стоимость страницы не растёт с её номером, а строки,
+    обновлённые во время листания, не пропадают: при сортировке по возрастанию
+    они придут ещё раз (с новыми данными) на последних страницах.
+    Курсор — base64("<updated_at isoformat>|<id>") последней строки страницы.
+    """
+
+    page_size = 200
+    max_page_size = 1000
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    ordering = ("updated_at", "id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        time_field, id_field = self.ordering
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            updated_at, last_id = cursor
+            queryset = queryset.filter(
+                Q(**{f"{time_field}__gt": updated_at})
+                | Q(**{time_field: updated_at, f"{id_field}__gt": last_id})
+            )
+
+        # +1 строка, чтобы узнать, есть ли следующая страница, без COUNT(*)
+        rows = list(queryset.order_by(*self.ordering)[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        self.next_cursor = None
+        if self.has_next:
+            last = rows[-1]
+            # Работает и с моделями, и со строками .values()
+            if isinstance(last, dict):
+                self.next_cursor = self.encode_cursor(last[time_field], last[id_field])
+            else:
+                self.next_cursor = self.encode_cursor(getattr(last, time_field), getattr(last, id_field))
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # --------------------------------------------------
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    @staticmethod
+    def encode_cursor(updated_at: datetime, pk) -> str:
+        raw = f"{updated_at.isoformat()}|{pk}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def parse_cursor(encoded: str) -> tuple[datetime, int]:
+        """Обратное к encode_cursor; ValueError при битом курсоре"""
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+        updated_at, pk = raw.split("|", 1)
+        return datetime.fromisoformat(updated_at), int(pk)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            return self.parse_cursor(encoded)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
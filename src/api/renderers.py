@@ -0,0 +1,79 @@
+"""
+Быстрые рендереры/парсеры для API (опциональные зависимости: pip install ".[fast]").
+Семантика вывода совпадает с DRF JSONRenderer: всё, что orjson/msgpack не умеют сами
+(datetime, Decimal, lazy-строки gettext_lazy, QuerySet...), проходит через тот же
+rest_framework.utils.encoders.JSONEncoder.default.
+Без orjson ORJSONRenderer/ORJSONParser работают как стандартные JSONRenderer/JSONParser.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - зависит от окружения
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - зависит от окружения
+    msgpack = None
+
+
+# Возвращает строку/число/список — дальше их кодирует orjson/msgpack
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    # datetime отдаём DRF-кодировщику: он пишет "Z" вместо "+00:00", как и стандартный рендерер
+    ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        options = self.ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=options)
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackRenderer(BaseRenderer):
+    """application/msgpack по заголовку Accept (или ?format=msgpack)"""
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError, ValueError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -1,6 +1,14 @@
 from src.api.serializers.auth import RegisterSerializer, StudentActivationSerializer
-from src.api.serializers.learning import LearningUnitSerializer, UserVerbProgressSerializer
+from src.api.serializers.learning import (
+    LearningUnitSerializer,
+    UserVerbProgressSerializer,
+    parse_sparse_params,
+    validate_sparse_params,
+    verb_progress_values,
+    build_verb_progress_row,
+)
 from src.api.serializers.user import UserShortSerializer, UserProfileSerializer
+from src.api.serializers.training import BatchAnswerSerializer
 
 
 __all__ = [
@@ -8,6 +16,11 @@ __all__ = [
     'StudentActivationSerializer',
     'LearningUnitSerializer',
     'UserVerbProgressSerializer',
+    'parse_sparse_params',
+    'validate_sparse_params',
+    'verb_progress_values',
+    'build_verb_progress_row',
     'UserShortSerializer',
     'UserProfileSerializer',
+    'BatchAnswerSerializer',
 ]
\ No newline at end of file
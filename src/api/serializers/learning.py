@@ -1,20 +1,72 @@
+from typing import Dict, Iterable, Optional, Set, Tuple
+
 from rest_framework import serializers
 from src.personal_forms.models import LearningUnit, UserVerbProgress, Verb
 
 
+def parse_sparse_params(request) -> Tuple[Optional[Set[str]], Set[str]]:
+    """
+    ?fields=id,title — только эти поля (None — все), ?expand=verbs — вложенные связи
+    в дополнение к ?fields=.
+    """
+    if request is None:
+        return None, set()
+
+    def split(name):
+        return {part.strip() for part in request.query_params.get(name, "").split(",") if part.strip()}
+
+    fields = split("fields")
+    return (fields or None), split("expand")
+
+
+def validate_sparse_params(fields: Optional[Set[str]], expand: Set[str], allowed: Iterable[str],
+                           expandable: Iterable[str] = ()) -> None:
+    """Неизвестные имена в ?fields= / ?expand= — 400, а не молча пустые строки"""
+    errors = {}
+    unknown = (fields or set()) - set(allowed)
+    if unknown:
+        errors["fields"] = f"Unknown field(s): {', '.join(sorted(unknown))}"
+    unknown = expand - set(expandable)
+    if unknown:
+        errors["expand"] = f"Unknown field(s): {', '.join(sorted(unknown))}"
+    if errors:
+        raise serializers.ValidationError(errors)
+
+
+class SparseFieldsMixin:
+    """
+    Поддержка ?fields= / ?expand= для ModelSerializer.
+    Без параметров — полное представление. С ?fields= остаются только перечисленные поля;
+    EXPANDABLE — тяжёлые вложенные поля, которые можно добавить к ?fields= через ?expand=.
+    """
+    EXPANDABLE: Tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, expand = parse_sparse_params(self.context.get("request"))
+        validate_sparse_params(fields, expand, self.fields, self.EXPANDABLE)
+
+        if fields:
+            for name in list(self.fields):
+                if name not in fields and name not in expand:
+                    self.fields.pop(name)
+
+
 class VerbSerializer(serializers.ModelSerializer):
     class Meta:
         model = Verb
         fields = ["id", "infinitive", "verb_type", "is_trennbare", "reflexivitaet"]
 
-class LearningUnitSerializer(serializers.ModelSerializer):
+class LearningUnitSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    EXPANDABLE = ("verbs",)
+
     verbs = VerbSerializer(many=True, read_only=True)
 
     class Meta:
         model = LearningUnit
-        fields = ["id", "title", "level", "skill_type", "order", "verbs"]
+        fields = ["id", "title", "level", "skill_type", "order", "verb_group", "verbs"]
 
-class UserVerbProgressSerializer(serializers.ModelSerializer):
+class UserVerbProgressSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     verb = VerbSerializer(read_only=True)
 
     class Meta:
@@ -29,4 +81,44 @@ class UserVerbProgressSerializer(serializers.ModelSerializer):
             "streak",
             "mastered",
             "last_answer_at",
-        ]
\ No newline at end of file
+            "updated_at",
+        ]
+
+
+# --------------------------------------------------
+# Dict-билдеры для списков: .values() вместо ModelSerializer, тот же формат вывода
+
+_datetime_field = serializers.DateTimeField()
+
+VERB_PROGRESS_VERB_COLUMNS = {name: f"verb__{name}" for name in VerbSerializer.Meta.fields}
+
+
+def verb_progress_values(queryset, fields: Optional[Iterable[str]] = None):
+    """
+    queryset UserVerbProgress -> .values() только с нужными колонками.
+    updated_at и id выбираются всегда: по ним идёт keyset-пагинация.
+    """
+    wanted = set(fields or UserVerbProgressSerializer.Meta.fields)
+    columns = {"id", "updated_at"}
+    for name in wanted & set(UserVerbProgressSerializer.Meta.fields):
+        if name == "verb":
+            columns.update(VERB_PROGRESS_VERB_COLUMNS.values())
+        else:
+            columns.add(name)
+    return queryset.values(*sorted(columns))
+
+
+def build_verb_progress_row(row: Dict, fields: Optional[Iterable[str]] = None) -> Dict:
+    """Строка из verb_progress_values -> словарь в формате UserVerbProgressSerializer"""
+    wanted = set(fields or UserVerbProgressSerializer.Meta.fields)
+    result = {}
+    for name in UserVerbProgressSerializer.Meta.fields:
+        if name not in wanted:
+            continue
+        if name == "verb":
+            result["verb"] = {key: row[column] for key, column in VERB_PROGRESS_VERB_COLUMNS.items()}
+        elif name in ("last_answer_at", "updated_at"):
+            result[name] = _datetime_field.to_representation(row[name]) if row[name] else None
+        else:
+            result[name] = row[name]
+    return result
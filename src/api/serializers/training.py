@@ -0,0 +1,36 @@
+from rest_framework import serializers
+
+from src.common.choices import Pronoun, SkillType
+
+
+class BatchAnswerItemSerializer(serializers.Serializer):
+    """
+    Один ответ из офлайн-сессии: либо card_id (выданный next-card),
+    либо атом (verb_id + skill_type + pronoun) из офлайн-пакета юнита.
+    """
+    card_id = serializers.CharField(required=False)
+    unit_id = serializers.UUIDField(required=False)
+    verb_id = serializers.IntegerField(required=False)
+    skill_type = serializers.ChoiceField(choices=SkillType.choices, required=False)
+    pronoun = serializers.ChoiceField(choices=Pronoun.choices, required=False, allow_null=True)
+    answer = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    answered_at = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if attrs.get("card_id"):
+            return attrs
+        if not attrs.get("verb_id") or not attrs.get("skill_type"):
+            raise serializers.ValidationError("card_id or verb_id + skill_type required")
+        if attrs["skill_type"] != SkillType.TRANSLATION and not attrs.get("pronoun"):
+            raise serializers.ValidationError("pronoun required for conjugation skills")
+        return attrs
+
+
+class BatchAnswerSerializer(serializers.Serializer):
+    MAX_ITEMS = 500
+
+    answers = serializers.ListField(
+        child=BatchAnswerItemSerializer(),
+        allow_empty=False,
+        max_length=MAX_ITEMS,
+    )
@@ -1,10 +1,21 @@
+import json
+import unittest
+import uuid
+from decimal import Decimal
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
 from django.contrib.auth.models import Group
 from rest_framework.test import APITestCase
 from rest_framework import status
 
+from src.api import renderers
 from src.users.models import StudentInvitation
-from src.personal_forms.models import LearningUnit, Verb, VerbTranslation, VerbForm, UserVerbProgress
+from src.personal_forms.models import Course, LearningUnit, Verb, VerbGroup, VerbTranslation, VerbForm, UserVerbProgress
 from src.common.choices import CEFRLevel, SkillType, LanguageCode, Pronoun, Tense, VerbType, Reflexiv
 
 User = get_user_model()
@@ -143,11 +154,11 @@ class ProgressTests(BaseApiTest):
         )
         self.login(self.student)
         res_student = self.client.get('/api/verb-progress/')
-        self.assertEqual(len(res_student.data), 1)
+        self.assertEqual(len(res_student.data['results']), 1)
 
         self.login(self.teacher)
         res_teacher = self.client.get(f'/api/verb-progress/?student_id={self.student.id}')
-        self.assertEqual(len(res_teacher.data), 1)
+        self.assertEqual(len(res_teacher.data['results']), 1)
 
 
 class TrainingAnswerTests(BaseApiTest):
@@ -214,4 +225,359 @@ class TrainingAnswerTests(BaseApiTest):
     def test_answer_missing_data(self):
         # Проверка валидации: пустой запрос
         response = self.client.post('/api/training/answer/', {})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+class VerbProgressApiTest(APITestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username='paging_student', email='paging@test.com', password='password123'
+        )
+        for i in range(5):
+            verb = Verb.objects.create(
+                infinitive=f"verb{i}",
+                level=(CEFRLevel.A1 if i % 2 else CEFRLevel.B1).value,
+                verb_type=VerbType.REGULAR.value,
+                reflexivitaet=Reflexiv.NREFL.value,
+            )
+            UserVerbProgress.objects.create(
+                user=self.student, verb=verb, skill_type=SkillType.TRANSLATION.value, mastered=i == 0
+            )
+        self.client.force_authenticate(user=self.student)
+
+
+class VerbProgressPaginationTests(VerbProgressApiTest):
+    def test_keyset_pages_cover_all_rows_once(self):
+        seen = []
+        url = '/api/verb-progress/?page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(sorted(seen), sorted(UserVerbProgress.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_filters(self):
+        response = self.client.get('/api/verb-progress/', {'mastered': 'true'})
+        self.assertEqual([r['verb']['infinitive'] for r in response.data['results']], ['verb0'])
+
+        response = self.client.get('/api/verb-progress/', {'level': CEFRLevel.A1.value})
+        self.assertEqual(len(response.data['results']), 2)
+
+        response = self.client.get('/api/verb-progress/', {'skill_type': 'unknown'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_values_builder_matches_serializer(self):
+        from src.api.serializers import UserVerbProgressSerializer
+
+        response = self.client.get('/api/verb-progress/')
+        expected = UserVerbProgressSerializer(
+            UserVerbProgress.objects.filter(user=self.student).order_by('updated_at', 'id'), many=True
+        ).data
+        self.assertEqual(response.data['results'], expected)
+
+    def test_sparse_fields(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/verb-progress/', {'fields': 'id,streak'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'streak'})
+
+    def test_unknown_sparse_field(self):
+        response = self.client.get('/api/verb-progress/', {'fields': 'id,streek'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/verb-progress/', {'cursor': 'broken'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class LearningUnitApiTest(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username='etag_teacher', email='etag_teacher@test.com', password='password123', role='teacher'
+        )
+        self.student = User.objects.create_user(
+            username='etag_student', email='etag_student@test.com', password='password123'
+        )
+        self.verb = Verb.objects.create(
+            infinitive="lernen", verb_type=VerbType.REGULAR.value, reflexivitaet=Reflexiv.NREFL.value
+        )
+        group = VerbGroup.objects.create(title="Basis", author=self.teacher)
+        group.verbs.add(self.verb)
+        course = Course.objects.create(title="Kurs", author=self.teacher)
+        self.unit = LearningUnit.objects.create(
+            course=course, title="Einheit", order=1, level=CEFRLevel.A1.value,
+            skill_type=SkillType.TRANSLATION.value, verb_group=group,
+        )
+        self.client.force_authenticate(user=self.student)
+
+
+class LearningUnitConditionalGetTests(LearningUnitApiTest):
+    def test_list_returns_304_until_progress_changes(self):
+        first = self.client.get('/api/learning-units/')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first['ETag']
+
+        cached = self.client.get('/api/learning-units/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        UserVerbProgress.objects.create(
+            user=self.student, verb=self.verb, skill_type=SkillType.TRANSLATION.value
+        )
+        changed = self.client.get('/api/learning-units/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], etag)
+
+    def test_progress_etag_changes_with_catalog(self):
+        url = f'/api/learning-units/{self.unit.id}/progress/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.unit.title = "Neu"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.unit.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+
+class LearningUnitExpandTests(LearningUnitApiTest):
+    def test_full_by_default_and_sparse_on_request(self):
+        url = f'/api/learning-units/{self.unit.id}/'
+        # Клиенты без параметров получают прежнее представление, вместе с verbs
+        self.assertEqual(self.client.get(url).data['verbs'][0]['infinitive'], "lernen")
+
+        self.assertEqual(set(self.client.get(url, {'fields': 'id,title'}).data), {'id', 'title'})
+        data = self.client.get(url, {'expand': 'verbs', 'fields': 'id'}).data
+        self.assertEqual(set(data), {'id', 'verbs'})
+        self.assertEqual(data['verbs'][0]['infinitive'], "lernen")
+
+    def test_unknown_fields_rejected(self):
+        url = f'/api/learning-units/{self.unit.id}/'
+        self.assertEqual(self.client.get(url, {'fields': 'id,nope'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'expand': 'nope'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LearningUnitPackTests(LearningUnitApiTest):
+    def test_pack_is_gzipped_and_content_addressed(self):
+        import gzip
+        import json
+
+        VerbTranslation.objects.create(verb=self.verb, language_code=LanguageCode.RU.value, translation="учить")
+        url = f'/api/learning-units/{self.unit.id}/pack/?lang=ru'
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        payload = json.loads(gzip.decompress(response.content))
+        self.assertEqual(payload['verbs'][0]['translation'], "учить")
+
+        etag = response['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Правка глагола сбрасывает пакет, новый ETag
+        VerbForm.objects.create(verb=self.verb, tense=Tense.PRAESENS.value, pronoun=Pronoun.ICH.value, form="lerne")
+        plain = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(plain.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(plain.content)['verbs'][0]['forms'], {Tense.PRAESENS.value: {Pronoun.ICH.value: "lerne"}})
+
+    def test_invalid_language(self):
+        response = self.client.get(f'/api/learning-units/{self.unit.id}/pack/?lang=xx')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class BatchAnswerTests(LearningUnitApiTest):
+    def test_answers_applied_in_order_with_streak(self):
+        VerbTranslation.objects.create(verb=self.verb, language_code=LanguageCode.RU.value, translation="учить")
+        self.student.language = LanguageCode.RU.value
+        self.student.save()
+
+        atom = {'verb_id': self.verb.id, 'skill_type': SkillType.TRANSLATION.value, 'unit_id': str(self.unit.id)}
+        answers = [
+            {**atom, 'answer': 'учить'},
+            {**atom, 'answer': 'учить'},
+            {**atom, 'answer': 'неверно'},
+            {**atom, 'answer': 'учить'},
+            {'card_id': 'card:expired', 'answer': 'x'},
+        ]
+        response = self.client.post('/api/training/answers/batch/', {'answers': answers}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data['results']
+        self.assertEqual([r.get('streak') for r in results[:4]], [1, 2, 0, 1])
+        self.assertEqual(results[4]['status'], 'error')
+
+        progress = UserVerbProgress.objects.get(user=self.student, verb=self.verb)
+        self.assertEqual((progress.correct_count, progress.wrong_count, progress.streak), (3, 1, 1))
+
+    def test_invalid_payload(self):
+        response = self.client.post('/api/training/answers/batch/', {'answers': [{'answer': 'x'}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LearningUnitResponseCacheTests(LearningUnitApiTest):
+    def test_stats_cached_until_answer_recorded(self):
+        from src.personal_forms.services import ProgressService
+
+        self.assertEqual(self.client.get('/api/learning-units/stats/').data['total_correct'], 0)
+
+        progress = UserVerbProgress.objects.create(
+            user=self.student, verb=self.verb, skill_type=SkillType.TRANSLATION.value
+        )
+        UserVerbProgress.objects.filter(pk=progress.pk).update(correct_count=3)
+        # Прямой UPDATE мимо сервиса версию не меняет — отдаётся закешированный ответ
+        self.assertEqual(self.client.get('/api/learning-units/stats/').data['total_correct'], 0)
+
+        progress.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            ProgressService().record_answer(progress=progress, is_correct=True, unit_id=self.unit.id)
+        self.assertEqual(self.client.get('/api/learning-units/stats/').data['total_correct'], 4)
+
+    def test_stats_invalidated_by_direct_save(self):
+        self.assertEqual(self.client.get('/api/learning-units/stats/').data['total_correct'], 0)
+
+        # Правка через ORM (админка) мимо ProgressService
+        with self.captureOnCommitCallbacks(execute=True):
+            UserVerbProgress.objects.create(
+                user=self.student, verb=self.verb, skill_type=SkillType.TRANSLATION.value, correct_count=2
+            )
+        self.assertEqual(self.client.get('/api/learning-units/stats/').data['total_correct'], 2)
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        from rest_framework.authtoken.models import Token
+
+        self.user = User.objects.create_user(
+            username='token_user', email='token@test.com', password='password123'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_token_lookup_is_cached(self):
+        self.assertEqual(self.client.get('/api/verb-progress/').status_code, status.HTTP_200_OK)
+        # Второй запрос: ни одного запроса к authtoken_token / users_user
+        with self.assertNumQueries(1):  # только выборка прогресса
+            self.assertEqual(self.client.get('/api/verb-progress/').status_code, status.HTTP_200_OK)
+
+    def test_logout_and_deactivation_invalidate_cache(self):
+        self.client.get('/api/verb-progress/')
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/verb-progress/').status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.user.is_active = True
+        self.user.save()
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get('/api/verb-progress/').status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class VerbProgressChangesTests(VerbProgressApiTest):
+    def test_delta_sync_returns_only_changes_and_tombstones(self):
+        first = self.client.get('/api/verb-progress/changes/')
+        self.assertEqual(len(first.data['changes']), 5)
+        self.assertFalse(first.data['has_more'])
+
+        # Курсор отстаёт на SYNC_LAG — сдвигаем «старые» строки в прошлое, как после реальной паузы
+        from datetime import timedelta
+        from django.utils import timezone
+        UserVerbProgress.objects.update(updated_at=timezone.now() - timedelta(minutes=5))
+        cursor = self.client.get('/api/verb-progress/changes/').data['cursor']
+
+        changed = UserVerbProgress.objects.get(verb__infinitive='verb1')
+        changed.streak = 2
+        changed.save()
+        removed = UserVerbProgress.objects.get(verb__infinitive='verb2')
+        removed_id = removed.id
+        removed.delete()
+
+        delta = self.client.get('/api/verb-progress/changes/', {'since': cursor})
+        self.assertEqual([r['id'] for r in delta.data['changes']], [changed.id])
+        self.assertEqual([r['id'] for r in delta.data['deleted']], [removed_id])
+
+    def test_user_deletion_leaves_no_tombstones(self):
+        from src.personal_forms.models import ProgressTombstone
+
+        self.student.delete()
+        self.assertFalse(ProgressTombstone.objects.exists())
+
+    def test_changes_paginate_with_has_more(self):
+        response = self.client.get('/api/verb-progress/changes/', {'page_size': 3})
+        self.assertTrue(response.data['has_more'])
+        rest = self.client.get('/api/verb-progress/changes/', {'since': response.data['cursor']})
+        self.assertEqual(len(response.data['changes']) + len(rest.data['changes']), 5)
+
+
+class RendererTests(SimpleTestCase):
+    payload = {
+        "id": uuid.uuid4(),
+        "at": timezone.now(),
+        "label": _("Übersetzung"),
+        "amount": Decimal("1.50"),
+        "items": [{"streak": 3, "mastered": True, "pronoun": None}],
+    }
+
+    @unittest.skipUnless(renderers.orjson, "orjson is not installed")
+    def test_orjson_output_matches_drf(self):
+        self.assertEqual(renderers.ORJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+
+    @unittest.skipUnless(renderers.msgpack, "msgpack is not installed")
+    def test_msgpack_round_trip_matches_json(self):
+        packed = renderers.MessagePackRenderer().render(self.payload)
+        self.assertEqual(
+            renderers.msgpack.unpackb(packed, raw=False),
+            json.loads(JSONRenderer().render(self.payload)),
+        )
+
+
+@override_settings(
+    THROTTLE_BUCKETS={
+        'training-answer': {'user': '2/min', 'ip': '100/min'},
+        'training-next-card': {'user': '3/min', 'ip': '100/min'},
+    },
+    THROTTLE_URL_SCOPES={'submit-answer': 'training-answer'},
+)
+class TokenBucketThrottleTests(LearningUnitApiTest):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_api_answer_returns_429_with_retry_after(self):
+        for _i in range(2):
+            response = self.client.post('/api/training/answer/', {'card_id': 'card:expired', 'answer': 'x'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post('/api/training/answer/', {'card_id': 'card:expired', 'answer': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '30')  # 1 жетон при 2/min
+
+    def test_api_next_card_has_own_bucket(self):
+        params = {'learning_unit_id': str(self.unit.id)}
+        for _i in range(3):
+            response = self.client.get('/api/training/next-card/', params)
+            self.assertNotEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.get('/api/training/next-card/', params)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '20')  # 1 жетон при 3/min
+
+        # Ведро ответов от этого не пустеет
+        response = self.client.post('/api/training/answer/', {'card_id': 'card:expired', 'answer': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ip_bucket_ignores_spoofed_forwarded_for(self):
+        from src.api.throttling import TokenBucketThrottle
+
+        request = RequestFactory().get('/', HTTP_X_FORWARDED_FOR='1.2.3.4, 10.0.0.7', REMOTE_ADDR='172.18.0.5')
+        # Берётся адрес, дописанный nginx, а не подставленный клиентом
+        self.assertEqual(TokenBucketThrottle().get_ident(request), '10.0.0.7')
+
+    def test_htmx_submit_answer_shares_user_bucket(self):
+        from django.urls import reverse
+
+        self.client.force_login(self.student)
+        url = reverse('submit-answer')
+        data = {'card_id': 'card:expired', 'answer': 'x', 'unit_id': str(self.unit.id)}
+        self.assertEqual(self.client.post(url, data).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.post('/api/training/answer/', data).status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
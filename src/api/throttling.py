@@ -0,0 +1,24 @@
+from rest_framework.throttling import BaseThrottle
+
+from src.common.rate_limit import limiter
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket (src/common/rate_limit.py) по scope из settings.THROTTLE_BUCKETS.
+    Scope берётся из view.throttle_scopes[action], иначе из view.throttle_scope;
+    view без scope не ограничиваются. Ответ 429 с Retry-After собирает сам DRF из wait().
+    """
+
+    def allow_request(self, request, view):
+        scopes = getattr(view, "throttle_scopes", {})
+        scope = scopes.get(getattr(view, "action", None)) or getattr(view, "throttle_scope", None)
+        user = getattr(request, "user", None)
+        user_id = user.pk if user and user.is_authenticated else None
+
+        result = limiter.check(scope, user_id=user_id, ip=self.get_ident(request))
+        self.retry_after = result.retry_after
+        return result.allowed
+
+    def wait(self):
+        return self.retry_after
@@ -8,7 +8,8 @@ from src.api.views import (
     TrainingViewSet,
     UserProfileViewSet,
     TeacherViewSet,
-    InviteViewSet
+    InviteViewSet,
+    VerbViewSet,
 )
 
 
@@ -20,6 +21,7 @@ router.register(r'training', TrainingViewSet, basename='training')
 router.register(r'profile', UserProfileViewSet, basename='profile')
 router.register(r'invites', InviteViewSet, basename='invites')
 router.register(r'teacher', TeacherViewSet, basename='teacher')
+router.register(r'verbs', VerbViewSet, basename='verbs')
 
 urlpatterns = [
     path('', include(router.urls)),
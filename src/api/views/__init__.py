@@ -3,5 +3,6 @@ from src.api.views.auth import AuthViewSet
 from src.api.views.training import TrainingViewSet
 from src.api.views.user import UserProfileViewSet, TeacherViewSet
 from src.api.views.invitation import InviteViewSet
+from src.api.views.verbs import VerbViewSet
 
-__all__ = ["LearningUnitViewSet", "UserVerbProgressViewSet", "AuthViewSet", "TrainingViewSet", "UserProfileViewSet", "InviteViewSet", "TeacherViewSet"]
\ No newline at end of file
+__all__ = ["LearningUnitViewSet", "UserVerbProgressViewSet", "AuthViewSet", "TrainingViewSet", "UserProfileViewSet", "InviteViewSet", "TeacherViewSet", "VerbViewSet"]
\ No newline at end of file
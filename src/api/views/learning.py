@@ -1,21 +1,38 @@
+import gzip
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 
-from src.api.mixins import StudentAccessMixin
+from src.api.mixins import ConditionalResponseMixin, StudentAccessMixin, VersionedResponseCacheMixin
+from src.api.pagination import KeysetPagination
+from src.common.choices import CEFRLevel, LanguageCode, SkillType
 from src.personal_forms.models import LearningUnit, UserVerbProgress
 from src.api.serializers import (
     LearningUnitSerializer,
     UserVerbProgressSerializer,
+    parse_sparse_params,
+    validate_sparse_params,
+    verb_progress_values,
+    build_verb_progress_row,
 )
 
-from src.personal_forms.services import LearningUnitProgressService
+from src.personal_forms.services import LearningUnitProgressService, ProgressSyncService, UnitPackService
 
 
 User = get_user_model()
 
-class LearningUnitViewSet(StudentAccessMixin, viewsets.ReadOnlyModelViewSet):
+class LearningUnitViewSet(
+    ConditionalResponseMixin,
+    VersionedResponseCacheMixin,
+    StudentAccessMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     queryset = LearningUnit.objects.all().order_by("order")
     serializer_class = LearningUnitSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -30,27 +47,144 @@ class LearningUnitViewSet(StudentAccessMixin, viewsets.ReadOnlyModelViewSet):
         service = self._get_progress_service()
         #  Используем метод из Mixin! Он сам сделает try/except и выкинет 403 если надо
         target_user = self.get_authorized_target_user()
-        progress_data = service.build_progress(user=target_user, learning_unit=unit)
-        return Response(progress_data)
+        etag = self.build_etag(target_user, "progress", unit.pk)
+        return self.conditional_response(
+            etag, lambda: service.build_progress(user=target_user, learning_unit=unit)
+        )
+
+    @action(detail=True, methods=["get"])
+    def pack(self, request, pk=None):
+        """
+        Офлайн-пакет юнита (?lang=ru): готовый gzip из кеша, ETag — хеш содержимого.
+        Пакет не зависит от пользователя, поэтому одинаковый ETag у всех учеников.
+        """
+        unit = self.get_object()
+        language = request.query_params.get("lang")
+        if not language:
+            language = request.user.language
+            if language not in LanguageCode.get_available_values():
+                language = LanguageCode.EN.value
+        if language not in LanguageCode.get_available_values():
+            raise ValidationError({"lang": f"Allowed: {', '.join(LanguageCode.get_available_values())}"})
+
+        pack = UnitPackService().get_pack(unit, language)
+        etag = quote_etag(pack.etag)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+                response = HttpResponse(pack.body, content_type="application/json")
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(gzip.decompress(pack.body), content_type="application/json")
+            response["Content-Length"] = len(response.content)
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Глобальная статистика текущего пользователя"""
         service = LearningUnitProgressService()
-        return Response(service.get_global_stats(request.user))
+        data = self.get_cached_data(request.user, "stats", lambda: service.get_global_stats(request.user))
+        return Response(data)
 
     def list(self, request, *args, **kwargs):
         # Метод пришел из Mixin!
         target_user = self.get_authorized_target_user()
         service = self._get_progress_service()
-        data = service.get_units_overview(target_user, self.get_queryset())
-        return Response(data)
+        etag = self.build_etag(target_user, "list")
+        return self.conditional_response(
+            etag,
+            lambda: self.get_cached_data(
+                target_user, "units", lambda: service.get_units_overview(target_user, self.get_queryset())
+            ),
+        )
 
 class UserVerbProgressViewSet(StudentAccessMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Прогресс по глаголам. Фильтры: ?skill_type=, ?mastered=true|false, ?level=A1
+    (skill_type и mastered попадают в индексы (user, skill_type) / (user, mastered)).
+    ?fields=id,streak — только эти поля; список строится из .values() без ModelSerializer.
+    """
     serializer_class = UserVerbProgressSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         # Метод пришел из Mixin!
         target_user = self.get_authorized_target_user()
-        return UserVerbProgress.objects.filter(user=target_user)
\ No newline at end of file
+        queryset = UserVerbProgress.objects.filter(user=target_user).select_related("verb")
+        return self._apply_filters(queryset)
+
+    def list(self, request, *args, **kwargs):
+        fields, expand = parse_sparse_params(request)
+        validate_sparse_params(fields, expand, UserVerbProgressSerializer.Meta.fields)
+        rows = verb_progress_values(self.filter_queryset(self.get_queryset()), fields)
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response([build_verb_progress_row(row, fields) for row in page])
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """
+        Дельта-синхронизация: ?since=<cursor из прошлого ответа>.
+        Без since — всё с начала (порциями, пока has_more). reset=true — локальную копию нужно выбросить
+        и синхронизироваться заново без since.
+        """
+        target_user = self.get_authorized_target_user()
+
+        since = None
+        if request.query_params.get("since"):
+            try:
+                since = KeysetPagination.parse_cursor(request.query_params["since"])
+            except ValueError:
+                raise ValidationError({"since": "Invalid cursor"})
+
+        result = ProgressSyncService().get_changes(
+            user=target_user,
+            since=since,
+            limit=KeysetPagination().get_page_size(request),
+        )
+        cursor = result["cursor"]
+        return Response({
+            "reset": result["reset"],
+            "changes": self.get_serializer(result["changes"], many=True).data,
+            "deleted": [
+                {
+                    "id": row["progress_id"],
+                    "verb_id": row["verb_id"],
+                    "skill_type": row["skill_type"],
+                    "pronoun": row["pronoun"],
+                    "deleted_at": row["deleted_at"],
+                }
+                for row in result["deleted"]
+            ],
+            "cursor": KeysetPagination.encode_cursor(*cursor) if cursor else None,
+            "has_more": result["has_more"],
+        })
+
+    def _apply_filters(self, queryset):
+        params = self.request.query_params
+
+        skill_type = params.get("skill_type")
+        if skill_type:
+            if skill_type not in SkillType.values:
+                raise ValidationError({"skill_type": f"Allowed: {', '.join(SkillType.values)}"})
+            queryset = queryset.filter(skill_type=skill_type)
+
+        mastered = params.get("mastered")
+        if mastered:
+            if mastered.lower() not in ("true", "false", "1", "0"):
+                raise ValidationError({"mastered": "Expected true or false"})
+            queryset = queryset.filter(mastered=mastered.lower() in ("true", "1"))
+
+        level = params.get("level")
+        if level:
+            allowed_levels = [l.value for l in CEFRLevel]
+            if level not in allowed_levels:
+                raise ValidationError({"level": f"Allowed: {', '.join(allowed_levels)}"})
+            queryset = queryset.filter(verb__level=level)
+
+        return queryset
\ No newline at end of file
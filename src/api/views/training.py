@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from dataclasses import asdict
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
+from src.api.serializers import BatchAnswerSerializer
 from src.personal_forms.models import LearningUnit
 from src.personal_forms.services import TrainingService
 from functools import cached_property
@@ -11,6 +12,12 @@ from functools import cached_property
 
 class TrainingViewSet(viewsets.ViewSet):
     permission_classes = [permissions.IsAuthenticated]
+    # TokenBucketThrottle: вёдра из settings.THROTTLE_BUCKETS
+    throttle_scopes = {
+        "next_card": "training-next-card",
+        "answer": "training-answer",
+        "answers_batch": "training-batch",
+    }
 
     @cached_property
     def training_service(self):
@@ -58,3 +65,18 @@ class TrainingViewSet(viewsets.ViewSet):
             # Например, "Card expired"
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=["post"], url_path="answers/batch")
+    def answers_batch(self, request):
+        """
+        Офлайн-сессия одним запросом: {"answers": [{card_id | verb_id+skill_type+pronoun, answer, answered_at}, ...]}.
+        Ответы применяются по порядку в одной транзакции; результат — по элементу на каждый ответ.
+        """
+        serializer = BatchAnswerSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = self.training_service.submit_answers_batch(
+            user=request.user,
+            items=serializer.validated_data["answers"],
+            language=request.user.language,
+        )
+        return Response({"results": results})
@@ -0,0 +1,21 @@
+from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from src.personal_forms.services import FormLookupService
+
+
+class VerbViewSet(viewsets.ViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @action(detail=False, methods=["get"], url_path="lookup-form")
+    def lookup_form(self, request):
+        """
+        Обратный поиск формы: ?q=ging -> [{verb_id, infinitive, tense, pronoun, form}].
+        Регистр, умлауты (ae/oe/ue/ss) и ведущее местоимение ("du bist gegangen") не важны.
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "This parameter is required"})
+        return Response({"query": query, "results": FormLookupService().lookup(query)})
@@ -4,6 +4,14 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 
+def normalize_enum(value, enum_cls):
+    """Поля с default=Enum-член могли сохраниться как "VerbType.REGULAR" вместо "reg" """
+    for member in enum_cls:
+        if value in (member.value, str(member), member.name):
+            return member
+    return None
+
+
 class LanguageCode(Enum):
     EN = "en"
     RU = "ru"
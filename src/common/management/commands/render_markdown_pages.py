@@ -0,0 +1,33 @@
+# python manage.py render_markdown_pages
+# python manage.py render_markdown_pages --slug work-1c
+# рендерит markdown-страницы (settings.MARKDOWN_PAGES) в кеш при деплое (docker/entrypoint.sh)
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.common.markdown_pages import MarkdownPageService
+
+
+class Command(BaseCommand):
+    help = "Pre-render registered markdown pages into the cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--slug",
+            action="append",
+            default=[],
+            help="Page slug to render (repeatable, default: all).",
+        )
+
+    def handle(self, *args, **options):
+        service = MarkdownPageService()
+        registry = service.get_registry()
+        unknown = set(options["slug"]) - set(registry)
+        if unknown:
+            raise CommandError(f"Unknown page(s) {sorted(unknown)}. Registered: {sorted(registry)}")
+
+        slugs = options["slug"] or list(registry)
+        missing = service.prerender(slugs)
+        for slug in missing:
+            self.stderr.write(f"File not found for page '{slug}': {registry[slug]['path']}")
+
+        self.stdout.write(f"Pages rendered: {len(slugs) - len(missing)}/{len(slugs)}")
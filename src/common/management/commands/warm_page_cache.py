@@ -0,0 +1,45 @@
+# python manage.py warm_page_cache
+# прогревает полностраничный кеш анонимных страниц (PageCacheService) для всех языков:
+# страницы всегда рендерятся заново и перезаписывают записи кеша, даже если они уже есть
+# запускается при деплое после render_markdown_pages (docker/entrypoint.sh)
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import translation
+
+from src.common.page_cache import PageCacheService
+
+
+class Command(BaseCommand):
+    help = "Pre-render anonymous full-page cache for landing and legal pages."
+
+    URL_NAMES = ("index", "web-impressum", "web-privacy")
+
+    def handle(self, *args, **options):
+        if settings.RELEASE_VERSION == "dev" and not settings.DEBUG:
+            self.stderr.write(
+                "RELEASE_VERSION is not set: pages of all builds share one cache key "
+                "(docker build --build-arg RELEASE_VERSION=$(git rev-parse --short HEAD))"
+            )
+
+        service = PageCacheService()
+        factory = RequestFactory()
+        warmed = 0
+        for language, _name in settings.LANGUAGES:
+            with translation.override(language):
+                for url_name in self.URL_NAMES:
+                    path = reverse(url_name)
+                    request = factory.get(path)
+                    request.user = AnonymousUser()
+                    request.LANGUAGE_CODE = language
+                    match = resolve(path)
+                    response = service.refresh(request, match.func, *match.args, **match.kwargs)
+                    if response.status_code == 200:
+                        warmed += 1
+                    else:
+                        self.stderr.write(f"{path}: HTTP {response.status_code}")
+
+        self.stdout.write(f"Pages warmed: {warmed} (release {settings.RELEASE_VERSION})")
@@ -0,0 +1,84 @@
+"""
+Markdown-страницы сайта (/docs/<slug>/).
+Страницы регистрируются в settings.MARKDOWN_PAGES: slug -> {"path": ..., "title": ...}.
+Готовый HTML кешируется в памяти процесса и в Redis; ключ — путь + mtime + размер файла,
+поэтому правка файла сама инвалидирует кеш. На запрос — только stat(), без чтения и парсинга.
+При деплое страницы заранее рендерятся командой render_markdown_pages.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import markdown
+from django.conf import settings
+from django.core.cache import cache
+
+
+@dataclass(frozen=True)
+class MarkdownPage:
+    slug: str
+    title: str
+    html: str
+    toc: str
+
+
+class MarkdownPageService:
+    CACHE_KEY = "mdpage:{slug}:{fingerprint}"
+    CACHE_TTL = 30 * 24 * 60 * 60
+    EXTENSIONS = ["markdown.extensions.extra", "markdown.extensions.toc"]
+
+    # slug -> (fingerprint, page); общий для всех экземпляров в процессе
+    _memory: Dict[str, Tuple[str, MarkdownPage]] = {}
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def get_registry() -> Dict[str, Dict]:
+        return getattr(settings, "MARKDOWN_PAGES", {})
+
+    def get_page(self, slug: str) -> Optional[MarkdownPage]:
+        """None — slug не зарегистрирован или файла нет"""
+        entry = self.get_registry().get(slug)
+        if entry is None:
+            return None
+        fingerprint = self._fingerprint(Path(entry["path"]))
+        if fingerprint is None:
+            return None
+
+        cached = self._memory.get(slug)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        key = self.CACHE_KEY.format(slug=slug, fingerprint=fingerprint)
+        page = cache.get(key)
+        if page is None:
+            page = self._render(slug, entry)
+            cache.set(key, page, self.CACHE_TTL)
+        self._memory[slug] = (fingerprint, page)
+        return page
+
+    def prerender(self, slugs: Optional[Iterable[str]] = None) -> List[str]:
+        """Рендерит страницы в кеш; возвращает slug-и, для которых файл не найден"""
+        missing = []
+        for slug in slugs or self.get_registry():
+            if self.get_page(slug) is None:
+                missing.append(slug)
+        return missing
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[str]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        raw = f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _render(self, slug: str, entry: Dict) -> MarkdownPage:
+        md = markdown.Markdown(extensions=self.EXTENSIONS)
+        html = md.convert(Path(entry["path"]).read_text(encoding="utf-8"))
+        return MarkdownPage(slug=slug, title=str(entry.get("title", slug)), html=html, toc=md.toc)
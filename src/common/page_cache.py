@@ -0,0 +1,78 @@
+"""
+Полностраничный кеш для анонимных посетителей (лендинг, Impressum, Datenschutz).
+Ключ: RELEASE_VERSION + активный язык + путь. Новый релиз меняет RELEASE_VERSION — старые страницы
+просто перестают читаться; после деплоя warm_page_cache рендерит страницы заново и перезаписывает
+записи (refresh), так что и при неизменной версии старые страницы не переживают деплой.
+
+CSRF: страница рендерится с плейсхолдером вместо токена (форма переключения языка),
+при отдаче плейсхолдер заменяется на токен текущего запроса — одна замена строки, cookie ставит
+CsrfViewMiddleware как обычно.
+"""
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import get_language
+
+
+class PageCacheService:
+    CACHE_KEY = "page:{release}:{language}:{path}"
+    CACHE_TTL = 24 * 60 * 60
+    CSRF_PLACEHOLDER = "__page_cache_csrf_token__"
+    REFRESH_ATTR = "page_cache_refresh"
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def is_cacheable(request) -> bool:
+        """Только анонимный GET без параметров и без ожидающих flash-сообщений"""
+        return (
+            request.method == "GET"
+            and not request.GET
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+        )
+
+    def get(self, request):
+        if getattr(request, self.REFRESH_ATTR, False):
+            return None
+        cached = cache.get(self._key(request))
+        if cached is None:
+            return None
+        return self._build_response(request, *cached, hit=True)
+
+    def refresh(self, request, view, *args, **kwargs):
+        """Рендер view мимо кеша: store() перезапишет запись (прогрев при деплое)"""
+        setattr(request, self.REFRESH_ATTR, True)
+        return view(request, *args, **kwargs)
+
+    def store(self, request, response):
+        """Отрендеренный ответ (с плейсхолдером CSRF) -> в кеш; возвращает ответ с настоящим токеном"""
+        if hasattr(response, "render"):
+            response.render()
+        if response.status_code != 200:
+            return response
+        entry = (response.content.decode(response.charset), response["Content-Type"])
+        cache.set(self._key(request), entry, self.CACHE_TTL)
+        return self._build_response(request, *entry, hit=False)
+
+    # --------------------------------------------------
+
+    @classmethod
+    def _key(cls, request) -> str:
+        return cls.CACHE_KEY.format(
+            release=settings.RELEASE_VERSION,
+            language=get_language(),
+            path=request.path,
+        )
+
+    def _build_response(self, request, html, content_type, hit):
+        response = HttpResponse(html.replace(self.CSRF_PLACEHOLDER, get_token(request)), content_type=content_type)
+        # Язык определяется префиксом URL, но при его отсутствии — cookie / Accept-Language;
+        # для анонимных и вошедших пользователей ответы разные
+        patch_vary_headers(response, ("Cookie", "Accept-Language"))
+        response["X-Page-Cache"] = "hit" if hit else "miss"
+        return response
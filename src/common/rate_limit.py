@@ -0,0 +1,156 @@
+"""
+Token bucket для ограничения частоты запросов (DRF-throttle в src/api/throttling.py
+и middleware для HTMX-эндпоинтов в src/web/middleware.py).
+
+Настройки — settings.THROTTLE_BUCKETS, по scope эндпоинта:
+    "training-answer": {"user": "60/min", "ip": "600/min"}
+Ведро на пользователя и ведро на IP; ёмкость — число из rate (допустимый всплеск),
+пополнение — rate равномерно. Запрос проходит, только если жетон есть в обоих вёдрах.
+
+На Redis вся проверка (оба ведра) — один EVALSHA атомарного Lua-скрипта: без гонок между
+воркерами gunicorn и без лишних round-trip. Время берётся из Redis (TIME), а не из часов воркеров.
+Для других бэкендов кеша (LocMem в dev/тестах) — тот же алгоритм в процессе.
+При недоступном Redis запрос пропускается (fail open): ограничение частоты не должно ронять тренировку.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# KEYS — вёдра; ARGV[1] — стоимость запроса, затем пары (ёмкость, жетонов в секунду) на каждый ключ.
+# Возвращает {1|0, retry_after}; retry_after строкой — Redis обрезает дробные числа из Lua до целых.
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local levels = {}
+local wait = 0
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < cost then
+        wait = math.max(wait, (cost - tokens) / rate)
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local tokens = levels[i]
+    if wait == 0 then
+        tokens = tokens - cost
+    end
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+    -- Ведро удаляется, когда полностью наполнится: полное ведро = отсутствующее
+    redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+end
+
+if wait == 0 then
+    return {1, '0'}
+end
+return {0, tostring(wait)}
+"""
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@dataclass(frozen=True)
+class ThrottleResult:
+    allowed: bool
+    retry_after: float = 0.0  # секунд до появления жетона
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """'60/min' -> (ёмкость 60, 1.0 жетон в секунду); формат как у DRF: s/m/h/d по первой букве"""
+    num, period = rate.split("/")
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class TokenBucketLimiter:
+    """Проверка scope для пользователя и IP; один экземпляр на процесс (см. limiter ниже)"""
+
+    KEY = "throttle:{scope}:{kind}:{ident}"
+    KINDS = ("user", "ip")
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+        self._script = None
+        self._lock = threading.Lock()
+
+    def check(self, scope: Optional[str], user_id=None, ip: Optional[str] = None, cost: int = 1) -> ThrottleResult:
+        config = getattr(settings, "THROTTLE_BUCKETS", {}).get(scope) if scope else None
+        if not config:
+            return ThrottleResult(True)
+
+        buckets: List[Tuple[str, int, float]] = []
+        for kind, ident in zip(self.KINDS, (user_id, ip)):
+            if ident is None or not config.get(kind):
+                continue
+            capacity, rate = parse_rate(config[kind])
+            buckets.append((self.KEY.format(scope=scope, kind=kind, ident=ident), capacity, rate))
+        if not buckets:
+            return ThrottleResult(True)
+
+        if self._is_redis():
+            return self._check_redis(buckets, cost)
+        return self._check_local(buckets, cost)
+
+    # --------------------------------------------------
+
+    def _is_redis(self) -> bool:
+        return "django_redis" in settings.CACHES[self.alias]["BACKEND"]
+
+    def _check_redis(self, buckets, cost) -> ThrottleResult:
+        from django_redis import get_redis_connection
+        from redis.exceptions import RedisError
+
+        try:
+            if self._script is None:
+                # Script сам делает EVALSHA и при NOSCRIPT (рестарт Redis) повторяет через EVAL
+                self._script = get_redis_connection(self.alias).register_script(TOKEN_BUCKET_SCRIPT)
+            args = [cost]
+            for _key, capacity, rate in buckets:
+                args += [capacity, rate]
+            # Ключи с KEY_PREFIX кеша, как у остальных записей django-redis
+            keys = [caches[self.alias].make_key(key) for key, _c, _r in buckets]
+            allowed, retry_after = self._script(keys=keys, args=args)
+        except RedisError:
+            logger.warning("Rate limiter unavailable, request allowed", exc_info=True)
+            return ThrottleResult(True)
+        return ThrottleResult(bool(int(allowed)), float(retry_after))
+
+    def _check_local(self, buckets, cost) -> ThrottleResult:
+        """Тот же алгоритм поверх обычного кеша; атомарен только в пределах процесса"""
+        cache = caches[self.alias]
+        with self._lock:
+            now = time.monotonic()
+            levels: Dict[str, float] = {}
+            wait = 0.0
+            for key, capacity, rate in buckets:
+                tokens, ts = cache.get(key) or (capacity, now)
+                tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+                levels[key] = tokens
+                if tokens < cost:
+                    wait = max(wait, (cost - tokens) / rate)
+
+            for key, capacity, rate in buckets:
+                tokens = levels[key] - (cost if wait == 0 else 0)
+                cache.set(key, (tokens, now), timeout=int((capacity - tokens) / rate) + 1)
+        return ThrottleResult(wait == 0, wait)
+
+
+limiter = TokenBucketLimiter()
@@ -0,0 +1,176 @@
+"""
+Потоковая выгрузка таблиц (CSV / XLSX) для StreamingHttpResponse.
+Строки приходят итератором и уходят клиенту пачками: в памяти — только текущая пачка.
+XLSX пишется без сторонних библиотек: минимальная книга из одного листа (inline-строки,
+без sharedStrings/styles) в zip, который zipfile умеет писать в поток без seek.
+"""
+
+import csv
+import re
+import zipfile
+from datetime import date, datetime
+from typing import Iterable, Iterator, Sequence
+from xml.sax.saxutils import escape
+
+from django.http import StreamingHttpResponse
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+ROWS_PER_CHUNK = 500
+
+# Управляющие символы недопустимы в XML 1.0 — Excel откажется открывать файл
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+class _Echo:
+    """Псевдо-файл для csv.writer: writerow возвращает готовую строку"""
+
+    def write(self, value):
+        return value
+
+
+class _ChunkSink:
+    """Псевдо-файл для zipfile: без tell/seek, поэтому zip пишется потоково (data descriptor)"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _csv_value(value):
+    # "=HYPERLINK(...)" в имени ученика не должно стать формулой в Excel
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+def iter_csv(rows: Iterable[Sequence]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield "\ufeff"  # BOM: иначе Excel открывает UTF-8 как cp1252 и ломает умлауты
+    chunk = []
+    for row in rows:
+        chunk.append(writer.writerow([_csv_value(value) for value in row]))
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _column_letter(index: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell(ref: str, value) -> str:
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat(sep=" ", timespec="seconds") if isinstance(value, datetime) else value.isoformat()
+    text = escape(_XML_ILLEGAL.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _row(number: int, values: Sequence) -> str:
+    cells = "".join(_cell(f"{_column_letter(i)}{number}", value) for i, value in enumerate(values))
+    return f'<row r="{number}">{cells}</row>'
+
+
+def iter_xlsx(rows: Iterable[Sequence], sheet_name: str = "Sheet1") -> Iterator[bytes]:
+    # Имя листа: до 31 символа, без []:*?/\
+    sheet_name = re.sub(r"[\[\]:*?/\\]", " ", sheet_name).strip()[:31] or "Sheet1"
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as book:
+        book.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        book.writestr("_rels/.rels", _ROOT_RELS)
+        book.writestr("xl/workbook.xml", _WORKBOOK.format(name=escape(sheet_name, {'"': "&quot;"})))
+        book.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        yield sink.drain()
+
+        # force_zip64: размер листа заранее неизвестен
+        with book.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_SHEET_HEAD.encode())
+            for number, values in enumerate(rows, start=1):
+                sheet.write(_row(number, values).encode())
+                if number % ROWS_PER_CHUNK == 0:
+                    yield sink.drain()
+            sheet.write(_SHEET_TAIL.encode())
+    yield sink.drain()
+
+
+def streaming_table_response(rows: Iterable[Sequence], filename: str, export_format: str) -> StreamingHttpResponse:
+    """rows — итератор строк (первая — заголовок); filename без расширения"""
+    if export_format == "xlsx":
+        content = iter_xlsx(rows, sheet_name=filename)
+    else:
+        export_format = "csv"
+        content = iter_csv(rows)
+
+    response = StreamingHttpResponse(content, content_type=FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    response["Cache-Control"] = "private, no-store"
+    # nginx не копит ответ целиком в буфере, клиент получает данные сразу
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -10,9 +10,10 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.text import format_lazy
 from django.shortcuts import render
 
-from src.personal_forms.models import Verb, VerbForm, VerbTranslation, LearningUnit, Course
+from src.personal_forms.models import Verb, VerbForm, VerbTranslation, LearningUnit, Course, ImportCheckpoint
 from src.personal_forms.models.learning import LearningUnit as LearningUnitModel
 from src.common.choices import Tense, Pronoun, LanguageCode, CEFRLevel
+from src.personal_forms.services import CourseAccessService
 
 
 # Константы для единого порядка везде
@@ -461,11 +462,7 @@ class CourseAdmin(admin.ModelAdmin):
                 Q(author=request.user) | Q(visibility=Course.Visibility.PUBLIC)
             )
         # Студенты видят только доступные им курсы
-        return qs.filter(
-            Q(visibility=Course.Visibility.PUBLIC) |
-            Q(author=request.user) |
-            Q(assigned_students=request.user)
-        ).distinct()
+        return CourseAccessService().filter_accessible(qs, request.user)
 
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
@@ -499,3 +496,17 @@ class CourseAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):
         return request.user.is_teacher_admin()
+
+
+@admin.register(ImportCheckpoint)
+class ImportCheckpointAdmin(admin.ModelAdmin):
+    list_display = (
+        "file_path",
+        "offset",
+        "total_entries",
+        "completed",
+        "updated_at",
+    )
+    list_filter = ("completed",)
+    search_fields = ("file_path", "file_hash")
+    readonly_fields = ("file_hash", "file_size", "total_entries", "created_at", "updated_at")
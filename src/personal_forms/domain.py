@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.common.choices import Pronoun
 
@@ -29,4 +30,14 @@ class AnswerResult:
     correct: bool
     correct_answer: str
     mastered: bool
-    streak: int
\ No newline at end of file
+    streak: int
+
+@dataclass(frozen=True)
+class AnswerEvent:
+    """Один ответ для пакетной записи (ProgressService.record_answers_batch)"""
+    verb_id: int
+    skill_type: str
+    pronoun: str | None
+    is_correct: bool
+    answered_at: datetime
+    unit_id: str | None = None
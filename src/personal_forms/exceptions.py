@@ -1,2 +1,7 @@
 class AuthorizationError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class MorphologyError(ValueError):
+    """Глагол не подходит под правила генератора форм"""
+    pass
@@ -0,0 +1,97 @@
+# python manage.py benchmark_renderers
+# python manage.py benchmark_renderers --rows 20000 --repeat 20
+# сравнивает размер ответа и время кодирования: DRF JSONRenderer / ORJSONRenderer / MessagePackRenderer
+# payload повторяет форму ответов API: страница /api/verb-progress/, /changes/ (сырые datetime), список юнитов
+
+import gzip
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+
+from src.api import renderers
+from src.common.choices import Pronoun, SkillType
+
+
+class Command(BaseCommand):
+    help = "Benchmark payload size and encode time of the API renderers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000, help="Progress rows in the payload.")
+        parser.add_argument("--repeat", type=int, default=10, help="Encode runs per renderer.")
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        if rows < 1 or repeat < 1:
+            raise CommandError("--rows and --repeat must be positive integers")
+
+        payload = self._build_payload(rows)
+        candidates = [("drf-json", JSONRenderer())]
+        if renderers.orjson is not None:
+            candidates.append(("orjson", renderers.ORJSONRenderer()))
+        else:
+            self.stderr.write("orjson is not installed, skipping ORJSONRenderer")
+        if renderers.msgpack is not None:
+            candidates.append(("msgpack", renderers.MessagePackRenderer()))
+        else:
+            self.stderr.write("msgpack is not installed, skipping MessagePackRenderer")
+
+        baseline = None
+        self.stdout.write(f"{'renderer':<10} {'bytes':>12} {'gzip':>12} {'median ms':>10} {'speedup':>8}")
+        for name, renderer in candidates:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                body = renderer.render(payload)
+                timings.append(time.perf_counter() - started)
+
+            median_ms = statistics.median(timings) * 1000
+            baseline = baseline or median_ms
+            self.stdout.write(
+                f"{name:<10} {len(body):>12} {len(gzip.compress(body)):>12} "
+                f"{median_ms:>10.2f} {baseline / median_ms:>7.1f}x"
+            )
+
+    @staticmethod
+    def _build_payload(rows: int) -> dict:
+        now = timezone.now()
+        pronouns = list(Pronoun.values)
+        skills = list(SkillType.values)
+        progress = [
+            {
+                "id": i,
+                "verb": {
+                    "id": i % 700,
+                    "infinitive": f"verb{i % 700}",
+                    "verb_type": "reg",
+                    "is_trennbare": bool(i % 3),
+                    "reflexivitaet": "nrefl",
+                },
+                "skill_type": skills[i % len(skills)],
+                "pronoun": pronouns[i % len(pronouns)],
+                "correct_count": i % 17,
+                "wrong_count": i % 5,
+                "streak": i % 6,
+                "mastered": i % 6 == 5,
+                "last_answer_at": now - timedelta(minutes=i),  # сырые datetime, как в /changes/
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in range(rows)
+        ]
+        units = [
+            {
+                "id": uuid.uuid4(),
+                "title": f"Einheit {i}",
+                "level": "A1",
+                "skill_type": SkillType.TRANSLATION.label if i % 2 else _("Präsens"),  # lazy-строки
+                "percent": i % 100,
+                "completed": False,
+            }
+            for i in range(max(rows // 100, 1))
+        ]
+        return {"results": progress, "units": units, "next": None}
@@ -0,0 +1,31 @@
+# python manage.py build_form_index
+# python manage.py build_form_index --missing
+# пересобирает обратный индекс форм VerbFormLookup (FormLookupService)
+# правки через ORM обновляют индекс сигналами, import_verbs / generate_forms / fill_perfekt — сами для изменённых глаголов;
+# команда нужна для полной пересборки (например, после правок данных в обход ORM)
+# --missing — только глаголы без строк индекса (первичное заполнение при деплое)
+
+from django.core.management.base import BaseCommand
+
+from src.personal_forms.models import Verb
+from src.personal_forms.services import FormLookupService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the reverse conjugated-form lookup index."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only index verbs that have no lookup rows yet.",
+        )
+
+    def handle(self, *args, **options):
+        verb_ids = None
+        if options["missing"]:
+            verb_ids = list(Verb.objects.filter(form_lookups__isnull=True).values_list("pk", flat=True))
+
+        created = FormLookupService().rebuild_verbs(verb_ids)
+        scope = f"verbs={len(verb_ids)}" if verb_ids is not None else "all verbs"
+        self.stdout.write(f"Form index built: {scope}, rows={created}")
@@ -0,0 +1,38 @@
+# python manage.py build_unit_packs
+# python manage.py build_unit_packs --lang ru --lang uk
+# предварительно собирает офлайн-пакеты всех юнитов (UnitPackService)
+# запускать после import_verbs / generate_forms: массовые записи идут мимо сигналов
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.common.choices import LanguageCode
+from src.personal_forms.models import LearningUnit
+from src.personal_forms.services import UnitPackService
+
+
+class Command(BaseCommand):
+    help = "Precompute offline content packs for all learning units."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lang",
+            action="append",
+            default=[],
+            help="Language to build (repeatable, default: all).",
+        )
+
+    def handle(self, *args, **options):
+        allowed = LanguageCode.get_available_values()
+        invalid = set(options["lang"]) - set(allowed)
+        if invalid:
+            raise CommandError(f"Invalid language(s) {sorted(invalid)}. Allowed: {allowed}")
+        languages = options["lang"] or allowed
+
+        service = UnitPackService()
+        units = LearningUnit.objects.select_related("verb_group").order_by("course_id", "order")
+        count = 0
+        for unit in units.iterator():
+            service.rebuild(unit, languages)
+            count += 1
+
+        self.stdout.write(f"Packs built: units={count}, languages={', '.join(languages)}")
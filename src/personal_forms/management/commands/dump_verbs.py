@@ -0,0 +1,227 @@
+# python manage.py dump_verbs --output verbs.json
+# python manage.py dump_verbs --format jsonl --level A1 --level A2 > verbs.jsonl
+# пишет глаголы в том же формате, который читает import_verbs:
+# {"verbs": [{"infinitive": ..., "perfekt": {...}, "forms": {...}, "translations": {...}}]}
+# глаголы читаются серверным курсором (.iterator), формы и переводы — одним запросом на пачку,
+# поэтому память не растёт с размером каталога
+
+import json
+from collections import defaultdict
+from datetime import datetime
+from itertools import batched
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from src.common.choices import CEFRLevel, Tense
+from src.personal_forms.models import Verb, VerbForm, VerbGroup, VerbTranslation
+
+
+class Command(BaseCommand):
+    help = "Export verbs, their forms and translations in the import_verbs JSON format."
+
+    FORMAT_JSON = "json"
+    FORMAT_JSONL = "jsonl"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Path to the output file (default: stdout).",
+        )
+        parser.add_argument(
+            "--format",
+            choices=[self.FORMAT_JSON, self.FORMAT_JSONL],
+            default=self.FORMAT_JSON,
+            help="json: one {'verbs': [...]} document; jsonl: one verb object per line.",
+        )
+        parser.add_argument(
+            "--level",
+            action="append",
+            default=[],
+            help="Only export verbs of this CEFR level (repeatable).",
+        )
+        parser.add_argument(
+            "--group",
+            action="append",
+            default=[],
+            help="Only export verbs of this VerbGroup id (repeatable).",
+        )
+        parser.add_argument(
+            "--updated-since",
+            type=str,
+            help="Only export verbs updated at or after this ISO date/datetime.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of verbs fetched per database round-trip.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size: int = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        queryset = self._build_queryset(
+            levels=options["level"],
+            group_ids=options["group"],
+            updated_since=options["updated_since"],
+        )
+
+        output_path = options["output"]
+        if output_path:
+            with Path(output_path).open("w", encoding="utf-8") as stream:
+                exported = self._write(stream, queryset, options["format"], chunk_size)
+            self.stderr.write(f"Exported {exported} verbs to: {output_path}")
+        else:
+            # OutputWrapper по умолчанию добавляет "\n" к каждому write — разделители пишем сами
+            self.stdout.ending = ""
+            exported = self._write(self.stdout, queryset, options["format"], chunk_size)
+            self.stderr.write(f"Exported {exported} verbs")
+
+    # --------------------------------------------------
+
+    def _build_queryset(self, *, levels, group_ids, updated_since):
+        queryset = Verb.objects.all()
+
+        allowed_levels = {l.value for l in CEFRLevel}
+        invalid_levels = set(levels) - allowed_levels
+        if invalid_levels:
+            raise CommandError(
+                f"Invalid level(s) {sorted(invalid_levels)}. Allowed: {sorted(allowed_levels)}"
+            )
+        if levels:
+            queryset = queryset.filter(level__in=levels)
+
+        if group_ids:
+            try:
+                found = VerbGroup.objects.filter(id__in=group_ids).count()
+            except ValidationError:
+                raise CommandError(f"Invalid VerbGroup id in {group_ids}")
+            if found != len(set(group_ids)):
+                raise CommandError(f"Unknown VerbGroup id in {group_ids}")
+            queryset = queryset.filter(verb_groups__id__in=group_ids).distinct()
+
+        if updated_since:
+            since = self._parse_since(updated_since)
+            queryset = queryset.filter(updated_at__gte=since)
+
+        return queryset.order_by("id")
+
+    @staticmethod
+    def _parse_since(value: str) -> datetime:
+        try:
+            since = parse_datetime(value)
+            if since is None:
+                day = parse_date(value)
+                if day is not None:
+                    since = datetime(day.year, day.month, day.day)
+        except ValueError:
+            since = None
+
+        if since is None:
+            raise CommandError(f"Invalid --updated-since '{value}': expected ISO date or datetime")
+
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    # --------------------------------------------------
+
+    def _write(self, stream, queryset, output_format, chunk_size) -> int:
+        exported = 0
+
+        if output_format == self.FORMAT_JSON:
+            stream.write('{"verbs": [\n')
+
+        for entry in self._iter_entries(queryset, chunk_size):
+            line = json.dumps(entry, ensure_ascii=False)
+            if output_format == self.FORMAT_JSON:
+                stream.write(line if exported == 0 else ",\n" + line)
+            else:
+                stream.write(line + "\n")
+            exported += 1
+
+        if output_format == self.FORMAT_JSON:
+            stream.write("\n]}\n")
+
+        return exported
+
+    def _iter_entries(self, queryset, chunk_size):
+        verbs = queryset.values(
+            "id",
+            "infinitive",
+            "verb_type",
+            "level",
+            "reflexivitaet",
+            "is_trennbare",
+            "case",
+            "auxiliary",
+            "participle_ii",
+        ).iterator(chunk_size=chunk_size)
+
+        for chunk in batched(verbs, chunk_size):
+            verb_ids = [v["id"] for v in chunk]
+            forms_map = self._load_forms(verb_ids)
+            translations_map = self._load_translations(verb_ids)
+
+            for verb in chunk:
+                yield self._build_entry(
+                    verb,
+                    forms_map.get(verb["id"], {}),
+                    translations_map.get(verb["id"], {}),
+                )
+
+    @staticmethod
+    def _load_forms(verb_ids):
+        forms_map = defaultdict(lambda: defaultdict(dict))
+        rows = VerbForm.objects.filter(
+            verb_id__in=verb_ids,
+            tense__in=[Tense.PRAESENS.value, Tense.PRAETERITUM.value],
+        ).values_list("verb_id", "tense", "pronoun", "form")
+
+        for verb_id, tense, pronoun, form in rows:
+            forms_map[verb_id][tense][pronoun] = form
+        return forms_map
+
+    @staticmethod
+    def _load_translations(verb_ids):
+        translations_map = defaultdict(dict)
+        rows = VerbTranslation.objects.filter(
+            verb_id__in=verb_ids,
+        ).values_list("verb_id", "language_code", "translation")
+
+        for verb_id, language_code, translation in rows:
+            translations_map[verb_id][language_code] = translation
+        return translations_map
+
+    @staticmethod
+    def _build_entry(verb, forms, translations):
+        entry = {
+            "infinitive": verb["infinitive"],
+            "verb_type": verb["verb_type"],
+            "level": verb["level"],
+            "reflexivitaet": verb["reflexivitaet"],
+            "is_trennbare": verb["is_trennbare"],
+        }
+        if verb["case"]:
+            entry["case"] = verb["case"]
+
+        perfekt = {}
+        if verb["auxiliary"]:
+            perfekt["auxiliary"] = verb["auxiliary"]
+        if verb["participle_ii"]:
+            perfekt["participle_ii"] = verb["participle_ii"]
+        if perfekt:
+            entry["perfekt"] = perfekt
+
+        if forms:
+            entry["forms"] = {tense: dict(pronoun_map) for tense, pronoun_map in forms.items()}
+        if translations:
+            entry["translations"] = translations
+        return entry
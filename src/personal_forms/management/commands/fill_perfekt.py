@@ -0,0 +1,166 @@
+# python manage.py fill_perfekt --dry-run --report perfekt_review.json
+# python manage.py fill_perfekt --level A1 --only-confident
+# заполняет пустые auxiliary / participle_ii за один проход по каталогу (ParticipleGenerator)
+# заполненные вручную значения никогда не перезаписываются
+# отчёт: что записано, что требует проверки (needs_review), что вывести не удалось
+
+import json
+from itertools import batched
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from src.common.choices import CEFRLevel
+from src.personal_forms.models import Verb
+from src.personal_forms.services import ContentVersionService, FormLookupService, UnitPackService
+from src.personal_forms.services.morphology import ParticipleGenerator
+
+
+class Command(BaseCommand):
+    help = "Fill missing Perfekt data (auxiliary, Partizip II) and write a review report."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--level",
+            action="append",
+            default=[],
+            help="Only process verbs of this CEFR level (repeatable).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report suggestions, do not write.",
+        )
+        parser.add_argument(
+            "--only-confident",
+            action="store_true",
+            help="Do not write suggestions that are marked for review.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of verbs processed per transaction.",
+        )
+        parser.add_argument(
+            "--report",
+            type=str,
+            help="Write the review report to this JSON file.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run: bool = options["dry_run"]
+        only_confident: bool = options["only_confident"]
+        chunk_size: int = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        allowed_levels = {l.value for l in CEFRLevel}
+        invalid_levels = set(options["level"]) - allowed_levels
+        if invalid_levels:
+            raise CommandError(
+                f"Invalid level(s) {sorted(invalid_levels)}. Allowed: {sorted(allowed_levels)}"
+            )
+
+        queryset = Verb.objects.filter(
+            Q(auxiliary__isnull=True) | Q(auxiliary="")
+            | Q(participle_ii__isnull=True) | Q(participle_ii="")
+        )
+        if options["level"]:
+            queryset = queryset.filter(level__in=options["level"])
+
+        rows = queryset.order_by("id").values(
+            "id", "infinitive", "verb_type", "is_trennbare", "reflexivitaet", "case",
+            "auxiliary", "participle_ii",
+        ).iterator(chunk_size=chunk_size)
+
+        generator = ParticipleGenerator()
+        report = {"filled": [], "review": [], "unhandled": []}
+        stats = {"participle_ii": 0, "auxiliary": 0}
+
+        for chunk in batched(rows, chunk_size):
+            to_update = []
+            now = timezone.now()
+
+            for row, suggestion in zip(chunk, generator.generate_many(chunk)):
+                entry = {
+                    "id": row["id"],
+                    "infinitive": row["infinitive"],
+                    "participle_ii": suggestion.participle_ii,
+                    "participle_source": suggestion.participle_source,
+                    "auxiliary": suggestion.auxiliary,
+                    "auxiliary_source": suggestion.auxiliary_source,
+                    "notes": suggestion.notes,
+                }
+                if suggestion.error:
+                    entry["error"] = suggestion.error
+                    report["unhandled"].append(entry)
+                if suggestion.needs_review:
+                    report["review"].append(entry)
+                    if only_confident:
+                        continue
+
+                verb = Verb(id=row["id"], updated_at=now)
+                changed = False
+                if not row["participle_ii"] and suggestion.participle_ii:
+                    verb.participle_ii = suggestion.participle_ii
+                    stats["participle_ii"] += 1
+                    changed = True
+                else:
+                    verb.participle_ii = row["participle_ii"]
+                if not row["auxiliary"] and suggestion.auxiliary:
+                    verb.auxiliary = suggestion.auxiliary
+                    stats["auxiliary"] += 1
+                    changed = True
+                else:
+                    verb.auxiliary = row["auxiliary"]
+
+                if changed:
+                    to_update.append(verb)
+                    if not suggestion.error and not suggestion.needs_review:
+                        report["filled"].append(entry)
+
+            if to_update and not dry_run:
+                with transaction.atomic():
+                    # updated_at задаётся явно: bulk_update не вызывает auto_now
+                    Verb.objects.bulk_update(
+                        to_update, ["participle_ii", "auxiliary", "updated_at"], batch_size=500
+                    )
+                    verb_ids = [verb.pk for verb in to_update]
+                    transaction.on_commit(lambda ids=verb_ids: self._after_update(ids))
+
+        for entry in report["review"]:
+            self.stdout.write(
+                f"REVIEW '{entry['infinitive']}': {entry['auxiliary']} {entry['participle_ii'] or '?'}"
+                f" ({'; '.join(entry['notes']) or entry.get('error', '')})"
+            )
+        for entry in report["unhandled"]:
+            self.stdout.write(f"UNHANDLED '{entry['infinitive']}': {entry['error']}")
+
+        if options["report"]:
+            Path(options["report"]).write_text(
+                json.dumps(report, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+
+        self.stdout.write(
+            "\n".join(
+                [
+                    "Dry run, nothing written" if dry_run else "Perfekt data filled",
+                    f"Participle II: filled={stats['participle_ii']}",
+                    f"Auxiliary: filled={stats['auxiliary']}",
+                    f"Needs review: {len(report['review'])}",
+                    f"Unhandled: {len(report['unhandled'])}",
+                ]
+            )
+        )
+
+    @staticmethod
+    def _after_update(verb_ids):
+        # bulk_update не шлёт post_save: то же, что сделали бы сигналы Verb (signals.py)
+        ContentVersionService().bump_catalog_version()
+        UnitPackService().invalidate_for_verbs(verb_ids)
+        FormLookupService().rebuild_verbs(verb_ids)
@@ -0,0 +1,178 @@
+# python manage.py generate_forms --dry-run
+# python manage.py generate_forms --tense Präsens --level A1 --report unhandled.json
+# дописывает недостающие VerbForm (Präsens/Präteritum) для слабых глаголов по правилам WeakVerbConjugator
+# существующие формы никогда не перезаписываются
+# глаголы без полного набора форм выбираются одним запросом с Count, существующие формы пачки — ещё одним,
+# новые строки пишутся bulk_create; индекс форм и офлайн-пакеты затронутых глаголов обновляются после коммита
+
+import json
+from itertools import batched
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+
+from src.common.choices import CEFRLevel, Pronoun, Reflexiv, VerbType
+from src.personal_forms.exceptions import MorphologyError
+from src.personal_forms.models import Verb, VerbForm
+from src.personal_forms.services import FormLookupService, UnitPackService
+from src.personal_forms.services.morphology import WeakVerbConjugator
+
+
+class Command(BaseCommand):
+    help = "Generate missing Präsens/Präteritum forms for regular (weak) verbs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tense",
+            action="append",
+            choices=list(WeakVerbConjugator.SUPPORTED_TENSES),
+            help="Tense to fill (repeatable, default: all supported).",
+        )
+        parser.add_argument(
+            "--level",
+            action="append",
+            default=[],
+            help="Only process verbs of this CEFR level (repeatable).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be created.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of verbs processed per transaction.",
+        )
+        parser.add_argument(
+            "--report",
+            type=str,
+            help="Write the list of verbs that could not be handled to this JSON file.",
+        )
+
+    def handle(self, *args, **options):
+        tenses = options["tense"] or list(WeakVerbConjugator.SUPPORTED_TENSES)
+        dry_run: bool = options["dry_run"]
+        chunk_size: int = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be a positive integer")
+
+        allowed_levels = {l.value for l in CEFRLevel}
+        invalid_levels = set(options["level"]) - allowed_levels
+        if invalid_levels:
+            raise CommandError(
+                f"Invalid level(s) {sorted(invalid_levels)}. Allowed: {sorted(allowed_levels)}"
+            )
+
+        expected_per_verb = len(tenses) * len(Pronoun.values)
+        queryset = Verb.objects.annotate(
+            present_forms=Count("forms", filter=Q(forms__tense__in=tenses)),
+        ).filter(present_forms__lt=expected_per_verb)
+        if options["level"]:
+            queryset = queryset.filter(level__in=options["level"])
+
+        verbs = queryset.order_by("id").values(
+            "id", "infinitive", "verb_type", "is_trennbare", "reflexivitaet",
+        ).iterator(chunk_size=chunk_size)
+
+        conjugator = WeakVerbConjugator()
+        created = 0
+        completed_verbs = 0
+        unhandled = []
+
+        for chunk in batched(verbs, chunk_size):
+            existing = set(
+                VerbForm.objects.filter(
+                    verb_id__in=[v["id"] for v in chunk],
+                    tense__in=tenses,
+                ).values_list("verb_id", "tense", "pronoun")
+            )
+
+            new_forms = []
+            for verb in chunk:
+                try:
+                    generated = self._generate(conjugator, verb, tenses)
+                except MorphologyError as exc:
+                    unhandled.append({"id": verb["id"], "infinitive": verb["infinitive"], "reason": str(exc)})
+                    continue
+
+                missing = [
+                    VerbForm(verb_id=verb["id"], tense=tense, pronoun=pronoun, form=form)
+                    for tense, pronoun_map in generated.items()
+                    for pronoun, form in pronoun_map.items()
+                    if (verb["id"], tense, pronoun) not in existing
+                ]
+                new_forms.extend(missing)
+
+            if not new_forms:
+                continue
+            if dry_run:
+                inserted = new_forms
+            else:
+                with transaction.atomic():
+                    # ignore_conflicts: если форму добавили параллельно (админка), она важнее сгенерированной
+                    VerbForm.objects.bulk_create(new_forms, batch_size=1000, ignore_conflicts=True)
+                    inserted = self._inserted(new_forms, tenses)
+                    verb_ids = sorted({form.verb_id for form in inserted})
+                    if verb_ids:
+                        transaction.on_commit(lambda ids=verb_ids: self._after_create(ids))
+            # Пропущенные ignore_conflicts строки не считаются
+            created += len(inserted)
+            completed_verbs += len({form.verb_id for form in inserted})
+
+        for item in unhandled:
+            self.stdout.write(f"UNHANDLED '{item['infinitive']}': {item['reason']}")
+
+        if options["report"]:
+            Path(options["report"]).write_text(
+                json.dumps({"unhandled": unhandled}, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+
+        self.stdout.write(
+            "\n".join(
+                [
+                    f"{'Dry run, nothing written' if dry_run else 'Generated'}: tenses={', '.join(tenses)}",
+                    f"Verbs filled: {completed_verbs}",
+                    f"Forms: created={created}",
+                    f"Unhandled verbs: {len(unhandled)}",
+                ]
+            )
+        )
+
+    @staticmethod
+    def _generate(conjugator: WeakVerbConjugator, verb: dict, tenses):
+        # Поля с default=Enum-член могли сохраниться как "VerbType.REGULAR"
+        if verb["verb_type"] not in (VerbType.REGULAR.value, str(VerbType.REGULAR)):
+            raise MorphologyError(f"verb_type '{verb['verb_type']}' is not a weak verb")
+        if verb["reflexivitaet"] not in (Reflexiv.NREFL.value, str(Reflexiv.NREFL)):
+            # Формат хранения возвратных форм («freue mich») не выводится из правил
+            raise MorphologyError("reflexive verbs are not generated")
+        return conjugator.conjugate(
+            verb["infinitive"],
+            is_trennbare=verb["is_trennbare"],
+            tenses=tenses,
+        )
+
+    @staticmethod
+    def _inserted(new_forms, tenses):
+        """
+        Какие из new_forms реально записаны: bulk_create с ignore_conflicts не сообщает,
+        какие строки пропущены, поэтому сверяем с БД по (verb, tense, pronoun, form)
+        """
+        stored = set(
+            VerbForm.objects.filter(
+                verb_id__in={form.verb_id for form in new_forms},
+                tense__in=tenses,
+            ).values_list("verb_id", "tense", "pronoun", "form")
+        )
+        return [form for form in new_forms if (form.verb_id, form.tense, form.pronoun, form.form) in stored]
+
+    @staticmethod
+    def _after_create(verb_ids):
+        # bulk_create не шлёт post_save: то же, что сделали бы сигналы VerbForm (signals.py)
+        UnitPackService().invalidate_for_verbs(verb_ids)
+        FormLookupService().rebuild_verbs(verb_ids)
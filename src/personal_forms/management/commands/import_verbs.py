@@ -4,20 +4,49 @@
 # применяет по правилам:
 # без --force: ставит только если verb.verb_type пустой (и в --debug пишет SKIP ...)
 # с --force: перезаписывает
-
+# коммитит пачками по --batch-size; после каждой пачки в ImportCheckpoint (по пути файла) пишется offset,
+# и после ошибки можно продолжить с последней закоммиченной пачки через --resume
+# --dry-run: те же правила, но ничего не пишет в БД
+# --diff: JSON-отчёт по изменениям (created/updated/skipped по каждой сущности) в stdout,
+#         текстовая сводка уходит в stderr
+# глаголы пачки вместе с формами и переводами грузятся тремя запросами, дальше всё сравнивается в памяти
+# индекс форм, офлайн-пакеты и версия каталога обновляются один раз на пачку после коммита (defer_verb_sync),
+# а не сигналами на каждую сохранённую строку
+
+import hashlib
 import json
+from collections import Counter
+from contextlib import nullcontext
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 
 from src.common.choices import AuxiliaryVerb, GermanCase, Pronoun, Reflexiv, Tense, VerbType, LanguageCode, CEFRLevel
-from src.personal_forms.models import Verb, VerbForm, VerbTranslation
+from src.personal_forms.models import ImportCheckpoint, Verb, VerbForm, VerbTranslation
+from src.personal_forms.signals import defer_verb_sync
 
 
 class Command(BaseCommand):
     help = "Import verbs and their forms (Präsens/Präteritum) from a JSON file."
 
+    allowed_pronouns = set(Pronoun.get_available_values())
+    allowed_tenses = {Tense.PRAESENS.value, Tense.PRAETERITUM.value}
+    allowed_aux = {a.value for a in AuxiliaryVerb}
+    allowed_verb_types = {t.value for t in VerbType}
+    allowed_language_codes = set(LanguageCode.get_available_values())
+    allowed_reflexivitaet = {r.value for r in Reflexiv}
+    allowed_cases = {
+        GermanCase.AKK.name,
+        GermanCase.DAT.name,
+        # GermanCase.AKK.value,
+        # GermanCase.DAT.value,
+    }
+    allowed_levels = {l.value for l in CEFRLevel}
+
+    CHILD_COUNTERS = ("created_forms", "updated_forms", "created_translations", "updated_translations")
+
     def add_arguments(self, parser):
         parser.add_argument(
             "json_path",
@@ -34,19 +63,47 @@ class Command(BaseCommand):
             action="store_true",
             help="Log skipped updates due to already filled values.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of verbs committed per transaction.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue from the last committed batch of a previous run of the same file.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apply all rules in memory without writing anything to the database.",
+        )
+        parser.add_argument(
+            "--diff",
+            action="store_true",
+            help="Print a JSON change report (created/updated/skipped per entity) to stdout.",
+        )
 
     def handle(self, *args, **options):
         json_path = Path(options["json_path"])
         force: bool = options["force"]
         debug: bool = options["debug"]
+        batch_size: int = options["batch_size"]
+        resume: bool = options["resume"]
+        dry_run: bool = options["dry_run"]
+        diff: bool = options["diff"]
 
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
         if not json_path.exists():
             raise CommandError(f"JSON file not found: {json_path}")
         if not json_path.is_file():
             raise CommandError(f"Not a file: {json_path}")
 
         try:
-            payload = json.loads(json_path.read_text(encoding="utf-8"))
+            raw = json_path.read_bytes()
+            payload = json.loads(raw.decode("utf-8"))
         except Exception as exc:
             raise CommandError(f"Failed to read/parse JSON: {exc}")
 
@@ -54,325 +111,463 @@ class Command(BaseCommand):
         if not isinstance(verbs, list):
             raise CommandError("Invalid JSON: top-level key 'verbs' must be a list")
 
-        allowed_pronouns = set(Pronoun.get_available_values())
-        allowed_tenses = {Tense.PRAESENS.value, Tense.PRAETERITUM.value}
-        allowed_aux = {a.value for a in AuxiliaryVerb}
-        allowed_verb_types = {t.value for t in VerbType}
-        allowed_language_codes = set(LanguageCode.get_available_values())
-        allowed_reflexivitaet = {r.value for r in Reflexiv}
-        allowed_cases = {
-            GermanCase.AKK.name,
-            GermanCase.DAT.name,
-            # GermanCase.AKK.value,
-            # GermanCase.DAT.value,
-        }
-        allowed_levels = {l.value for l in CEFRLevel}
-
-        created_verbs = 0
-        updated_verbs = 0
-        created_forms = 0
-        updated_forms = 0
-        created_translations = 0
-        updated_translations = 0
-        skipped = 0
-
-        for idx, item in enumerate(verbs, start=1):
-            if not isinstance(item, dict):
-                raise CommandError(f"Invalid verb entry at index {idx}: expected object")
-
-            infinitive = (item.get("infinitive") or "").strip()
-            if not infinitive:
-                raise CommandError(f"Invalid verb entry at index {idx}: missing 'infinitive'")
-
-            with transaction.atomic():
-                verb, verb_created = Verb.objects.get_or_create(
-                    infinitive=infinitive,
-                    defaults={
-                        "verb_type": VerbType.REGULAR.value,
-                        "level": CEFRLevel.A1.value,
-                    },
-                )
-                if verb_created:
-                    created_verbs += 1
-
-                verb_changed = False
-
-                verb_type = item.get("verb_type")
-                if verb_type is not None:
-                    verb_type = str(verb_type).strip()
-                    if verb_type and verb_type not in allowed_verb_types:
-                        raise CommandError(
-                            f"Invalid verb_type '{verb_type}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_verb_types)}"
-                        )
-                    if force or not verb.verb_type:
-                        if verb_type and verb_type != verb.verb_type:
-                            verb.verb_type = verb_type
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.verb_type for '{infinitive}': already set ({verb.verb_type})"
-                            )
-
-                level = item.get("level")
-                if level is not None:
-                    level = str(level).strip()
-                    if level and level not in allowed_levels:
-                        raise CommandError(
-                            f"Invalid level '{level}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_levels)}"
-                        )
-                    if force or not verb.level:
-                        if level and level != verb.level:
-                            verb.level = level
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.level for '{infinitive}': already set ({verb.level})"
-                            )
-
-                is_trennbare = item.get("is_trennbare")
-                if is_trennbare is not None:
-                    if isinstance(is_trennbare, bool):
-                        parsed_is_trennbare = is_trennbare
-                    elif isinstance(is_trennbare, (int, float)):
-                        parsed_is_trennbare = bool(is_trennbare)
-                    else:
-                        parsed_is_trennbare_str = str(is_trennbare).strip().lower()
-                        if parsed_is_trennbare_str in {"true", "1", "yes", "y", "on"}:
-                            parsed_is_trennbare = True
-                        elif parsed_is_trennbare_str in {"false", "0", "no", "n", "off"}:
-                            parsed_is_trennbare = False
-                        else:
-                            raise CommandError(
-                                f"Invalid is_trennbare '{is_trennbare}' for verb '{infinitive}'. "
-                                "Expected boolean."
-                            )
-
-                    if force or verb_created or (not verb.is_trennbare and parsed_is_trennbare):
-                        if parsed_is_trennbare != verb.is_trennbare:
-                            verb.is_trennbare = parsed_is_trennbare
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.is_trennbare for '{infinitive}': already set ({verb.is_trennbare})"
-                            )
-
-                reflexivitaet = item.get("reflexivitaet")
-                if reflexivitaet is not None:
-                    reflexivitaet = str(reflexivitaet).strip()
-                    if reflexivitaet and reflexivitaet not in allowed_reflexivitaet:
-                        raise CommandError(
-                            f"Invalid reflexivitaet '{reflexivitaet}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_reflexivitaet)}"
+        # При --diff stdout занят JSON-отчётом
+        self.log = log = self.stderr if diff else self.stdout
+
+        if dry_run:
+            checkpoint = None
+            start = self._peek_checkpoint_offset(json_path) if resume else 0
+        else:
+            checkpoint = self._get_checkpoint(json_path, raw, total_entries=len(verbs), resume=resume)
+            if checkpoint.completed and verbs:
+                log.write(f"Nothing to resume: {json_path} was already imported completely.")
+                return
+            start = checkpoint.offset
+        if start:
+            log.write(f"Resuming {json_path} from entry {start + 1}/{len(verbs)}")
+
+        stats = Counter()
+        report = [] if diff else None
+        committed = start
+
+        for batch_start in range(start, len(verbs), batch_size):
+            batch = verbs[batch_start:batch_start + batch_size]
+            try:
+                with nullcontext() if dry_run else transaction.atomic(), defer_verb_sync():
+                    state = self._load_batch(batch)
+                    for idx, item in enumerate(batch, start=batch_start + 1):
+                        changes = self._import_item(
+                            idx, item, state, stats, force=force, debug=debug, dry_run=dry_run
                         )
+                        if report is not None and (changes["verb"] != "unchanged" or changes["skipped"]):
+                            report.append(changes)
+
+                    if checkpoint is not None:
+                        # Checkpoint коммитится в той же транзакции, что и данные пачки
+                        checkpoint.offset = batch_start + len(batch)
+                        checkpoint.completed = checkpoint.offset >= len(verbs)
+                        checkpoint.save(update_fields=["offset", "completed", "updated_at"])
+                    committed = batch_start + len(batch)
+            except CommandError as exc:
+                if dry_run:
+                    raise
+                raise CommandError(
+                    f"{exc}\n"
+                    f"Entries 1..{committed} are committed. "
+                    f"Fix the file and re-run with --resume to continue from entry {committed + 1}."
+                )
 
-                    default_reflexivitaet = Reflexiv.NREFL.value
-                    if force or verb_created or verb.reflexivitaet == default_reflexivitaet:
-                        if reflexivitaet and reflexivitaet != verb.reflexivitaet:
-                            verb.reflexivitaet = reflexivitaet
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.reflexivitaet for '{infinitive}': already set ({verb.reflexivitaet})"
-                            )
-
-                case = item.get("case")
-                if case is not None:
-                    case = str(case).strip()
-                    if case and case not in allowed_cases:
-                        raise CommandError(
-                            f"Invalid case '{case}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_cases)}"
-                        )
+        if report is not None:
+            self.stdout.write(json.dumps(
+                {
+                    "file": str(json_path),
+                    "dry_run": dry_run,
+                    "force": force,
+                    "summary": self._build_summary(stats),
+                    "changes": report,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ))
+
+        log.write(
+            "\n".join(
+                [
+                    f"{'Dry run, nothing written' if dry_run else 'Imported from'}: {json_path}",
+                    f"Verbs: created={stats['created_verbs']}, updated={stats['updated_verbs']}",
+                    f"Forms: created={stats['created_forms']}, updated={stats['updated_forms']}",
+                    f"Translations: created={stats['created_translations']}, updated={stats['updated_translations']}",
+                    f"Skipped={stats['skipped']} (use --debug for details)",
+                ]
+            )
+        )
+
+    # --------------------------------------------------
+
+    def _get_checkpoint(self, json_path: Path, raw: bytes, *, total_entries: int, resume: bool) -> ImportCheckpoint:
+        """
+        Файл идентифицируется по абсолютному пути, содержимое — по SHA-256.
+        Без --resume checkpoint сбрасывается и импорт идёт с начала.
+        """
+        file_hash = hashlib.sha256(raw).hexdigest()
+        checkpoint, created = ImportCheckpoint.objects.get_or_create(
+            file_path=str(json_path.resolve()),
+            defaults={
+                "file_hash": file_hash,
+                "file_size": len(raw),
+                "total_entries": total_entries,
+            },
+        )
+        if created:
+            return checkpoint
+
+        if resume and checkpoint.file_hash != file_hash:
+            # Обычный сценарий: исправили битую запись и продолжаем. Уже закоммиченные записи не перечитываются.
+            self.stderr.write(
+                f"WARNING: {json_path} changed since the last run; "
+                f"resuming after entry {checkpoint.offset} anyway."
+            )
+
+        if not resume:
+            checkpoint.offset = 0
+        checkpoint.completed = checkpoint.offset >= total_entries
+        checkpoint.file_hash = file_hash
+        checkpoint.file_size = len(raw)
+        checkpoint.total_entries = total_entries
+        checkpoint.save()
+        return checkpoint
+
+    @staticmethod
+    def _peek_checkpoint_offset(json_path: Path) -> int:
+        """Для --dry-run --resume: только читаем checkpoint, ничего не создаём"""
+        checkpoint = ImportCheckpoint.objects.filter(file_path=str(json_path.resolve())).first()
+        return checkpoint.offset if checkpoint and not checkpoint.completed else 0
+
+    @staticmethod
+    def _load_batch(batch) -> dict:
+        """
+        Три запроса на пачку: глаголы, их формы и переводы.
+        Созданные по ходу пачки объекты дописываются в эти же словари,
+        поэтому повтор инфинитива внутри файла обрабатывается как обновление.
+        """
+        infinitives = {
+            (item.get("infinitive") or "").strip()
+            for item in batch
+            if isinstance(item, dict)
+        }
+        infinitives.discard("")
+
+        state = {"verbs": {}, "forms": {}, "translations": {}}
+        for verb in Verb.objects.filter(infinitive__in=infinitives).prefetch_related("forms", "translations"):
+            state["verbs"][verb.infinitive] = verb
+            state["forms"][verb.infinitive] = {(f.tense, f.pronoun): f for f in verb.forms.all()}
+            state["translations"][verb.infinitive] = {t.language_code: t for t in verb.translations.all()}
+        return state
+
+    @staticmethod
+    def _build_summary(stats) -> dict:
+        return {
+            entity: {
+                "created": stats[f"created_{entity}"],
+                "updated": stats[f"updated_{entity}"],
+                "skipped": stats[f"skipped_{entity}"],
+            }
+            for entity in ("verbs", "forms", "translations")
+        }
 
-                    normalized_case = case
-                    if case == GermanCase.AKK.value:
-                        normalized_case = GermanCase.AKK.name
-                    elif case == GermanCase.DAT.value:
-                        normalized_case = GermanCase.DAT.name
-
-                    if force or not verb.case:
-                        if normalized_case != (verb.case or ""):
-                            verb.case = normalized_case or None
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.case for '{infinitive}': already set ({verb.case})"
-                            )
-
-                perfekt = item.get("perfekt") or {}
-                if not isinstance(perfekt, dict):
+    # --------------------------------------------------
+
+    def _skip(self, changes, stats, *, entity, label, current, incoming, debug):
+        stats["skipped"] += 1
+        stats[f"skipped_{entity}"] += 1
+        changes["skipped"].append({"entity": entity, "field": label, "current": current, "incoming": incoming})
+        if debug:
+            self.log.write(f"SKIP {label} for '{changes['infinitive']}': already set ({current})")
+
+    @staticmethod
+    def _set_verb_field(verb, changes, field, value):
+        changes["fields"][field] = {"old": getattr(verb, field), "new": value}
+        setattr(verb, field, value)
+
+    def _import_item(self, idx, item, state, stats, *, force, debug, dry_run) -> dict:
+        if not isinstance(item, dict):
+            raise CommandError(f"Invalid verb entry at index {idx}: expected object")
+
+        infinitive = (item.get("infinitive") or "").strip()
+        if not infinitive:
+            raise CommandError(f"Invalid verb entry at index {idx}: missing 'infinitive'")
+
+        changes = {
+            "index": idx,
+            "infinitive": infinitive,
+            "verb": "unchanged",
+            "fields": {},
+            "forms": [],
+            "translations": [],
+            "skipped": [],
+        }
+
+        verb = state["verbs"].get(infinitive)
+        verb_created = verb is None
+        if verb_created:
+            verb = Verb(
+                infinitive=infinitive,
+                verb_type=VerbType.REGULAR.value,
+                level=CEFRLevel.A1.value,
+            )
+            if not dry_run:
+                verb.save()
+            state["verbs"][infinitive] = verb
+            state["forms"][infinitive] = {}
+            state["translations"][infinitive] = {}
+            stats["created_verbs"] += 1
+            changes["verb"] = "created"
+
+        existing_forms = state["forms"][infinitive]
+        existing_translations = state["translations"][infinitive]
+        children_before = [stats[key] for key in self.CHILD_COUNTERS]
+
+        def skip(label, current, incoming):
+            self._skip(changes, stats, entity="verbs", label=label, current=current, incoming=incoming, debug=debug)
+
+        verb_type = item.get("verb_type")
+        if verb_type is not None:
+            verb_type = str(verb_type).strip()
+            if verb_type and verb_type not in self.allowed_verb_types:
+                raise CommandError(
+                    f"Invalid verb_type '{verb_type}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_verb_types)}"
+                )
+            if force or not verb.verb_type:
+                if verb_type and verb_type != verb.verb_type:
+                    self._set_verb_field(verb, changes, "verb_type", verb_type)
+            else:
+                skip("verb.verb_type", verb.verb_type, verb_type)
+
+        level = item.get("level")
+        if level is not None:
+            level = str(level).strip()
+            if level and level not in self.allowed_levels:
+                raise CommandError(
+                    f"Invalid level '{level}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_levels)}"
+                )
+            if force or not verb.level:
+                if level and level != verb.level:
+                    self._set_verb_field(verb, changes, "level", level)
+            else:
+                skip("verb.level", verb.level, level)
+
+        is_trennbare = item.get("is_trennbare")
+        if is_trennbare is not None:
+            if isinstance(is_trennbare, bool):
+                parsed_is_trennbare = is_trennbare
+            elif isinstance(is_trennbare, (int, float)):
+                parsed_is_trennbare = bool(is_trennbare)
+            else:
+                parsed_is_trennbare_str = str(is_trennbare).strip().lower()
+                if parsed_is_trennbare_str in {"true", "1", "yes", "y", "on"}:
+                    parsed_is_trennbare = True
+                elif parsed_is_trennbare_str in {"false", "0", "no", "n", "off"}:
+                    parsed_is_trennbare = False
+                else:
                     raise CommandError(
-                        f"Invalid verb entry '{infinitive}': 'perfekt' must be an object"
+                        f"Invalid is_trennbare '{is_trennbare}' for verb '{infinitive}'. "
+                        "Expected boolean."
                     )
 
-                auxiliary = perfekt.get("auxiliary")
-                if auxiliary is not None:
-                    auxiliary = str(auxiliary).strip()
-                    if auxiliary and auxiliary not in allowed_aux:
-                        raise CommandError(
-                            f"Invalid auxiliary '{auxiliary}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_aux)}"
-                        )
-                    if force or not verb.auxiliary:
-                        if auxiliary != verb.auxiliary:
-                            verb.auxiliary = auxiliary or None
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.auxiliary for '{infinitive}': already set ({verb.auxiliary})"
-                            )
-
-                participle_ii = perfekt.get("participle_ii")
-                if participle_ii is not None:
-                    participle_ii = str(participle_ii).strip()
-                    if force or not verb.participle_ii:
-                        if participle_ii != (verb.participle_ii or ""):
-                            verb.participle_ii = participle_ii or None
-                            verb_changed = True
-                    else:
-                        skipped += 1
-                        if debug:
-                            self.stdout.write(
-                                f"SKIP verb.participle_ii for '{infinitive}': already set ({verb.participle_ii})"
-                            )
-
-                forms = item.get("forms") or {}
-                if not isinstance(forms, dict):
+            if force or verb_created or (not verb.is_trennbare and parsed_is_trennbare):
+                if parsed_is_trennbare != verb.is_trennbare:
+                    self._set_verb_field(verb, changes, "is_trennbare", parsed_is_trennbare)
+            else:
+                skip("verb.is_trennbare", verb.is_trennbare, parsed_is_trennbare)
+
+        reflexivitaet = item.get("reflexivitaet")
+        if reflexivitaet is not None:
+            reflexivitaet = str(reflexivitaet).strip()
+            if reflexivitaet and reflexivitaet not in self.allowed_reflexivitaet:
+                raise CommandError(
+                    f"Invalid reflexivitaet '{reflexivitaet}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_reflexivitaet)}"
+                )
+
+            default_reflexivitaet = Reflexiv.NREFL.value
+            if force or verb_created or verb.reflexivitaet == default_reflexivitaet:
+                if reflexivitaet and reflexivitaet != verb.reflexivitaet:
+                    self._set_verb_field(verb, changes, "reflexivitaet", reflexivitaet)
+            else:
+                skip("verb.reflexivitaet", verb.reflexivitaet, reflexivitaet)
+
+        case = item.get("case")
+        if case is not None:
+            case = str(case).strip()
+            if case and case not in self.allowed_cases:
+                raise CommandError(
+                    f"Invalid case '{case}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_cases)}"
+                )
+
+            normalized_case = case
+            if case == GermanCase.AKK.value:
+                normalized_case = GermanCase.AKK.name
+            elif case == GermanCase.DAT.value:
+                normalized_case = GermanCase.DAT.name
+
+            if force or not verb.case:
+                if normalized_case != (verb.case or ""):
+                    self._set_verb_field(verb, changes, "case", normalized_case or None)
+            else:
+                skip("verb.case", verb.case, normalized_case)
+
+        perfekt = item.get("perfekt") or {}
+        if not isinstance(perfekt, dict):
+            raise CommandError(
+                f"Invalid verb entry '{infinitive}': 'perfekt' must be an object"
+            )
+
+        auxiliary = perfekt.get("auxiliary")
+        if auxiliary is not None:
+            auxiliary = str(auxiliary).strip()
+            if auxiliary and auxiliary not in self.allowed_aux:
+                raise CommandError(
+                    f"Invalid auxiliary '{auxiliary}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_aux)}"
+                )
+            if force or not verb.auxiliary:
+                if (auxiliary or None) != verb.auxiliary:
+                    self._set_verb_field(verb, changes, "auxiliary", auxiliary or None)
+            else:
+                skip("verb.auxiliary", verb.auxiliary, auxiliary)
+
+        participle_ii = perfekt.get("participle_ii")
+        if participle_ii is not None:
+            participle_ii = str(participle_ii).strip()
+            if force or not verb.participle_ii:
+                if participle_ii != (verb.participle_ii or ""):
+                    self._set_verb_field(verb, changes, "participle_ii", participle_ii or None)
+            else:
+                skip("verb.participle_ii", verb.participle_ii, participle_ii)
+
+        forms = item.get("forms") or {}
+        if not isinstance(forms, dict):
+            raise CommandError(
+                f"Invalid verb entry '{infinitive}': 'forms' must be an object"
+            )
+
+        for tense_name, pronoun_map in forms.items():
+            if tense_name not in self.allowed_tenses:
+                raise CommandError(
+                    f"Invalid tense '{tense_name}' for verb '{infinitive}'. "
+                    f"Allowed: {sorted(self.allowed_tenses)}"
+                )
+            if not isinstance(pronoun_map, dict):
+                raise CommandError(
+                    f"Invalid forms for verb '{infinitive}', tense '{tense_name}': must be an object"
+                )
+
+            for pronoun_value, form_value in pronoun_map.items():
+                pronoun_value = str(pronoun_value).strip()
+                if pronoun_value not in self.allowed_pronouns:
                     raise CommandError(
-                        f"Invalid verb entry '{infinitive}': 'forms' must be an object"
+                        f"Invalid pronoun '{pronoun_value}' for verb '{infinitive}', tense '{tense_name}'. "
+                        f"Allowed: {sorted(self.allowed_pronouns)}"
                     )
 
-                for tense_name, pronoun_map in forms.items():
-                    if tense_name not in allowed_tenses:
-                        raise CommandError(
-                            f"Invalid tense '{tense_name}' for verb '{infinitive}'. "
-                            f"Allowed: {sorted(allowed_tenses)}"
-                        )
-                    if not isinstance(pronoun_map, dict):
-                        raise CommandError(
-                            f"Invalid forms for verb '{infinitive}', tense '{tense_name}': must be an object"
-                        )
+                form_value = "" if form_value is None else str(form_value).strip()
+                if not form_value:
+                    raise CommandError(
+                        f"Empty form for verb '{infinitive}', tense '{tense_name}', pronoun '{pronoun_value}'"
+                    )
 
-                    for pronoun_value, form_value in pronoun_map.items():
-                        pronoun_value = str(pronoun_value).strip()
-                        if pronoun_value not in allowed_pronouns:
-                            raise CommandError(
-                                f"Invalid pronoun '{pronoun_value}' for verb '{infinitive}', tense '{tense_name}'. "
-                                f"Allowed: {sorted(allowed_pronouns)}"
-                            )
-
-                        form_value = "" if form_value is None else str(form_value).strip()
-                        if not form_value:
-                            raise CommandError(
-                                f"Empty form for verb '{infinitive}', tense '{tense_name}', pronoun '{pronoun_value}'"
-                            )
-
-                        vf, vf_created = VerbForm.objects.get_or_create(
-                            verb=verb,
-                            tense=tense_name,
-                            pronoun=pronoun_value,
-                            defaults={"form": form_value},
-                        )
+                key = (tense_name, pronoun_value)
+                vf = existing_forms.get(key)
+
+                if vf is None:
+                    vf = VerbForm(verb=verb, tense=tense_name, pronoun=pronoun_value, form=form_value)
+                    if not dry_run:
+                        vf.save()
+                    existing_forms[key] = vf
+                    stats["created_forms"] += 1
+                    changes["forms"].append(
+                        {"tense": tense_name, "pronoun": pronoun_value, "action": "created", "new": form_value}
+                    )
+                    continue
+
+                if force or not vf.form:
+                    if vf.form != form_value:
+                        changes["forms"].append({
+                            "tense": tense_name,
+                            "pronoun": pronoun_value,
+                            "action": "updated",
+                            "old": vf.form,
+                            "new": form_value,
+                        })
+                        vf.form = form_value
+                        if not dry_run:
+                            vf.save(update_fields=["form"])
+                        stats["updated_forms"] += 1
+                    continue
+
+                self._skip(
+                    changes, stats,
+                    entity="forms",
+                    label=f"VerbForm ({tense_name}, {pronoun_value})",
+                    current=vf.form,
+                    incoming=form_value,
+                    debug=debug,
+                )
 
-                        if vf_created:
-                            created_forms += 1
-                            continue
+        translations = item.get("translations")
+        if translations is not None:
+            if not isinstance(translations, dict):
+                raise CommandError(
+                    f"Invalid verb entry '{infinitive}': 'translations' must be an object (language_code -> translation)"
+                )
 
-                        if force:
-                            if vf.form != form_value:
-                                vf.form = form_value
-                                vf.save(update_fields=["form"])
-                                updated_forms += 1
-                            continue
+            for language_code, translation_value in translations.items():
+                language_code = str(language_code).strip()
+                if not language_code:
+                    raise CommandError(
+                        f"Invalid translation language_code for verb '{infinitive}': empty"
+                    )
+                if language_code not in self.allowed_language_codes:
+                    raise CommandError(
+                        f"Invalid translation language_code '{language_code}' for verb '{infinitive}'. "
+                        f"Allowed: {sorted(self.allowed_language_codes)}"
+                    )
+                translation_value = "" if translation_value is None else str(translation_value).strip()
+                if not translation_value:
+                    raise CommandError(
+                        f"Empty translation for verb '{infinitive}', language '{language_code}'"
+                    )
 
-                        if not vf.form:
-                            vf.form = form_value
-                            vf.save(update_fields=["form"])
-                            updated_forms += 1
-                        else:
-                            skipped += 1
-                            if debug:
-                                self.stdout.write(
-                                    f"SKIP VerbForm for '{infinitive}' ({tense_name}, {pronoun_value}): already set ({vf.form})"
-                                )
-
-                translations = item.get("translations")
-                if translations is not None:
-                    if not isinstance(translations, dict):
-                        raise CommandError(
-                            f"Invalid verb entry '{infinitive}': 'translations' must be an object (language_code -> translation)"
-                        )
+                vt = existing_translations.get(language_code)
 
-                    for language_code, translation_value in translations.items():
-                        language_code = str(language_code).strip()
-                        if not language_code:
-                            raise CommandError(
-                                f"Invalid translation language_code for verb '{infinitive}': empty"
-                            )
-                        if language_code not in allowed_language_codes:
-                            raise CommandError(
-                                f"Invalid translation language_code '{language_code}' for verb '{infinitive}'. "
-                                f"Allowed: {sorted(allowed_language_codes)}"
-                            )
-                        translation_value = "" if translation_value is None else str(translation_value).strip()
-                        if not translation_value:
-                            raise CommandError(
-                                f"Empty translation for verb '{infinitive}', language '{language_code}'"
-                            )
-
-                        vt, vt_created = VerbTranslation.objects.get_or_create(
-                            verb=verb,
-                            language_code=language_code,
-                            defaults={"translation": translation_value},
-                        )
-                        if vt_created:
-                            created_translations += 1
-                            continue
-
-                        if force:
-                            if vt.translation != translation_value:
-                                vt.translation = translation_value
-                                vt.save(update_fields=["translation"])
-                                updated_translations += 1
-                            continue
-
-                        if not vt.translation:
-                            vt.translation = translation_value
+                if vt is None:
+                    vt = VerbTranslation(verb=verb, language_code=language_code, translation=translation_value)
+                    if not dry_run:
+                        vt.save()
+                    existing_translations[language_code] = vt
+                    stats["created_translations"] += 1
+                    changes["translations"].append(
+                        {"language_code": language_code, "action": "created", "new": translation_value}
+                    )
+                    continue
+
+                if force or not vt.translation:
+                    if vt.translation != translation_value:
+                        changes["translations"].append({
+                            "language_code": language_code,
+                            "action": "updated",
+                            "old": vt.translation,
+                            "new": translation_value,
+                        })
+                        vt.translation = translation_value
+                        if not dry_run:
                             vt.save(update_fields=["translation"])
-                            updated_translations += 1
-                        else:
-                            skipped += 1
-                            if debug:
-                                self.stdout.write(
-                                    f"SKIP VerbTranslation for '{infinitive}' ({language_code}): already set ({vt.translation})"
-                                )
-
-                if verb_changed:
-                    verb.save()
-                    updated_verbs += 1
-
-        self.stdout.write(
-            "\n".join(
-                [
-                    f"Imported from: {json_path}",
-                    f"Verbs: created={created_verbs}, updated={updated_verbs}",
-                    f"Forms: created={created_forms}, updated={updated_forms}",
-                    f"Translations: created={created_translations}, updated={updated_translations}",
-                    f"Skipped={skipped} (use --debug for details)",
-                ]
-            )
-        )
+                        stats["updated_translations"] += 1
+                    continue
+
+                self._skip(
+                    changes, stats,
+                    entity="translations",
+                    label=f"VerbTranslation ({language_code})",
+                    current=vt.translation,
+                    incoming=translation_value,
+                    debug=debug,
+                )
+
+        if changes["fields"]:
+            if not dry_run:
+                verb.save()
+            if not verb_created:
+                stats["updated_verbs"] += 1
+                changes["verb"] = "updated"
+        elif children_before != [stats[key] for key in self.CHILD_COUNTERS]:
+            if not verb_created:
+                changes["verb"] = "children_changed"
+                if not dry_run:
+                    # Формы/переводы изменились — двигаем updated_at, чтобы dump_verbs --updated-since их увидел
+                    Verb.objects.filter(pk=verb.pk).update(updated_at=timezone.now())
+
+        return changes
@@ -0,0 +1,15 @@
+# python manage.py prune_progress_tombstones
+# удаляет следы удалённого прогресса старше ProgressSyncService.TOMBSTONE_RETENTION
+# клиенты с более старым курсором получают reset=true и синхронизируются заново
+
+from django.core.management.base import BaseCommand
+
+from src.personal_forms.services import ProgressSyncService
+
+
+class Command(BaseCommand):
+    help = "Delete progress tombstones older than the delta-sync retention period."
+
+    def handle(self, *args, **options):
+        deleted = ProgressSyncService().prune_tombstones()
+        self.stdout.write(f"Tombstones deleted: {deleted}")
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0010_alter_verbform_pronoun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='verb',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, verbose_name='Aktualisiert am'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-19 05:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0011_verb_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file_path', models.CharField(max_length=500, unique=True, verbose_name='Dateipfad')),
+                ('file_hash', models.CharField(help_text='SHA-256 des Dateiinhalts beim letzten Lauf', max_length=64, verbose_name='Datei-Hash')),
+                ('file_size', models.PositiveBigIntegerField(verbose_name='Dateigröße')),
+                ('total_entries', models.PositiveIntegerField(verbose_name='Einträge gesamt')),
+                ('offset', models.PositiveIntegerField(default=0, help_text='Anzahl der Einträge bis zum letzten erfolgreich gespeicherten Block', verbose_name='Verarbeitete Einträge')),
+                ('completed', models.BooleanField(default=False, verbose_name='Abgeschlossen')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Erstellt am')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Aktualisiert am')),
+            ],
+            options={
+                'verbose_name': 'Import-Checkpoint',
+                'verbose_name_plural': 'Import-Checkpoints',
+            },
+        ),
+    ]
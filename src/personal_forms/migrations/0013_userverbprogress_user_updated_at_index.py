@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-19 05:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0012_importcheckpoint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userverbprogress',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='personal_fo_user_id_0b24dc_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 05:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0013_userverbprogress_user_updated_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('progress_id', models.BigIntegerField(verbose_name='Fortschritts-ID')),
+                ('verb_id', models.BigIntegerField(verbose_name='Verb-ID')),
+                ('skill_type', models.CharField(choices=[('translation', 'Übersetzung'), ('praesens', 'Präsens'), ('praeteritum', 'Präteritum'), ('perfekt', 'Perfekt')], max_length=20, verbose_name='Fähigkeit')),
+                ('pronoun', models.CharField(blank=True, max_length=20, null=True, verbose_name='Pronomen')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='Gelöscht am')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_tombstones', to=settings.AUTH_USER_MODEL, verbose_name='Benutzer')),
+            ],
+            options={
+                'verbose_name': 'Gelöschter Verbfortschritt',
+                'verbose_name_plural': 'Gelöschte Verbfortschritte',
+                'indexes': [models.Index(fields=['user', 'deleted_at'], name='personal_fo_user_id_5a13cb_idx')],
+            },
+        ),
+    ]
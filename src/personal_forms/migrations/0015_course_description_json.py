@@ -0,0 +1,74 @@
+# Course.description: JSON-строка в TextField -> JSONField + предпосчитанные превью по языкам.
+# Через новое поле, а не AlterField: в старых строках может лежать обычный текст, который не приводится к jsonb.
+
+import json
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _parse(raw):
+    try:
+        data = json.loads(raw or "{}")
+    except ValueError:
+        data = raw
+    if isinstance(data, dict):
+        return {str(lang): str(text) for lang, text in data.items() if text}
+    return {settings.LANGUAGE_CODE: str(data)} if data else {}
+
+
+def _previews(data):
+    # Копия Course.build_previews на момент миграции: у исторической модели нет методов
+    previews = {}
+    for lang, _name in settings.LANGUAGES:
+        text = data.get(lang) or data.get(settings.LANGUAGE_CODE) or next(iter(data.values()), "")
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        previews[lang] = "\n".join(lines[:2])
+    return previews
+
+
+def forwards(apps, schema_editor):
+    Course = apps.get_model("personal_forms", "Course")
+    courses = list(Course.objects.only("id", "description"))
+    for course in courses:
+        course.description_json = _parse(course.description)
+        course.description_previews = _previews(course.description_json)
+    Course.objects.bulk_update(courses, ["description_json", "description_previews"], batch_size=500)
+
+
+def backwards(apps, schema_editor):
+    Course = apps.get_model("personal_forms", "Course")
+    courses = list(Course.objects.only("id", "description_json"))
+    for course in courses:
+        course.description = json.dumps(course.description_json or {}, ensure_ascii=False)
+    Course.objects.bulk_update(courses, ["description"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0014_progresstombstone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='description_json',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Beschreibung'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='description_previews',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Beschreibungsvorschau'),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(
+            model_name='course',
+            name='description',
+        ),
+        migrations.RenameField(
+            model_name='course',
+            old_name='description_json',
+            new_name='description',
+        ),
+    ]
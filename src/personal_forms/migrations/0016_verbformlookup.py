@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-19 06:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('personal_forms', '0015_course_description_json'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VerbFormLookup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tense', models.CharField(choices=[('Präsens', 'Präsens'), ('Präteritum', 'Präteritum'), ('Perfekt', 'Perfekt')], max_length=15, verbose_name='Zeitform')),
+                ('pronoun', models.CharField(blank=True, choices=[('ich', 'ich'), ('du', 'du'), ('er/sie/es', 'er/sie/es'), ('wir', 'wir'), ('ihr', 'ihr'), ('sie', 'sie/Sie')], max_length=20, null=True, verbose_name='Pronomen')),
+                ('form', models.CharField(max_length=80, verbose_name='Form')),
+                ('normalized', models.CharField(db_index=True, max_length=80, verbose_name='Normalisierte Form')),
+                ('source', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lookups', to='personal_forms.verbform', verbose_name='Personalform')),
+                ('verb', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='form_lookups', to='personal_forms.verb', verbose_name='Verb')),
+            ],
+            options={
+                'verbose_name': 'Formindex-Eintrag',
+                'verbose_name_plural': 'Formindex',
+            },
+        ),
+    ]
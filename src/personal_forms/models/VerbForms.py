@@ -59,6 +59,8 @@ class Verb(models.Model):
         null=True)  # 'haben' oder 'sein'
     participle_ii = models.CharField(_("Partizip 2"),max_length=50, blank=True, null=True)  # Beispel 'gegangen'
 
+    updated_at = models.DateTimeField(_("Aktualisiert am"), auto_now=True, db_index=True)
+
     class Meta:
         verbose_name = _("Verb")
         verbose_name_plural = _("Verben")
@@ -97,6 +99,50 @@ class VerbForm(models.Model):
         return f"{self.verb.infinitive} - {self.tense} - {self.pronoun}: {self.form}"
 
 
+class VerbFormLookup(models.Model):
+    """
+    Обратный индекс: нормализованная форма -> (глагол, время, лицо).
+    Строки Präsens/Präteritum повторяют VerbForm (source), Perfekt генерируется
+    из auxiliary + participle_ii; строка без лица — голое Partizip II.
+    Заполняется FormLookupService (сигналы + команда build_form_index).
+    """
+    verb = models.ForeignKey(
+        Verb,
+        on_delete=models.CASCADE,
+        related_name="form_lookups",
+        verbose_name=_("Verb")
+    )
+    source = models.ForeignKey(
+        VerbForm,
+        on_delete=models.CASCADE,
+        related_name="lookups",
+        blank=True,
+        null=True,
+        verbose_name=_("Personalform")
+    )  # NULL — сгенерированная строка Perfekt
+    tense = models.CharField(
+        _("Zeitform"),
+        max_length=15,
+        choices=Tense.choices(),
+    )
+    pronoun = models.CharField(
+        _("Pronomen"),
+        max_length=20,
+        choices=Pronoun.choices,
+        blank=True,
+        null=True,
+    )
+    form = models.CharField(_("Form"), max_length=80)
+    normalized = models.CharField(_("Normalisierte Form"), max_length=80, db_index=True)
+
+    class Meta:
+        verbose_name = _("Formindex-Eintrag")
+        verbose_name_plural = _("Formindex")
+
+    def __str__(self):
+        return f"{self.form} -> {self.verb_id} {self.tense} {self.pronoun or '-'}"
+
+
 class VerbTranslation(models.Model):
     verb = models.ForeignKey(
         Verb,
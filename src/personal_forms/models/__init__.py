@@ -1,8 +1,10 @@
-from src.personal_forms.models.VerbForms import VerbForm, Verb, VerbTranslation, VerbPreposition, Preposition
-from src.personal_forms.models.learning import LearningUnit, UserVerbProgress, Course, VerbGroup
+from src.personal_forms.models.VerbForms import VerbForm, VerbFormLookup, Verb, VerbTranslation, VerbPreposition, Preposition
+from src.personal_forms.models.learning import LearningUnit, UserVerbProgress, Course, VerbGroup, ProgressTombstone
+from src.personal_forms.models.imports import ImportCheckpoint
 
 __all__ = [
     "VerbForm",
+    "VerbFormLookup",
     "Verb",
     "VerbTranslation",
     "VerbPreposition",
@@ -11,4 +13,6 @@ __all__ = [
     "UserVerbProgress",
     "Course",
     "VerbGroup",
+    "ProgressTombstone",
+    "ImportCheckpoint",
 ]
@@ -0,0 +1,29 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ImportCheckpoint(models.Model):
+    """Состояние долгого импорта: сколько записей файла уже закоммичено"""
+    file_path = models.CharField(_("Dateipfad"), max_length=500, unique=True)
+    file_hash = models.CharField(
+        _("Datei-Hash"),
+        max_length=64,
+        help_text=_("SHA-256 des Dateiinhalts beim letzten Lauf"),
+    )
+    file_size = models.PositiveBigIntegerField(_("Dateigröße"))
+    total_entries = models.PositiveIntegerField(_("Einträge gesamt"))
+    offset = models.PositiveIntegerField(
+        _("Verarbeitete Einträge"),
+        default=0,
+        help_text=_("Anzahl der Einträge bis zum letzten erfolgreich gespeicherten Block"),
+    )
+    completed = models.BooleanField(_("Abgeschlossen"), default=False)
+    created_at = models.DateTimeField(_("Erstellt am"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("Aktualisiert am"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Import-Checkpoint")
+        verbose_name_plural = _("Import-Checkpoints")
+
+    def __str__(self):
+        return f"{self.file_path}: {self.offset}/{self.total_entries}"
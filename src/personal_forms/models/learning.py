@@ -1,5 +1,4 @@
 import uuid
-import json
 
 from django.conf import settings
 from django.db import models
@@ -99,11 +98,19 @@ class Course(models.Model):
         verbose_name=_("Kurstitel"),
         max_length=200,
     )
-    description = models.TextField(
+    # {"de": "...", "ru": "..."} — текст описания по языкам
+    description = models.JSONField(
         verbose_name=_("Beschreibung"),
-        default='{}',
+        default=dict,
         blank=True,
     )
+    # Превью (первые две строки) для каждого языка из LANGUAGES, с учётом fallback; считается в save()
+    description_previews = models.JSONField(
+        verbose_name=_("Beschreibungsvorschau"),
+        default=dict,
+        blank=True,
+        editable=False,
+    )
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -146,37 +153,49 @@ class Course(models.Model):
 
     def is_accessible_by(self, user):
         """Check if user can access this course."""
-        if self.author == user:
+        if self.author_id == user.pk:
             return True
         if self.visibility == self.Visibility.PUBLIC:
             return user.role == 'student'
         if self.visibility == self.Visibility.PRIVATE:
-            return self.assigned_students.filter(id=user.id).exists()
+            # Кешированное множество доступных курсов вместо запроса на каждую проверку
+            from src.personal_forms.services import CourseAccessService
+            return self.pk in CourseAccessService().get_course_ids(user)
         return False
 
+    def save(self, *args, **kwargs):
+        self.description_previews = self.build_previews(self.description)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "description" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "description_previews"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def pick_language(data, lang):
+        """Текст на языке lang или на языке по умолчанию / первом доступном"""
+        if not isinstance(data, dict):
+            return data or ""
+        return data.get(lang) or data.get(settings.LANGUAGE_CODE) or next(iter(data.values()), "")
+
+    @classmethod
+    def build_previews(cls, description):
+        """Первые две непустые строки описания — для каждого языка интерфейса"""
+        previews = {}
+        for lang, _name in settings.LANGUAGES:
+            text = cls.pick_language(description, lang)
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+            previews[lang] = "\n".join(lines[:2])
+        return previews
+
     @property
     def translated_description(self):
         """Возвращает описание на текущем языке пользователя или на английском/первом доступном"""
-        try:
-            data = json.loads(self.description)
-        except (ValueError, TypeError):
-            return self.description  # Если в базе не JSON, возвращаем как есть
-
-        curr_lang = get_language()
-        return data.get(curr_lang) or data.get(settings.LANGUAGE_CODE) or next(iter(data.values()), "")
+        return self.pick_language(self.description, get_language())
 
     @property
     def description_preview(self):
-        """Возвращает первые две непустые строки описания"""
-        text = self.translated_description
-        if not text:
-            return ""
-
-        # Разрезаем текст на строки, убираем лишние пробелы и пустые строки
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-
-        # Берем только первые две строки и соединяем их обратно
-        return "\n".join(lines[:2])
+        """Возвращает первые две непустые строки описания (посчитаны при сохранении)"""
+        return self.description_previews.get(get_language()) or ""
 
 class UserVerbProgress(models.Model):
     user = models.ForeignKey(
@@ -260,6 +279,8 @@ class UserVerbProgress(models.Model):
             models.Index(fields=["user", "skill_type"]),
             models.Index(fields=["user", "mastered"]),
             models.Index(fields=["user", "verb", "skill_type", "pronoun"]),
+            # keyset-пагинация API: WHERE user = ? AND (updated_at, id) > (?, ?)
+            models.Index(fields=["user", "updated_at", "id"]),
         ]
 
     def __str__(self):
@@ -267,3 +288,43 @@ class UserVerbProgress(models.Model):
             f"{self.user} | {self.verb.infinitive} | "
             f"{self.skill_type} | {self.pronoun or '-'}"
         )
+
+
+class ProgressTombstone(models.Model):
+    """
+    След удалённой записи UserVerbProgress для дельта-синхронизации (/api/verb-progress/changes/).
+    Хранится ограниченное время (SyncService.TOMBSTONE_RETENTION), потом клиент делает полную синхронизацию.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="progress_tombstones",
+        verbose_name=_("Benutzer"),
+    )
+    progress_id = models.BigIntegerField(verbose_name=_("Fortschritts-ID"))
+    verb_id = models.BigIntegerField(verbose_name=_("Verb-ID"))
+    skill_type = models.CharField(
+        max_length=20,
+        choices=SkillType.choices,
+        verbose_name=_("Fähigkeit"),
+    )
+    pronoun = models.CharField(
+        max_length=20,
+        blank=True,
+        null=True,
+        verbose_name=_("Pronomen"),
+    )
+    deleted_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Gelöscht am"),
+    )
+
+    class Meta:
+        verbose_name = _("Gelöschter Verbfortschritt")
+        verbose_name_plural = _("Gelöschte Verbfortschritte")
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} | {self.progress_id} | {self.deleted_at}"
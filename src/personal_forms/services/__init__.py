@@ -5,10 +5,20 @@
 # │   ├── translation.py
 # │   ├── conjugation.py
 # │   └── perfekt.py
+# ├── morphology/            # Генерация форм по правилам (без БД)
+# │   ├── weak_verbs.py      # Präsens/Präteritum слабых глаголов
+# │   └── participle.py      # Partizip II + Hilfsverb для Perfekt
 # ├── training_engine.py      # Выбор следующего слова (Engine)
 # ├── training_service.py     # Оркестратор процесса
 # ├── card_factory.py         # Сборка карточки из резолверов
 # ├── progress_service.py     # Запись ответов в БД + сброс кеша
+# ├── version_service.py      # Штампы версий для ETag / кеша ответов
+# ├── sync_service.py         # Дельта-синхронизация прогресса (changes + tombstones)
+# ├── unit_pack_service.py    # Офлайн-пакет юнита (gzip + ETag по содержимому)
+# ├── course_access_service.py  # Кешированное множество доступных пользователю курсов
+# ├── verb_search_service.py  # Индекс автодополнения инфинитивов (префиксы + триграммы)
+# ├── form_lookup_service.py  # Обратный поиск: спряжённая форма -> (глагол, время, лицо)
+# ├── class_progress_export_service.py  # Строки выгрузки прогресса класса (CSV/XLSX учителя)
 # └── learning_unit_progress_service.py  # (Для UI) Показ общей статистики
 
 from src.personal_forms.services.learning_unit_progress_service import LearningUnitProgressService
@@ -17,6 +27,13 @@ from src.personal_forms.services.training_engine import CachedTrainingEngine
 from src.personal_forms.services.training_service import TrainingService
 from src.personal_forms.services.card_factory import CardFactory
 from src.personal_forms.services.resolvers.registry import SKILL_RESOLVERS
+from src.personal_forms.services.version_service import ContentVersionService
+from src.personal_forms.services.sync_service import ProgressSyncService
+from src.personal_forms.services.unit_pack_service import UnitPackService
+from src.personal_forms.services.course_access_service import CourseAccessService
+from src.personal_forms.services.verb_search_service import VerbSearchService
+from src.personal_forms.services.form_lookup_service import FormLookupService
+from src.personal_forms.services.class_progress_export_service import ClassProgressExportService
 
 __all__ = [
     "LearningUnitProgressService",
@@ -25,4 +42,11 @@ __all__ = [
     "TrainingService",
     "CardFactory",
     "SKILL_RESOLVERS",
+    "ContentVersionService",
+    "ProgressSyncService",
+    "UnitPackService",
+    "CourseAccessService",
+    "VerbSearchService",
+    "FormLookupService",
+    "ClassProgressExportService",
 ]
\ No newline at end of file
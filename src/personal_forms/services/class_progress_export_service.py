@@ -0,0 +1,100 @@
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Tuple
+
+from django.utils.translation import gettext as _
+
+from src.personal_forms.models import Course, LearningUnit, UserVerbProgress
+from src.personal_forms.services.learning_unit_progress_service import LearningUnitProgressService
+
+
+class ClassProgressExportService:
+    """
+    Прогресс учеников по курсу для выгрузки: строка на (ученик, юнит) или на (ученик, атом).
+    Фиксированное число запросов при любом размере класса: юниты + глаголы наборов,
+    ученики и их прогресс — двумя курсорами (.iterator()), отсортированными по id ученика,
+    которые идут параллельно (merge join). В памяти — прогресс одного ученика.
+    """
+
+    CHUNK_SIZE = 2000
+    PROGRESS_FIELDS = (
+        "user_id", "verb_id", "skill_type", "pronoun",
+        "mastered", "correct_count", "wrong_count", "streak", "last_answer_at",
+    )
+
+    def header(self, atoms: bool = False) -> List[str]:
+        # Вызывать до начала потока: строки переводятся по языку запроса
+        student = [_("Benutzername"), _("Name")]
+        if atoms:
+            return student + [
+                _("Lektion"), _("Fähigkeit"), _("Verb"), _("Pronomen"),
+                _("Richtig"), _("Falsch"), _("Serie"), _("Gelernt"), _("Letzte Antwort"),
+            ]
+        return student + [
+            _("Nr."), _("Lektion"), _("Niveau"), _("Fähigkeit"),
+            _("Gelernt"), _("Gesamt"), _("Fortschritt (%)"), _("Abgeschlossen"),
+        ]
+
+    def iter_rows(self, course: Course, students, atoms: bool = False) -> Iterator[list]:
+        """students — queryset учеников; строки без заголовка"""
+        units = list(
+            LearningUnit.objects.filter(course=course)
+            .select_related("verb_group")
+            .prefetch_related("verb_group__verbs")
+            .order_by("order")
+        )
+        unit_atoms = [(unit, LearningUnitProgressService.generate_atoms(unit)) for unit in units]
+        infinitives = {verb.pk: verb.infinitive for unit in units for verb in unit.verbs.all()}
+
+        students = students.order_by("id")
+        progress = (
+            UserVerbProgress.objects
+            .filter(user__in=students.values("id"), verb_id__in=list(infinitives))
+            .order_by("user_id")
+            .values(*self.PROGRESS_FIELDS)
+        )
+        groups = groupby(progress.iterator(chunk_size=self.CHUNK_SIZE), key=itemgetter("user_id"))
+        pending = next(groups, None)
+
+        for student in students.iterator(chunk_size=self.CHUNK_SIZE):
+            # Обе выборки упорядочены по id ученика: догоняем курсор прогресса до текущего ученика
+            while pending is not None and pending[0] < student.pk:
+                pending = next(groups, None)
+            lookup: Dict[Tuple, dict] = {}
+            if pending is not None and pending[0] == student.pk:
+                lookup = {(row["verb_id"], row["skill_type"], row["pronoun"]): row for row in pending[1]}
+                pending = next(groups, None)
+
+            prefix = [student.username, student.display_name]
+            if atoms:
+                yield from self._atom_rows(prefix, unit_atoms, infinitives, lookup)
+            else:
+                yield from self._unit_rows(prefix, unit_atoms, lookup)
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _unit_rows(prefix, unit_atoms, lookup) -> Iterator[list]:
+        for unit, unit_atom_list in unit_atoms:
+            total = len(unit_atom_list)
+            mastered = sum(
+                1 for atom in unit_atom_list
+                if lookup.get((atom.verb_id, atom.skill_type, atom.pronoun), {}).get("mastered")
+            )
+            percent = int((mastered / total) * 100) if total else 0
+            yield prefix + [
+                unit.order, unit.title, unit.level, unit.get_skill_type_display(),
+                mastered, total, percent, mastered == total and total > 0,
+            ]
+
+    @staticmethod
+    def _atom_rows(prefix, unit_atoms, infinitives, lookup) -> Iterator[list]:
+        for unit, unit_atom_list in unit_atoms:
+            skill = unit.get_skill_type_display()
+            for atom in unit_atom_list:
+                row = lookup.get((atom.verb_id, atom.skill_type, atom.pronoun), {})
+                yield prefix + [
+                    unit.title, skill, infinitives[atom.verb_id], atom.pronoun or "",
+                    row.get("correct_count", 0), row.get("wrong_count", 0), row.get("streak", 0),
+                    bool(row.get("mastered")), row.get("last_answer_at"),
+                ]
@@ -0,0 +1,50 @@
+from typing import FrozenSet, Iterable
+
+from django.core.cache import cache
+
+from src.personal_forms.models import Course
+from src.personal_forms.services.version_service import ContentVersionService
+
+
+class CourseAccessService:
+    """
+    Множество id курсов, доступных пользователю: публичные + назначенные ему + свои.
+    Вместо OR по JOIN с assigned_students и distinct() — одно чтение кеша и pk__in по первичному ключу.
+    Ключ содержит свою версию доступа, а не версию каталога: её меняет только сохранение/удаление курса
+    (видимость, автор — signals.py), правки юнитов и глаголов множества не сбрасывают;
+    назначение учеников сбрасывает ключи только затронутых пользователей (m2m_changed).
+    """
+
+    CACHE_KEY = "course_access:{user_id}:{version}"
+    CACHE_TTL = 60 * 60
+
+    # --------------------------------------------------
+
+    def get_course_ids(self, user) -> FrozenSet:
+        key = self._key(user.pk)
+        course_ids = cache.get(key)
+        if course_ids is None:
+            course_ids = frozenset(
+                Course.objects.filter(visibility=Course.Visibility.PUBLIC).values_list("id", flat=True).union(
+                    Course.assigned_students.through.objects.filter(user_id=user.pk).values_list("course_id", flat=True),
+                    Course.objects.filter(author_id=user.pk).values_list("id", flat=True),
+                )
+            )
+            cache.set(key, course_ids, self.CACHE_TTL)
+        return course_ids
+
+    def filter_accessible(self, queryset, user):
+        """queryset курсов -> только доступные пользователю"""
+        return queryset.filter(pk__in=self.get_course_ids(user))
+
+    def invalidate_users(self, user_ids: Iterable) -> None:
+        cache.delete_many([self._key(user_id) for user_id in user_ids])
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return CourseAccessService.CACHE_KEY.format(
+            user_id=user_id,
+            version=ContentVersionService().get_course_access_version(),
+        )
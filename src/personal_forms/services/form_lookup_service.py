@@ -0,0 +1,139 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+
+from src.common.choices import AuxiliaryConjugation, AuxiliaryVerb, Pronoun, Tense, normalize_enum
+from src.personal_forms.models import Verb, VerbForm, VerbFormLookup
+from src.personal_forms.services.verb_search_service import fold
+
+# "er hat gemacht", "sie/Sie sind gegangen": ведущее личное местоимение отбрасывается
+LEADING_PRONOUN = re.compile(r"^(ich|du|er|sie|es|wir|ihr)(/(sie|es))*\s+")
+
+
+def normalize_form(text: str) -> str:
+    """Ключ индекса: fold() + схлопнутые пробелы"""
+    return " ".join(fold(text).split())
+
+
+class FormLookupService:
+    """
+    Обратный поиск спряжённой формы: "ging" -> (gehen, Präteritum, ich / er/sie/es).
+    Поиск — равенство по индексированной колонке normalized, без прохода по VerbForm.
+    """
+
+    BATCH_SIZE = 500
+
+    def lookup(self, query: str, limit: int = 50) -> List[Dict]:
+        needle = normalize_form(query)
+        if not needle:
+            return []
+        needles = {needle, LEADING_PRONOUN.sub("", needle)}
+
+        rows = (
+            VerbFormLookup.objects
+            .filter(normalized__in=needles)
+            .order_by("verb__infinitive", "tense", "pronoun")
+            .values("verb_id", "verb__infinitive", "tense", "pronoun", "form")[:limit]
+        )
+        return [
+            {
+                "verb_id": row["verb_id"],
+                "infinitive": row["verb__infinitive"],
+                "tense": row["tense"],
+                "pronoun": row["pronoun"],
+                "form": row["form"],
+            }
+            for row in rows
+        ]
+
+    # --------------------------------------------------
+    # Построение индекса
+
+    @staticmethod
+    def _entry(verb_id, tense: Tense, pronoun: Optional[str], form: str, source_id=None) -> VerbFormLookup:
+        return VerbFormLookup(
+            verb_id=verb_id,
+            source_id=source_id,
+            tense=tense.value,
+            pronoun=pronoun,
+            form=form,
+            normalized=normalize_form(form),
+        )
+
+    def build_form_entry(self, verb_form: VerbForm) -> Optional[VerbFormLookup]:
+        tense = normalize_enum(verb_form.tense, Tense)
+        if tense is None or not verb_form.form:
+            return None
+        return self._entry(verb_form.verb_id, tense, verb_form.pronoun, verb_form.form, verb_form.pk)
+
+    def build_perfekt_entries(self, verb_id, auxiliary, participle_ii) -> List[VerbFormLookup]:
+        """"bin gegangen" ... "sind gegangen" + "gegangen" без лица"""
+        auxiliary = normalize_enum(auxiliary, AuxiliaryVerb)
+        if auxiliary is None or not participle_ii:
+            return []
+        entries = [
+            self._entry(verb_id, Tense.PERFEKT, pronoun.value,
+                        f"{AuxiliaryConjugation.get(auxiliary, pronoun)} {participle_ii}")
+            for pronoun in Pronoun
+        ]
+        entries.append(self._entry(verb_id, Tense.PERFEKT, None, participle_ii))
+        return entries
+
+    def sync_form(self, verb_form: VerbForm):
+        """post_save VerbForm: одна строка индекса на форму (удаление — каскадом по source)"""
+        entry = self.build_form_entry(verb_form)
+        if entry is None:
+            VerbFormLookup.objects.filter(source=verb_form).delete()
+            return
+        VerbFormLookup.objects.update_or_create(
+            source=verb_form,
+            defaults={
+                "verb_id": entry.verb_id,
+                "tense": entry.tense,
+                "pronoun": entry.pronoun,
+                "form": entry.form,
+                "normalized": entry.normalized,
+            },
+        )
+
+    def sync_perfekt(self, verb: Verb):
+        """post_save Verb: пересобрать сгенерированные строки Perfekt"""
+        with transaction.atomic():
+            VerbFormLookup.objects.filter(verb=verb, source__isnull=True).delete()
+            VerbFormLookup.objects.bulk_create(
+                self.build_perfekt_entries(verb.pk, verb.auxiliary, verb.participle_ii)
+            )
+
+    def rebuild_verbs(self, verb_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Полная пересборка для глаголов (None — для всех).
+        Нужна после bulk_create/bulk_update, которые не шлют сигналы.
+        """
+        verbs = Verb.objects.order_by("pk")
+        if verb_ids is not None:
+            verbs = verbs.filter(pk__in=list(verb_ids))
+
+        created = 0
+        last_pk = 0
+        while True:
+            chunk = list(
+                verbs.filter(pk__gt=last_pk).values("pk", "auxiliary", "participle_ii")[: self.BATCH_SIZE]
+            )
+            if not chunk:
+                return created
+            last_pk = chunk[-1]["pk"]
+            chunk_ids = [row["pk"] for row in chunk]
+
+            entries = []
+            for row in chunk:
+                entries.extend(self.build_perfekt_entries(row["pk"], row["auxiliary"], row["participle_ii"]))
+            for verb_form in VerbForm.objects.filter(verb_id__in=chunk_ids).only("pk", "verb_id", "tense", "pronoun", "form"):
+                entry = self.build_form_entry(verb_form)
+                if entry is not None:
+                    entries.append(entry)
+
+            with transaction.atomic():
+                VerbFormLookup.objects.filter(verb_id__in=chunk_ids).delete()
+                VerbFormLookup.objects.bulk_create(entries, batch_size=1000)
+            created += len(entries)
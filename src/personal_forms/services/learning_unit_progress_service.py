@@ -130,13 +130,32 @@ class LearningUnitProgressService:
             total_wrong=Sum('wrong_count', default=0),
         )
 
-        total_ans = stats['total_correct'] + stats['total_wrong']
-        accuracy = round((stats['total_correct'] / total_ans) * 100, 1) if total_ans > 0 else 0
+        return self._build_global_stats(stats['total_mastered'], stats['total_correct'], stats['total_wrong'])
 
+    def get_global_stats_bulk(self, user_ids: List) -> Dict:
+        """
+        get_global_stats для многих пользователей одним GROUP BY: {user_id: stats}.
+        """
+        rows = UserVerbProgress.objects.filter(user_id__in=user_ids).values('user_id').annotate(
+            total_mastered=Count('id', filter=Q(mastered=True)),
+            total_correct=Sum('correct_count', default=0),
+            total_wrong=Sum('wrong_count', default=0),
+        )
+        result = {user_id: self._build_global_stats(0, 0, 0) for user_id in user_ids}
+        for row in rows:
+            result[row['user_id']] = self._build_global_stats(
+                row['total_mastered'], row['total_correct'], row['total_wrong']
+            )
+        return result
+
+    @staticmethod
+    def _build_global_stats(total_mastered: int, total_correct: int, total_wrong: int) -> Dict:
+        total_ans = total_correct + total_wrong
+        accuracy = round((total_correct / total_ans) * 100, 1) if total_ans > 0 else 0
         return {
-            "total_mastered": stats['total_mastered'],
-            "total_correct": stats['total_correct'],
-            "total_wrong": stats['total_wrong'],
+            "total_mastered": total_mastered,
+            "total_correct": total_correct,
+            "total_wrong": total_wrong,
             "accuracy": accuracy
         }
 
@@ -144,18 +163,50 @@ class LearningUnitProgressService:
         """
         Эффективный расчет прогресса для списка уроков (без N+1 запросов).
         """
-        # 1. Получаем ВЕСЬ прогресс пользователя одним запросом
-        all_user_progress = UserVerbProgress.objects.filter(user=user).values(
-            'verb_id', 'skill_type', 'pronoun', 'mastered'
-        )
+        return self._build_units_overview(units, self._load_progress_lookup(user))
+
+    def get_courses_overview(self, user: User, courses: List) -> List[Dict]:
+        """
+        Прогресс пользователя по нескольким курсам:
+        один запрос прогресса + один запрос юнитов (с наборами глаголов), независимо от числа курсов.
+        Возвращает [{"course", "units": <get_units_overview>, "percent": средний %, "unit_count"}]
+        в порядке courses.
+        """
+        courses = list(courses)
+        units_by_course: Dict = {course.pk: [] for course in courses}
+        units = LearningUnit.objects.filter(course__in=courses).select_related(
+            'verb_group'
+        ).prefetch_related('verb_group__verbs').order_by('order')
+        for unit in units:
+            units_by_course[unit.course_id].append(unit)
+
+        progress_lookup = self._load_progress_lookup(user)
+
+        result = []
+        for course in courses:
+            overview = self._build_units_overview(units_by_course[course.pk], progress_lookup)
+            # Средний процент по курсу
+            total_pct = sum(u['percent'] for u in overview)
+            result.append({
+                "course": course,
+                "units": overview,
+                "percent": int(total_pct / len(overview)) if overview else 0,
+                "unit_count": len(overview),
+            })
+        return result
 
-        # 2. Группируем прогресс по типу навыка для быстрого поиска
+    @staticmethod
+    def _load_progress_lookup(user: User) -> Dict[Tuple, bool]:
+        # ВЕСЬ прогресс пользователя одним запросом
         # Ключ: (verb_id, skill_type, pronoun)
-        progress_lookup = {
+        return {
             (p['verb_id'], p['skill_type'], p['pronoun']): p['mastered']
-            for p in all_user_progress
+            for p in UserVerbProgress.objects.filter(user=user).values(
+                'verb_id', 'skill_type', 'pronoun', 'mastered'
+            )
         }
 
+    def _build_units_overview(self, units: List[LearningUnit], progress_lookup: Dict[Tuple, bool]) -> List[Dict]:
         overview = []
         for unit in units:
             # Для каждого юнита генерируем его "атомы"
@@ -182,4 +233,4 @@ class LearningUnitProgressService:
                 "completed": mastered_count == total_atoms and total_atoms > 0
             })
 
-        return overview
\ No newline at end of file
+        return overview
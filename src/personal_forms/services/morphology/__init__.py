@@ -0,0 +1,18 @@
+from src.personal_forms.services.morphology.weak_verbs import (
+    WeakVerbConjugator,
+    split_separable_prefix,
+    extract_stem,
+)
+from src.personal_forms.services.morphology.participle import (
+    ParticipleGenerator,
+    PerfektSuggestion,
+)
+
+
+__all__ = [
+    "WeakVerbConjugator",
+    "split_separable_prefix",
+    "extract_stem",
+    "ParticipleGenerator",
+    "PerfektSuggestion",
+]
@@ -0,0 +1,214 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from src.common.choices import AuxiliaryVerb, GermanCase, Reflexiv, VerbType, normalize_enum
+from src.personal_forms.exceptions import MorphologyError
+from src.personal_forms.services.morphology.weak_verbs import (
+    extract_stem,
+    needs_e_insertion,
+    split_separable_prefix,
+)
+
+
+# Неотделяемые приставки: Partizip II без ge- (besucht, verkauft, zerstört)
+INSEPARABLE_PREFIXES = ("be", "emp", "ent", "er", "ge", "miss", "ver", "zer")
+
+# Могут быть и отделяемыми (übersetzen: übersetzt / übergesetzt) — результат помечается на проверку
+AMBIGUOUS_PREFIXES = ("durch", "hinter", "über", "um", "unter", "voll", "wider", "wieder")
+
+# Partizip II сильных и смешанных глаголов. Производные (ver-, auf-...) выводятся из базового глагола,
+# целиком в таблице только те, чей базовый глагол не существует отдельно (beginnen, verlieren)
+IRREGULAR_PARTICIPLES = {
+    "backen": "gebacken", "befehlen": "befohlen", "beginnen": "begonnen", "beißen": "gebissen",
+    "bergen": "geborgen", "betrügen": "betrogen", "biegen": "gebogen", "bieten": "geboten",
+    "binden": "gebunden", "bitten": "gebeten", "blasen": "geblasen", "bleiben": "geblieben",
+    "braten": "gebraten", "brechen": "gebrochen", "brennen": "gebrannt", "bringen": "gebracht",
+    "denken": "gedacht", "dürfen": "gedurft", "empfehlen": "empfohlen", "erschrecken": "erschrocken",
+    "essen": "gegessen", "fahren": "gefahren", "fallen": "gefallen", "fangen": "gefangen",
+    "finden": "gefunden", "fliegen": "geflogen", "fliehen": "geflohen", "fließen": "geflossen",
+    "fressen": "gefressen", "frieren": "gefroren", "geben": "gegeben", "gehen": "gegangen",
+    "gelingen": "gelungen", "gelten": "gegolten", "genießen": "genossen", "geschehen": "geschehen",
+    "gewinnen": "gewonnen", "gießen": "gegossen", "gleichen": "geglichen", "gleiten": "geglitten",
+    "graben": "gegraben", "greifen": "gegriffen", "haben": "gehabt", "halten": "gehalten",
+    "hängen": "gehangen", "heben": "gehoben", "heißen": "geheißen", "helfen": "geholfen",
+    "kennen": "gekannt", "klingen": "geklungen", "kommen": "gekommen", "können": "gekonnt",
+    "kriechen": "gekrochen", "laden": "geladen", "lassen": "gelassen", "laufen": "gelaufen",
+    "leiden": "gelitten", "leihen": "geliehen", "lesen": "gelesen", "liegen": "gelegen",
+    "lügen": "gelogen", "meiden": "gemieden", "messen": "gemessen", "mögen": "gemocht",
+    "müssen": "gemusst", "nehmen": "genommen", "nennen": "genannt", "pfeifen": "gepfiffen",
+    "raten": "geraten", "reiben": "gerieben", "reißen": "gerissen", "reiten": "geritten",
+    "rennen": "gerannt", "riechen": "gerochen", "rufen": "gerufen", "saufen": "gesoffen",
+    "schaffen": "geschaffen", "scheiden": "geschieden", "scheinen": "geschienen",
+    "schieben": "geschoben", "schießen": "geschossen", "schlafen": "geschlafen",
+    "schlagen": "geschlagen", "schleichen": "geschlichen", "schließen": "geschlossen",
+    "schmeißen": "geschmissen", "schmelzen": "geschmolzen", "schneiden": "geschnitten",
+    "schreiben": "geschrieben", "schreien": "geschrien", "schweigen": "geschwiegen",
+    "schwimmen": "geschwommen", "schwören": "geschworen", "sehen": "gesehen", "sein": "gewesen",
+    "senden": "gesandt", "singen": "gesungen", "sinken": "gesunken", "sitzen": "gesessen",
+    "sollen": "gesollt", "sprechen": "gesprochen", "springen": "gesprungen", "stechen": "gestochen",
+    "stehen": "gestanden", "stehlen": "gestohlen", "steigen": "gestiegen", "sterben": "gestorben",
+    "stinken": "gestunken", "stoßen": "gestoßen", "streichen": "gestrichen", "streiten": "gestritten",
+    "tragen": "getragen", "treffen": "getroffen", "treiben": "getrieben", "treten": "getreten",
+    "trinken": "getrunken", "tun": "getan", "verderben": "verdorben", "vergessen": "vergessen",
+    "verlieren": "verloren", "verschwinden": "verschwunden", "verzeihen": "verziehen",
+    "wachsen": "gewachsen", "waschen": "gewaschen", "weisen": "gewiesen", "wenden": "gewandt",
+    "werben": "geworben", "werden": "geworden", "werfen": "geworfen", "wiegen": "gewogen",
+    "wissen": "gewusst", "wollen": "gewollt", "ziehen": "gezogen", "zwingen": "gezwungen",
+}
+
+# Немецкие (не заимствованные) глаголы на -ieren: ударение на корне, Partizip II с ge-
+# (geschmiert, geziert); сильные из них (frieren, verlieren) — в IRREGULAR_PARTICIPLES
+NATIVE_IEREN_VERBS = {"frieren", "gieren", "schmieren", "stieren", "verlieren", "zieren"}
+VOWELS = re.compile("[aeiouyäöü]")
+
+# Глаголы движения и изменения состояния с sein. Для производных с отделяемой приставкой
+# (ankommen, einschlafen) используется базовый глагол, с пометкой на проверку
+SEIN_VERBS = {
+    "begegnen", "bleiben", "eilen", "fahren", "fallen", "fliegen", "fliehen", "fließen", "folgen",
+    "gehen", "gelingen", "geschehen", "gleiten", "klettern", "kommen", "kriechen", "landen",
+    "laufen", "misslingen", "passieren", "reisen", "reiten", "rennen", "rollen", "schleichen",
+    "schmelzen", "schwimmen", "segeln", "sein", "sinken", "springen", "steigen", "sterben",
+    "stolpern", "treten", "verschwinden", "wachsen", "wandern", "werden", "ziehen",
+    "aufwachen", "einschlafen", "erscheinen", "entstehen", "erwachen", "verderben",
+}
+
+
+@dataclass
+class PerfektSuggestion:
+    infinitive: str
+    participle_ii: Optional[str] = None
+    auxiliary: Optional[str] = None
+    participle_source: str = ""  # override | rule | ieren
+    auxiliary_source: str = ""  # override | reflexive | accusative | prefix | default
+    needs_review: bool = False
+    error: str = ""
+    notes: List[str] = field(default_factory=list)
+
+
+def _split_inseparable(infinitive: str, prefixes: Iterable[str]) -> tuple[str, str]:
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        core = infinitive[len(prefix):]
+        if not infinitive.startswith(prefix) or len(core) < 4:
+            continue
+        try:
+            stem = extract_stem(core)
+        except MorphologyError:
+            continue
+        # bellen, ernten: после «приставки» должна остаться основа с гласной
+        if any(ch in "aeiouäöüy" for ch in stem):
+            return prefix, core
+    return "", infinitive
+
+
+class ParticipleGenerator:
+    """
+    Partizip II и вспомогательный глагол для Perfekt.
+    Работает пачками по словарям из .values(): одна и та же базовая основа
+    (kommen -> ankommen, bekommen, mitkommen) вычисляется один раз.
+    """
+
+    def __init__(self):
+        self._base_cache: Dict[tuple, tuple[str, str]] = {}
+
+    def generate_many(self, verbs: Iterable[dict]) -> List[PerfektSuggestion]:
+        """
+        verbs: словари с ключами infinitive, verb_type, is_trennbare, reflexivitaet, case.
+        Ошибки не бросаются: они попадают в PerfektSuggestion.error.
+        """
+        return [self.suggest(verb) for verb in verbs]
+
+    def suggest(self, verb: dict) -> PerfektSuggestion:
+        suggestion = PerfektSuggestion(infinitive=verb["infinitive"])
+        try:
+            self._fill_participle(suggestion, verb)
+        except MorphologyError as exc:
+            suggestion.error = str(exc)
+        self._fill_auxiliary(suggestion, verb)
+        return suggestion
+
+    # --------------------------------------------------
+
+    def _fill_participle(self, suggestion: PerfektSuggestion, verb: dict) -> None:
+        infinitive = (verb["infinitive"] or "").strip()
+        if infinitive.startswith("sich "):
+            infinitive = infinitive[len("sich "):]
+        if not infinitive or " " in infinitive:
+            raise MorphologyError(f"cannot derive participle for multi-word infinitive '{infinitive}'")
+
+        if infinitive in IRREGULAR_PARTICIPLES:
+            suggestion.participle_ii = IRREGULAR_PARTICIPLES[infinitive]
+            suggestion.participle_source = "override"
+            return
+
+        separable = ""
+        core = infinitive
+        if verb.get("is_trennbare"):
+            separable, core = split_separable_prefix(infinitive)
+
+        inseparable, base = _split_inseparable(core, INSEPARABLE_PREFIXES)
+        if not inseparable and not separable:
+            inseparable, base = _split_inseparable(core, AMBIGUOUS_PREFIXES)
+            if inseparable:
+                suggestion.needs_review = True
+                suggestion.notes.append(f"prefix '{inseparable}' treated as inseparable")
+
+        is_weak = normalize_enum(verb.get("verb_type"), VerbType) == VerbType.REGULAR
+        participle, source = self._base_participle(base, allow_rule=is_weak)
+
+        if inseparable and participle.startswith("ge"):
+            # gegangen -> vergangen, gesucht -> besucht
+            participle = participle[2:]
+
+        suggestion.participle_ii = separable + inseparable + participle
+        suggestion.participle_source = source
+
+    def _base_participle(self, base: str, *, allow_rule: bool) -> tuple[str, str]:
+        key = (base, allow_rule)
+        if key not in self._base_cache:
+            self._base_cache[key] = self._compute_base_participle(base, allow_rule)
+        return self._base_cache[key]
+
+    @staticmethod
+    def _compute_base_participle(base: str, allow_rule: bool) -> tuple[str, str]:
+        if base in IRREGULAR_PARTICIPLES:
+            return IRREGULAR_PARTICIPLES[base], "override"
+
+        if base.endswith("ieren") and base not in NATIVE_IEREN_VERBS and VOWELS.search(base[:-5]):
+            # studiert, telefoniert: ударное -ieren, без ge-; у schmieren/zieren перед -ieren нет слога
+            return base[:-2] + "t", "ieren"
+
+        if not allow_rule:
+            raise MorphologyError(f"no irregular participle known for '{base}'")
+
+        stem = extract_stem(base)
+        link = "e" if not base.endswith(("eln", "ern")) and needs_e_insertion(stem) else ""
+        return f"ge{stem}{link}t", "rule"
+
+    @staticmethod
+    def _fill_auxiliary(suggestion: PerfektSuggestion, verb: dict) -> None:
+        infinitive = verb["infinitive"]
+
+        if normalize_enum(verb.get("reflexivitaet"), Reflexiv) in (Reflexiv.REFL, Reflexiv.EREFL):
+            suggestion.auxiliary, suggestion.auxiliary_source = AuxiliaryVerb.HABEN.value, "reflexive"
+            return
+        if infinitive in SEIN_VERBS:
+            suggestion.auxiliary, suggestion.auxiliary_source = AuxiliaryVerb.SEIN.value, "override"
+            return
+        if verb.get("case") == GermanCase.AKK.name:
+            # переходный глагол
+            suggestion.auxiliary, suggestion.auxiliary_source = AuxiliaryVerb.HABEN.value, "accusative"
+            return
+
+        if verb.get("is_trennbare"):
+            try:
+                _, core = split_separable_prefix(infinitive)
+            except MorphologyError:
+                core = ""
+            if core in SEIN_VERBS:
+                suggestion.auxiliary, suggestion.auxiliary_source = AuxiliaryVerb.SEIN.value, "prefix"
+                suggestion.needs_review = True
+                suggestion.notes.append(f"auxiliary taken from base verb '{core}'")
+                return
+
+        suggestion.auxiliary, suggestion.auxiliary_source = AuxiliaryVerb.HABEN.value, "default"
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from src.common.choices import Pronoun, Tense
+from src.personal_forms.exceptions import MorphologyError
+
+
+# Отделяемые приставки. Порядок не важен: при разборе берётся самая длинная подходящая
+SEPARABLE_PREFIXES = (
+    "ab", "an", "auf", "aus", "bei", "dabei", "dar", "davon", "durch", "ein", "empor", "entgegen",
+    "entlang", "fern", "fest", "fort", "frei", "her", "herab", "heran", "herauf", "heraus",
+    "herbei", "herein", "herum", "herunter", "hervor", "hin", "hinauf", "hinaus", "hinein",
+    "hinzu", "kennen", "los", "mit", "nach", "nieder", "statt", "teil", "über", "um", "unter",
+    "vor", "voran", "voraus", "vorbei", "vorüber", "weg", "weiter", "wieder", "zu", "zurecht",
+    "zurück", "zusammen",
+)
+
+VOWELS = "aeiouäöüy"
+
+# du-Form ohne "s": du tanzt, du reist, du mixt
+SIBILANT_ENDINGS = ("s", "ß", "x", "z")
+
+
+@dataclass(frozen=True)
+class VerbParts:
+    prefix: str  # отделяемая приставка или ""
+    stem: str
+    core: str  # инфинитив без отделяемой приставки
+
+    @property
+    def is_el_er(self) -> bool:
+        return self.core.endswith(("eln", "ern"))
+
+
+def split_separable_prefix(infinitive: str) -> tuple[str, str]:
+    """
+    aufmachen -> ("auf", "machen"). Бросает MorphologyError, если приставка не распознана
+    или после неё не остаётся глагола.
+    """
+    for prefix in sorted(SEPARABLE_PREFIXES, key=len, reverse=True):
+        core = infinitive[len(prefix):]
+        if infinitive.startswith(prefix) and len(core) >= 3 and core.endswith("n"):
+            return prefix, core
+    raise MorphologyError(f"unknown separable prefix in '{infinitive}'")
+
+
+def extract_stem(core: str) -> str:
+    """machen -> mach, sammeln -> sammel, wandern -> wander"""
+    if core.endswith(("eln", "ern")):
+        return core[:-1]
+    if core.endswith("en") and len(core) > 3:
+        return core[:-2]
+    raise MorphologyError(f"unsupported infinitive ending in '{core}'")
+
+
+def needs_e_insertion(stem: str) -> bool:
+    """
+    arbeit-e-st, red-e-t, atm-e-t, rechn-e-t, öffn-e-t.
+    Нет вставки после l/r/m/n и «немой» h перед m/n: lern-t, kämm-t, wohn-t (но rech-n-e-t).
+    """
+    if stem.endswith(("t", "d")):
+        return True
+    if len(stem) < 2 or stem[-1] not in "mn":
+        return False
+    if stem[:-1].endswith("ch"):
+        return True
+    return stem[-2] not in VOWELS + "lrhmn"
+
+
+class WeakVerbConjugator:
+    """
+    Präsens и Präteritum для слабых (VerbType.REGULAR) глаголов по правилам.
+    Не знает про БД: на вход инфинитив, на выход {tense: {pronoun: form}}.
+    """
+
+    PRAESENS_ENDINGS = {
+        Pronoun.ICH: "e",
+        Pronoun.DU: "st",
+        Pronoun.ER: "t",
+        Pronoun.WIR: "en",
+        Pronoun.IHR: "t",
+        Pronoun.SIE: "en",
+    }
+
+    PRAETERITUM_ENDINGS = {
+        Pronoun.ICH: "te",
+        Pronoun.DU: "test",
+        Pronoun.ER: "te",
+        Pronoun.WIR: "ten",
+        Pronoun.IHR: "tet",
+        Pronoun.SIE: "ten",
+    }
+
+    SUPPORTED_TENSES = (Tense.PRAESENS.value, Tense.PRAETERITUM.value)
+
+    def parse(self, infinitive: str, *, is_trennbare: bool = False) -> VerbParts:
+        infinitive = (infinitive or "").strip()
+        if not infinitive or " " in infinitive:
+            raise MorphologyError(f"cannot conjugate multi-word infinitive '{infinitive}'")
+
+        prefix, core = split_separable_prefix(infinitive) if is_trennbare else ("", infinitive)
+        return VerbParts(prefix=prefix, stem=extract_stem(core), core=core)
+
+    def conjugate(
+        self,
+        infinitive: str,
+        *,
+        is_trennbare: bool = False,
+        tenses: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Dict[str, str]]:
+        parts = self.parse(infinitive, is_trennbare=is_trennbare)
+        tenses = list(tenses) if tenses is not None else list(self.SUPPORTED_TENSES)
+
+        result: Dict[str, Dict[str, str]] = {}
+        for tense in tenses:
+            if tense == Tense.PRAESENS.value:
+                forms = self._praesens(parts)
+            elif tense == Tense.PRAETERITUM.value:
+                forms = self._praeteritum(parts)
+            else:
+                raise MorphologyError(f"tense '{tense}' is not generated by {type(self).__name__}")
+
+            result[tense] = {
+                pronoun.value: f"{form} {parts.prefix}" if parts.prefix else form
+                for pronoun, form in forms.items()
+            }
+        return result
+
+    # --------------------------------------------------
+
+    def _praesens(self, parts: VerbParts) -> Dict[Pronoun, str]:
+        stem = parts.stem
+        forms = {}
+
+        for pronoun, ending in self.PRAESENS_ENDINGS.items():
+            if pronoun in (Pronoun.WIR, Pronoun.SIE):
+                # wir/sie совпадают с инфинитивом: wir sammeln, sie wandern
+                forms[pronoun] = parts.core
+                continue
+
+            if parts.is_el_er:
+                if pronoun == Pronoun.ICH:
+                    # ich sammle (e выпадает перед -l), ich wandere
+                    forms[pronoun] = (stem[:-2] + "l" if stem.endswith("el") else stem) + "e"
+                else:
+                    forms[pronoun] = stem + ending
+                continue
+
+            if pronoun == Pronoun.DU and stem.endswith(SIBILANT_ENDINGS):
+                ending = "t"
+            if pronoun != Pronoun.ICH and needs_e_insertion(stem):
+                ending = "e" + ending
+
+            forms[pronoun] = stem + ending
+
+        return forms
+
+    def _praeteritum(self, parts: VerbParts) -> Dict[Pronoun, str]:
+        stem = parts.stem
+        link = "e" if not parts.is_el_er and needs_e_insertion(stem) else ""
+        return {
+            pronoun: stem + link + ending
+            for pronoun, ending in self.PRAETERITUM_ENDINGS.items()
+        }
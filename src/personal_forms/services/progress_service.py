@@ -1,8 +1,12 @@
+from typing import Dict, List, Tuple
+
 from django.db import transaction
 from django.utils import timezone
 from django.core.cache import cache
 
+from src.personal_forms.domain import AnswerEvent
 from src.personal_forms.models import UserVerbProgress
+from src.personal_forms.services.version_service import ContentVersionService
 
 
 class ProgressService:
@@ -64,6 +68,86 @@ class ProgressService:
         cache_key = f"progress:{progress.user_id}:{unit_id}"
         cache.delete(cache_key)
 
+        # 3. Новая версия прогресса — закешированные ответы API (список юнитов, stats) устаревают.
+        # После коммита: иначе параллельный запрос мог бы закешировать старые данные под новой версией
+        user_id = progress.user_id
+        transaction.on_commit(lambda: ContentVersionService().bump_progress_version(user_id))
+
+    # --------------------------------------------------
+
+    @transaction.atomic
+    def record_answers_batch(self, *, user, events: List[AnswerEvent]) -> List[Tuple[int, bool]]:
+        """
+        Пакетная запись ответов (офлайн-сессия) с той же семантикой, что и record_answer:
+        события применяются строго по порядку, streak/mastered считаются в памяти.
+        Запросы: выборка прогресса (+ bulk_create недостающих) и один bulk_update.
+        Возвращает (streak, mastered) после каждого события.
+        """
+        if not events:
+            return []
+
+        progress_map = self._lock_progress_rows(user, events)
+
+        snapshots: List[Tuple[int, bool]] = []
+        for event in events:
+            progress = progress_map[(event.verb_id, event.skill_type, event.pronoun)]
+            if event.is_correct:
+                self._handle_correct(progress)
+            else:
+                self._handle_wrong(progress)
+            if progress.last_answer_at is None or event.answered_at > progress.last_answer_at:
+                progress.last_answer_at = event.answered_at
+            snapshots.append((progress.streak, progress.mastered))
+
+        # bulk_update не вызывает auto_now — updated_at ставим сами (нужен для дельта-синхронизации)
+        now = timezone.now()
+        touched = list(progress_map.values())
+        for progress in touched:
+            progress.updated_at = now
+        UserVerbProgress.objects.bulk_update(
+            touched,
+            ["correct_count", "wrong_count", "streak", "mastered", "last_answer_at", "updated_at"],
+            batch_size=500,
+        )
+
+        # post_save не срабатывает — сбрасываем те же ключи, что record_answer и signals.py
+        from src.personal_forms.signals import build_progress_cache_key
+
+        keys = {f"progress:{user.id}:{e.unit_id}" for e in events if e.unit_id}
+        keys |= {build_progress_cache_key(user.id, e.skill_type) for e in events}
+        cache.delete_many(list(keys))
+
+        user_id = user.id
+        transaction.on_commit(lambda: ContentVersionService().bump_progress_version(user_id))
+        return snapshots
+
+    @staticmethod
+    def _lock_progress_rows(user, events: List[AnswerEvent]) -> Dict[Tuple, UserVerbProgress]:
+        keys = {(e.verb_id, e.skill_type, e.pronoun) for e in events}
+        queryset = UserVerbProgress.objects.select_for_update().filter(
+            user=user,
+            verb_id__in={k[0] for k in keys},
+            skill_type__in={k[1] for k in keys},
+        )
+
+        def load():
+            # verb_id__in × skill_type__in может захватить лишние строки — отбрасываем
+            rows = ((p.verb_id, p.skill_type, p.pronoun, p) for p in queryset.all())
+            return {(v, s, pr): p for v, s, pr, p in rows if (v, s, pr) in keys}
+
+        progress_map = load()
+        missing = keys - progress_map.keys()
+        if missing:
+            UserVerbProgress.objects.bulk_create(
+                [
+                    UserVerbProgress(user=user, verb_id=verb_id, skill_type=skill_type, pronoun=pronoun)
+                    for verb_id, skill_type, pronoun in missing
+                ],
+                ignore_conflicts=True,
+            )
+            progress_map = load()
+        return progress_map
+
     # --------------------------------------------------
 
     def _handle_correct(self, progress: UserVerbProgress) -> None:
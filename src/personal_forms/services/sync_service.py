@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+
+from src.personal_forms.models import ProgressTombstone, UserVerbProgress
+
+
+class ProgressSyncService:
+    """
+    Дельта-синхронизация прогресса для клиентов с локальной копией.
+    Курсор — (updated_at, id) последней отданной строки; изменения читаются по индексу (user, updated_at, id),
+    удаления — из ProgressTombstone по индексу (user, deleted_at).
+    """
+
+    PAGE_SIZE = 500
+    # Транзакция, начатая раньше, может закоммитить строку с updated_at «в прошлом».
+    # Поэтому итоговый курсор отстаёт от now на SYNC_LAG: такие строки придут в следующей синхронизации
+    # (повторная отдача безопасна — клиент делает upsert по id)
+    SYNC_LAG = timedelta(seconds=5)
+    TOMBSTONE_RETENTION = timedelta(days=30)
+
+    def get_changes(
+        self,
+        *,
+        user,
+        since: Optional[Tuple[datetime, int]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict:
+        limit = limit or self.PAGE_SIZE
+        now = timezone.now()
+
+        if since and since[0] < now - self.TOMBSTONE_RETENTION:
+            # Следы удалений уже вычищены — корректную дельту собрать нельзя
+            return {"reset": True, "changes": [], "deleted": [], "cursor": None, "has_more": False}
+
+        queryset = UserVerbProgress.objects.filter(user=user).select_related("verb")
+        if since:
+            since_at, since_id = since
+            queryset = queryset.filter(Q(updated_at__gt=since_at) | Q(updated_at=since_at, id__gt=since_id))
+
+        rows = list(queryset.order_by("updated_at", "id")[: limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if has_more:
+            upper = rows[-1].updated_at
+            cursor = (upper, rows[-1].id)
+        else:
+            upper = now
+            cursor = max((now - self.SYNC_LAG, 0), since) if since else (now - self.SYNC_LAG, 0)
+
+        deleted = []
+        if since:
+            # Без since клиент качает всё с нуля — удалённое ему неинтересно
+            deleted = list(
+                ProgressTombstone.objects.filter(
+                    user=user,
+                    deleted_at__gt=since[0],
+                    deleted_at__lte=upper,
+                ).order_by("deleted_at").values("progress_id", "verb_id", "skill_type", "pronoun", "deleted_at")
+            )
+
+        return {"reset": False, "changes": rows, "deleted": deleted, "cursor": cursor, "has_more": has_more}
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def record_deletion(progress: UserVerbProgress) -> None:
+        ProgressTombstone.objects.create(
+            user_id=progress.user_id,
+            progress_id=progress.id,
+            verb_id=progress.verb_id,
+            skill_type=progress.skill_type,
+            pronoun=progress.pronoun,
+        )
+
+    def prune_tombstones(self) -> int:
+        deleted, _ = ProgressTombstone.objects.filter(
+            deleted_at__lt=timezone.now() - self.TOMBSTONE_RETENTION
+        ).delete()
+        return deleted
@@ -1,15 +1,21 @@
 import uuid
+from typing import Dict, List
+
 from django.core.cache import cache
+from django.utils import timezone
 
-from src.personal_forms.models import LearningUnit
+from src.common.choices import Pronoun
+from src.personal_forms.models import LearningUnit, Verb
 from src.personal_forms.services.training_engine import CachedTrainingEngine
 from src.personal_forms.services.progress_service import ProgressService
 from src.personal_forms.services.card_factory import CardFactory
+from src.personal_forms.services.resolvers.registry import SKILL_RESOLVERS
 
 from src.personal_forms.domain import (
     LearningAtom,
     NextCard,
     AnswerResult,
+    AnswerEvent,
 )
 
 
@@ -122,3 +128,93 @@ class TrainingService:
             mastered=progress.mastered,
             streak=progress.streak,
         )
+
+    # ============================================================
+    # BATCH (офлайн-сессия)
+    # ============================================================
+
+    def submit_answers_batch(self, *, user, items: List[Dict], language: str) -> List[Dict]:
+        """
+        items — проверенные BatchAnswerItemSerializer словари в порядке ответов.
+        Каждый элемент — card_id из next-card или атом (verb_id, skill_type, pronoun) из офлайн-пакета.
+        Ошибочные элементы не прерывают пакет: они получают status="error", остальные записываются
+        одной транзакцией через ProgressService.record_answers_batch.
+        """
+        now = timezone.now()
+        cards = cache.get_many([item["card_id"] for item in items if item.get("card_id")])
+        verbs = Verb.objects.prefetch_related("translations", "forms").in_bulk(
+            {item["verb_id"] for item in items if not item.get("card_id")}
+        )
+
+        results: List[Dict] = []
+        events: List[AnswerEvent] = []
+        event_positions: List[int] = []
+        used_cards = set()
+
+        for index, item in enumerate(items):
+            try:
+                target = self._resolve_batch_item(item, cards, verbs, used_cards, language)
+            except ValueError as exc:
+                results.append({"index": index, "status": "error", "detail": str(exc)})
+                continue
+
+            is_correct = item["answer"].strip() == target["correct_answer"].strip()
+            answered_at = min(item.get("answered_at") or now, now)
+            events.append(AnswerEvent(
+                verb_id=target["verb_id"],
+                skill_type=target["skill_type"],
+                pronoun=target["pronoun"],
+                is_correct=is_correct,
+                answered_at=answered_at,
+                unit_id=target["unit_id"],
+            ))
+            event_positions.append(len(results))
+            results.append({
+                "index": index,
+                "status": "ok",
+                "correct": is_correct,
+                "correct_answer": target["correct_answer"],
+            })
+
+        snapshots = self.progress.record_answers_batch(user=user, events=events)
+        for position, (streak, mastered) in zip(event_positions, snapshots):
+            results[position].update(streak=streak, mastered=mastered)
+
+        if used_cards:
+            cache.delete_many(list(used_cards))
+        return results
+
+    @staticmethod
+    def _resolve_batch_item(item, cards, verbs, used_cards, language) -> Dict:
+        card_id = item.get("card_id")
+        if card_id:
+            if card_id in used_cards:
+                raise ValueError("Card already answered in this batch")
+            card_data = cards.get(card_id)
+            if not card_data:
+                raise ValueError("Card expired")
+            used_cards.add(card_id)
+            return card_data
+
+        verb = verbs.get(item["verb_id"])
+        if verb is None:
+            raise ValueError("Unknown verb")
+
+        pronoun = item.get("pronoun") or None
+        atom = LearningAtom(
+            verb_id=verb.id,
+            skill_type=item["skill_type"],
+            pronoun=Pronoun(pronoun) if pronoun else None,
+        )
+        correct_answer = SKILL_RESOLVERS[atom.skill_type].get_correct_answer(verb, atom, language)
+        if correct_answer.startswith("[") and correct_answer.endswith("]"):
+            # "[Perfekt data missing]" и т.п. — такой ответ нельзя засчитать ни верным, ни неверным
+            raise ValueError(correct_answer)
+
+        return {
+            "verb_id": verb.id,
+            "skill_type": atom.skill_type,
+            "pronoun": pronoun,
+            "unit_id": item.get("unit_id"),
+            "correct_answer": correct_answer,
+        }
@@ -0,0 +1,126 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from src.common.choices import AuxiliaryConjugation, AuxiliaryVerb, LanguageCode, Pronoun
+from src.personal_forms.models import LearningUnit, VerbTranslation
+
+
+@dataclass(frozen=True)
+class UnitPack:
+    etag: str  # sha256 несжатого JSON — одинаковое содержимое даёт одинаковый ETag
+    body: bytes  # gzip
+
+
+class UnitPackService:
+    """
+    Офлайн-пакет юнита: всё, что нужно клиенту для сборки карточек без сервера
+    (глаголы, формы, переводы на один язык, Perfekt, пулы дистракторов).
+    Пакеты лежат в кеше уже сжатыми; пересобираются сигналами при изменении юнита / набора глаголов,
+    при правке самих глаголов — сбрасываются и собираются при следующем запросе.
+    """
+
+    CACHE_KEY = "unitpack:{unit_id}:{language}"
+    CACHE_TTL = 24 * 60 * 60
+    VERSION = 1
+
+    # --------------------------------------------------
+
+    def get_pack(self, unit: LearningUnit, language: str) -> UnitPack:
+        key = self.CACHE_KEY.format(unit_id=unit.pk, language=language)
+        pack = cache.get(key)
+        if pack is None:
+            pack = self._store(unit, language)
+        return pack
+
+    def rebuild(self, unit: LearningUnit, languages: Optional[Iterable[str]] = None) -> None:
+        for language in languages or LanguageCode.get_available_values():
+            self._store(unit, language)
+
+    def invalidate_units(self, unit_ids: Iterable) -> None:
+        cache.delete_many([
+            self.CACHE_KEY.format(unit_id=unit_id, language=language)
+            for unit_id in unit_ids
+            for language in LanguageCode.get_available_values()
+        ])
+
+    def invalidate_for_verbs(self, verb_ids: Iterable[int]) -> None:
+        unit_ids = LearningUnit.objects.filter(
+            verb_group__verbs__id__in=list(verb_ids)
+        ).values_list("id", flat=True).distinct()
+        self.invalidate_units(unit_ids)
+
+    # --------------------------------------------------
+
+    def build_payload(self, unit: LearningUnit, language: str) -> Dict:
+        verbs = []
+        if unit.verb_group_id:
+            verbs = list(
+                unit.verb_group.verbs.order_by("infinitive").prefetch_related(
+                    "forms",
+                    Prefetch(
+                        "translations",
+                        queryset=VerbTranslation.objects.filter(language_code=language),
+                    ),
+                )
+            )
+
+        verb_payload: List[Dict] = []
+        translations_pool = []
+        for verb in verbs:
+            forms: Dict[str, Dict[str, str]] = {}
+            for form in verb.forms.all():
+                forms.setdefault(form.tense, {})[form.pronoun] = form.form
+
+            translation = next((t.translation for t in verb.translations.all()), None)
+            if translation:
+                translations_pool.append(translation)
+
+            verb_payload.append({
+                "id": verb.id,
+                "infinitive": verb.infinitive,
+                "verb_type": verb.verb_type,
+                "is_trennbare": verb.is_trennbare,
+                "reflexivitaet": verb.reflexivitaet,
+                "translation": translation,
+                "forms": forms,
+                "perfekt": {"auxiliary": verb.auxiliary, "participle_ii": verb.participle_ii},
+            })
+
+        return {
+            "version": self.VERSION,
+            "unit": {
+                "id": str(unit.pk),
+                "title": unit.title,
+                "level": unit.level,
+                "skill_type": unit.skill_type,
+            },
+            "language": language,
+            "verbs": verb_payload,
+            # Дистракторы перевода — переводы соседних глаголов (как TranslationResolver),
+            # для Präsens/Präteritum — формы самого глагола, для Perfekt — формы haben/sein
+            "distractors": {
+                "translation": sorted(set(translations_pool)),
+                "auxiliary_forms": {
+                    aux.value: {p.value: AuxiliaryConjugation.get(aux, p) for p in Pronoun}
+                    for aux in AuxiliaryVerb
+                },
+            },
+        }
+
+    def _store(self, unit: LearningUnit, language: str) -> UnitPack:
+        raw = json.dumps(
+            self.build_payload(unit, language),
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        # mtime=0: одинаковый JSON даёт побайтно одинаковый gzip
+        pack = UnitPack(etag=hashlib.sha256(raw).hexdigest(), body=gzip.compress(raw, mtime=0))
+        cache.set(self.CACHE_KEY.format(unit_id=unit.pk, language=language), pack, self.CACHE_TTL)
+        return pack
@@ -0,0 +1,95 @@
+import heapq
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.personal_forms.models import Verb
+from src.personal_forms.services.version_service import ContentVersionService
+
+UMLAUT_FOLDING = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def fold(text: str) -> str:
+    """Нормализация для поиска: регистр + ä/ae, ö/oe, ü/ue, ß/ss"""
+    return text.strip().lower().translate(UMLAUT_FOLDING)
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class VerbSearchIndex:
+    """
+    Отсортированный массив нормализованных инфинитивов (префиксы — bisect)
+    + триграммы -> позиции в массиве (подстроки без полного прохода).
+    """
+    version: Optional[int] = None
+    keys: List[str] = field(default_factory=list)
+    entries: List[Tuple[int, str]] = field(default_factory=list)  # (id, infinitive) в порядке keys
+    trigram_map: Dict[str, Set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, version, rows) -> "VerbSearchIndex":
+        items = sorted((fold(infinitive), verb_id, infinitive) for verb_id, infinitive in rows)
+        index = cls(version=version)
+        for position, (key, verb_id, infinitive) in enumerate(items):
+            index.keys.append(key)
+            index.entries.append((verb_id, infinitive))
+            for gram in trigrams(key):
+                index.trigram_map.setdefault(gram, set()).add(position)
+        return index
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, str]]:
+        needle = fold(query)
+        if not needle:
+            return []
+
+        # 1. Начинается с запроса: непрерывный диапазон в отсортированном массиве; короткие — выше
+        ranked = []
+        position = bisect_left(self.keys, needle)
+        while position < len(self.keys) and self.keys[position].startswith(needle):
+            ranked.append(position)
+            position += 1
+        ranked.sort(key=lambda pos: (len(self.keys[pos]), self.keys[pos]))
+
+        # 2. Содержит запрос (abfahren по "fahr"): кандидаты из пересечения триграмм, ранжирование по позиции
+        if len(ranked) < limit:
+            grams = trigrams(needle)
+            if grams:
+                candidates = set.intersection(*(self.trigram_map.get(gram, set()) for gram in grams))
+            else:
+                candidates = range(len(self.keys))  # запрос короче 3 символов — массив целиком
+            seen = set(ranked)
+            inner = (pos for pos in candidates if pos not in seen and needle in self.keys[pos])
+            ranked.extend(heapq.nsmallest(
+                limit - len(ranked), inner,
+                key=lambda pos: (self.keys[pos].find(needle), len(self.keys[pos]), self.keys[pos]),
+            ))
+
+        return [self.entries[pos] for pos in ranked[:limit]]
+
+
+class VerbSearchService:
+    """
+    Автодополнение инфинитивов (VerbLookupView): индекс в памяти процесса,
+    пересобирается при смене версии каталога (любое сохранение/удаление глагола, signals.py).
+    На запрос — одно чтение версии из кеша и поиск в памяти, без запросов к БД.
+    """
+
+    _index = VerbSearchIndex()
+    _lock = threading.Lock()
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        return [{"id": verb_id, "text": infinitive} for verb_id, infinitive in self.get_index().search(query, limit)]
+
+    @classmethod
+    def get_index(cls) -> VerbSearchIndex:
+        version = ContentVersionService().get_catalog_version()
+        if cls._index.version != version:
+            with cls._lock:
+                # Другой поток мог уже пересобрать индекс, пока мы ждали блокировку
+                if cls._index.version != version:
+                    cls._index = VerbSearchIndex.build(version, Verb.objects.values_list("id", "infinitive"))
+        return cls._index
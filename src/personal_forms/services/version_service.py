@@ -0,0 +1,71 @@
+import time
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from src.personal_forms.models import UserVerbProgress
+
+
+class ContentVersionService:
+    """
+    Дешёвые «штампы версий» для условных запросов (ETag) и кеша ответов.
+    catalog — счётчик в кеше, растёт после коммита любого изменения курсов/юнитов/наборов глаголов (signals.py).
+    course access — счётчик доступа к курсам, растёт только при сохранении/удалении курса (signals.py).
+    progress version — счётчик пользователя, растёт при каждом ответе (ProgressService.record_answer).
+    progress stamp — max(updated_at) + count прогресса пользователя, один запрос по индексу (user, updated_at, id).
+    Старые ключи кеша ответов не удаляются: после смены версии они просто перестают читаться и истекают по TTL.
+    """
+
+    CATALOG_VERSION_KEY = "version:catalog"
+    COURSE_ACCESS_VERSION_KEY = "version:course_access"
+    PROGRESS_VERSION_KEY = "version:progress:{user_id}"
+
+    # --------------------------------------------------
+
+    def get_catalog_version(self) -> int:
+        return self._get_version(self.CATALOG_VERSION_KEY)
+
+    def bump_catalog_version(self) -> None:
+        self._bump_version(self.CATALOG_VERSION_KEY)
+
+    def get_course_access_version(self) -> int:
+        return self._get_version(self.COURSE_ACCESS_VERSION_KEY)
+
+    def bump_course_access_version(self) -> None:
+        self._bump_version(self.COURSE_ACCESS_VERSION_KEY)
+
+    def get_progress_version(self, user_id) -> int:
+        return self._get_version(self.PROGRESS_VERSION_KEY.format(user_id=user_id))
+
+    def bump_progress_version(self, user_id) -> None:
+        self._bump_version(self.PROGRESS_VERSION_KEY.format(user_id=user_id))
+
+    @staticmethod
+    def get_progress_stamp(user_id) -> str:
+        stamp = UserVerbProgress.objects.filter(user_id=user_id).aggregate(
+            last=Max("updated_at"),
+            total=Count("id"),
+        )
+        last = stamp["last"].isoformat() if stamp["last"] else "-"
+        return f"{last}:{stamp['total']}"
+
+    # --------------------------------------------------
+
+    @staticmethod
+    def _get_version(key: str) -> int:
+        version = cache.get(key)
+        if version is None:
+            # Ключ вытеснен или ещё не создан: новая стартовая точка гарантированно
+            # не совпадёт со старой версией, поэтому старые ETag / записи кеша не прочитаются
+            version = time.time_ns()
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+        return version
+
+    @staticmethod
+    def _bump_version(key: str) -> None:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Ключа нет — следующий _get_version создаст новый
+            pass
@@ -1,18 +1,193 @@
-from django.db.models.signals import post_save
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 
-from src.personal_forms.models import UserVerbProgress
+from src.personal_forms.models import (
+    Course,
+    LearningUnit,
+    UserVerbProgress,
+    Verb,
+    VerbForm,
+    VerbGroup,
+    VerbTranslation,
+)
+from src.personal_forms.services.version_service import ContentVersionService
+from src.personal_forms.services.sync_service import ProgressSyncService
+from src.personal_forms.services.unit_pack_service import UnitPackService
+from src.personal_forms.services.course_access_service import CourseAccessService
+from src.personal_forms.services.form_lookup_service import FormLookupService
+
+User = get_user_model()
 
 
 def build_progress_cache_key(user_id: int, skill_type: str):
     return f"progress:user:{user_id}:skill:{skill_type}"
 
 
+# Массовый импорт (import_verbs): обработчики сохранения глаголов/форм/переводов ниже не трогают
+# индекс форм, пакеты и версию каталога на каждую строку, а только запоминают id глагола
+_deferred_verb_ids: ContextVar[Optional[set]] = ContextVar("deferred_verb_ids", default=None)
+
+
+@contextmanager
+def defer_verb_sync():
+    """
+    Внутри transaction.atomic() пачки: затронутые глаголы обрабатываются один раз после коммита —
+    версия каталога, сброс офлайн-пакетов и пересборка индекса форм (как в generate_forms / fill_perfekt)
+    """
+    verb_ids = set()
+    token = _deferred_verb_ids.set(verb_ids)
+    try:
+        yield verb_ids
+    finally:
+        _deferred_verb_ids.reset(token)
+    if verb_ids:
+        ids = sorted(verb_ids)
+        transaction.on_commit(lambda: _sync_verbs(ids))
+
+
+def _sync_verbs(verb_ids):
+    ContentVersionService().bump_catalog_version()
+    UnitPackService().invalidate_for_verbs(verb_ids)
+    FormLookupService().rebuild_verbs(verb_ids)
+
+
+def _defer_verb(verb_id) -> bool:
+    deferred = _deferred_verb_ids.get()
+    if deferred is None:
+        return False
+    deferred.add(verb_id)
+    return True
+
+
 @receiver(post_save, sender=UserVerbProgress)
 def invalidate_progress_cache(sender, instance, **kwargs):
     key = build_progress_cache_key(
         user_id=instance.user_id,
         skill_type=instance.skill_type,
     )
-    cache.delete(key)
\ No newline at end of file
+    cache.delete(key)
+    # Правки из админки / сервисов в обход ProgressService тоже сбрасывают ETag прогресса
+    user_id = instance.user_id
+    transaction.on_commit(lambda: ContentVersionService().bump_progress_version(user_id))
+
+
+@receiver(post_delete, sender=UserVerbProgress)
+def on_progress_deleted(sender, instance, origin=None, **kwargs):
+    # Сброс прогресса из админки / удаление пользователя; ответы записывает ProgressService
+    ContentVersionService().bump_progress_version(instance.user_id)
+
+    # При удалении самого пользователя синхронизировать некого (и tombstone сослался бы на удаляемую строку)
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is not User:
+        ProgressSyncService.record_deletion(instance)
+
+
+# Любое изменение структуры курсов меняет версию каталога (ETag списка юнитов и прогресса,
+# индекс поиска глаголов VerbSearchService)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=LearningUnit)
+@receiver(post_delete, sender=LearningUnit)
+@receiver(post_save, sender=VerbGroup)
+@receiver(post_delete, sender=VerbGroup)
+@receiver(post_save, sender=Verb)
+@receiver(post_delete, sender=Verb)
+@receiver(m2m_changed, sender=VerbGroup.verbs.through)
+def bump_catalog_version(sender, **kwargs):
+    if sender is Verb and _defer_verb(kwargs["instance"].pk):
+        return
+    if kwargs.get("action", "post_").startswith("post_"):
+        # После коммита: иначе другой воркер пересоберёт индекс/кеш под новой версией,
+        # ещё не видя изменений, и будет отдавать устаревшие данные до следующей правки каталога
+        transaction.on_commit(ContentVersionService().bump_catalog_version)
+
+
+# Офлайн-пакеты юнитов: при изменении состава — пересобрать сразу (после коммита),
+# при правке самих глаголов — сбросить, соберутся при следующем запросе
+def _rebuild_unit_packs(units):
+    units = list(units)
+    transaction.on_commit(lambda: [UnitPackService().rebuild(unit) for unit in units])
+
+
+@receiver(post_save, sender=LearningUnit)
+def rebuild_unit_pack(sender, instance, **kwargs):
+    _rebuild_unit_packs([instance])
+
+
+@receiver(post_delete, sender=LearningUnit)
+def drop_unit_pack(sender, instance, **kwargs):
+    UnitPackService().invalidate_units([instance.pk])
+
+
+@receiver(post_save, sender=VerbGroup)
+def rebuild_group_unit_packs(sender, instance, **kwargs):
+    _rebuild_unit_packs(instance.units.all())
+
+
+@receiver(m2m_changed, sender=VerbGroup.verbs.through)
+def rebuild_packs_on_verb_set_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        _rebuild_unit_packs(instance.units.all())
+    elif pk_set:
+        # verb.verb_groups.add(...): pk_set — id наборов
+        _rebuild_unit_packs(LearningUnit.objects.filter(verb_group_id__in=pk_set))
+    else:
+        # verb.verb_groups.clear(): затронутые наборы уже неизвестны
+        UnitPackService().invalidate_for_verbs([instance.pk])
+
+
+@receiver(post_save, sender=Verb)
+@receiver(pre_delete, sender=Verb)  # после удаления связь с наборами уже не найти
+@receiver(post_save, sender=VerbForm)
+@receiver(post_delete, sender=VerbForm)
+@receiver(post_save, sender=VerbTranslation)
+@receiver(post_delete, sender=VerbTranslation)
+def drop_packs_for_verb(sender, instance, **kwargs):
+    verb_id = instance.pk if sender is Verb else instance.verb_id
+    if _defer_verb(verb_id):
+        return
+    UnitPackService().invalidate_for_verbs([verb_id])
+
+
+# Доступ к курсам: сохранение/удаление курса (видимость, автор) меняет версию доступа,
+# назначение учеников — сбрасывает множества только затронутых пользователей; всё после коммита
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def bump_course_access_version(sender, **kwargs):
+    transaction.on_commit(ContentVersionService().bump_course_access_version)
+
+
+@receiver(m2m_changed, sender=Course.assigned_students.through)
+def invalidate_course_access(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        # После clear() список учеников уже не узнать
+        user_ids = [instance.pk] if reverse else list(instance.assigned_students.values_list("id", flat=True))
+    elif action in ("post_add", "post_remove"):
+        user_ids = [instance.pk] if reverse else list(pk_set)
+    else:
+        return
+    transaction.on_commit(lambda: CourseAccessService().invalidate_users(user_ids))
+
+
+# Обратный индекс форм: строка VerbForm — своя строка индекса (удаление — каскадом),
+# Perfekt пересобирается при сохранении глагола (auxiliary / participle_ii)
+@receiver(post_save, sender=VerbForm)
+def sync_form_lookup(sender, instance, raw=False, **kwargs):
+    if not raw and not _defer_verb(instance.verb_id):
+        FormLookupService().sync_form(instance)
+
+
+@receiver(post_save, sender=Verb)
+def sync_perfekt_lookup(sender, instance, raw=False, **kwargs):
+    if not raw and not _defer_verb(instance.pk):
+        FormLookupService().sync_perfekt(instance)
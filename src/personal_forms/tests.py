@@ -1,3 +1,640 @@
-from django.test import TestCase
+import json
+import tempfile
+import zipfile
+from io import BytesIO, StringIO
+from pathlib import Path
+from xml.etree import ElementTree
 
-# Create your tests here.
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.common.choices import CEFRLevel, LanguageCode, Pronoun, Reflexiv, SkillType, Tense, VerbType
+from src.personal_forms.exceptions import MorphologyError
+from src.personal_forms.models import (
+    Course, ImportCheckpoint, LearningUnit, UserVerbProgress, Verb, VerbForm, VerbGroup, VerbTranslation,
+)
+from src.personal_forms.services import ContentVersionService, FormLookupService, VerbSearchService
+from src.personal_forms.services.morphology import ParticipleGenerator, WeakVerbConjugator
+
+
+class BaseCatalogTest(TestCase):
+    def setUp(self):
+        self.verb = Verb.objects.create(
+            infinitive="machen",
+            level=CEFRLevel.A1.value,
+            verb_type=VerbType.REGULAR.value,
+            reflexivitaet=Reflexiv.NREFL.value,
+            auxiliary="haben",
+            participle_ii="gemacht",
+        )
+        VerbForm.objects.create(
+            verb=self.verb, tense=Tense.PRAESENS.value, pronoun=Pronoun.ICH.value, form="mache"
+        )
+        VerbTranslation.objects.create(
+            verb=self.verb, language_code=LanguageCode.RU.value, translation="делать"
+        )
+        Verb.objects.create(
+            infinitive="gehen",
+            level=CEFRLevel.A2.value,
+            verb_type=VerbType.STRONG.value,
+            reflexivitaet=Reflexiv.NREFL.value,
+        )
+
+
+class DumpVerbsTests(BaseCatalogTest):
+    def test_json_dump_is_importable(self):
+        out = StringIO()
+        call_command("dump_verbs", stdout=out, stderr=StringIO())
+        payload = json.loads(out.getvalue())
+
+        machen = next(v for v in payload["verbs"] if v["infinitive"] == "machen")
+        self.assertEqual(machen["forms"], {Tense.PRAESENS.value: {Pronoun.ICH.value: "mache"}})
+        self.assertEqual(machen["translations"], {LanguageCode.RU.value: "делать"})
+        self.assertEqual(machen["perfekt"], {"auxiliary": "haben", "participle_ii": "gemacht"})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "verbs.json"
+            path.write_text(out.getvalue(), encoding="utf-8")
+            report = StringIO()
+            call_command("import_verbs", str(path), "--force", stdout=report)
+        self.assertIn("Verbs: created=0, updated=0", report.getvalue())
+
+    def test_jsonl_dump_filters_by_level(self):
+        out = StringIO()
+        call_command("dump_verbs", "--format", "jsonl", "--level", "A2", "--chunk-size", "1",
+                     stdout=out, stderr=StringIO())
+        lines = out.getvalue().splitlines()
+        self.assertEqual([json.loads(line)["infinitive"] for line in lines], ["gehen"])
+
+
+class ImportVerbsResumeTests(TestCase):
+    def _write(self, tmp, verbs):
+        path = Path(tmp) / "verbs.json"
+        path.write_text(json.dumps({"verbs": verbs}), encoding="utf-8")
+        return str(path)
+
+    def test_resume_continues_after_last_committed_batch(self):
+        verbs = [{"infinitive": f"verb{i}"} for i in range(5)]
+        verbs[3]["level"] = "Z9"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self._write(tmp, verbs)
+            with self.assertRaises(CommandError):
+                call_command("import_verbs", path, "--batch-size", "2", stdout=StringIO())
+            # Первая пачка закоммичена, вторая (с ошибкой) откатилась
+            self.assertEqual(Verb.objects.count(), 2)
+            self.assertEqual(ImportCheckpoint.objects.get().offset, 2)
+
+            verbs[3]["level"] = "B1"
+            path = self._write(tmp, verbs)
+            call_command("import_verbs", path, "--batch-size", "2", "--resume",
+                         stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(Verb.objects.count(), 5)
+        checkpoint = ImportCheckpoint.objects.get()
+        self.assertTrue(checkpoint.completed)
+        self.assertEqual(checkpoint.offset, 5)
+
+    def test_lookup_index_rebuilt_once_per_batch(self):
+        from unittest import mock
+
+        verbs = [
+            {"infinitive": f"verb{i}", "forms": {"Präsens": {"ich": f"form{i}a", "du": f"form{i}b"}}}
+            for i in range(3)
+        ]
+        rebuild = FormLookupService.rebuild_verbs
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(FormLookupService, "sync_form") as sync_form, \
+                mock.patch.object(FormLookupService, "rebuild_verbs", autospec=True, side_effect=rebuild) as rebuilt:
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("import_verbs", self._write(tmp, verbs), "--batch-size", "2", stdout=StringIO())
+
+        # Построчные сигналы индекс не трогают — одна пересборка на пачку после коммита
+        sync_form.assert_not_called()
+        self.assertEqual([len(call.args[1]) for call in rebuilt.call_args_list], [2, 1])
+        self.assertEqual([row["infinitive"] for row in FormLookupService().lookup("form2b")], ["verb2"])
+
+
+class ImportVerbsDryRunTests(BaseCatalogTest):
+    def test_dry_run_diff_reports_without_writing(self):
+        verbs = [
+            {"infinitive": "machen", "level": "B1", "forms": {"Präsens": {"ich": "MACHE", "du": "machst"}}},
+            {"infinitive": "sagen", "translations": {"ru": "сказать"}},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "verbs.json"
+            path.write_text(json.dumps({"verbs": verbs}), encoding="utf-8")
+            out = StringIO()
+            call_command("import_verbs", str(path), "--dry-run", "--diff", "--force",
+                         stdout=out, stderr=StringIO())
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["summary"]["verbs"], {"created": 1, "updated": 1, "skipped": 0})
+        self.assertEqual(report["summary"]["forms"], {"created": 1, "updated": 1, "skipped": 0})
+        machen = report["changes"][0]
+        self.assertEqual(machen["fields"]["level"], {"old": "A1", "new": "B1"})
+
+        # Ничего не записано
+        self.assertFalse(Verb.objects.filter(infinitive="sagen").exists())
+        self.assertEqual(Verb.objects.get(infinitive="machen").level, CEFRLevel.A1.value)
+        self.assertFalse(ImportCheckpoint.objects.exists())
+
+
+class WeakVerbConjugatorTests(SimpleTestCase):
+    def setUp(self):
+        self.conjugator = WeakVerbConjugator()
+
+    def test_e_insertion_and_el_er_verbs(self):
+        forms = self.conjugator.conjugate("arbeiten")
+        self.assertEqual(forms[Tense.PRAESENS.value][Pronoun.DU.value], "arbeitest")
+        self.assertEqual(forms[Tense.PRAETERITUM.value][Pronoun.ICH.value], "arbeitete")
+        self.assertEqual(self.conjugator.conjugate("rechnen")[Tense.PRAESENS.value][Pronoun.ER.value], "rechnet")
+        self.assertEqual(self.conjugator.conjugate("lernen")[Tense.PRAESENS.value][Pronoun.ER.value], "lernt")
+        self.assertEqual(self.conjugator.conjugate("sammeln")[Tense.PRAESENS.value][Pronoun.ICH.value], "sammle")
+        self.assertEqual(self.conjugator.conjugate("tanzen")[Tense.PRAESENS.value][Pronoun.DU.value], "tanzt")
+
+    def test_separable_prefix_moves_to_the_end(self):
+        forms = self.conjugator.conjugate("aufmachen", is_trennbare=True)
+        self.assertEqual(forms[Tense.PRAESENS.value][Pronoun.ICH.value], "mache auf")
+        self.assertEqual(forms[Tense.PRAETERITUM.value][Pronoun.WIR.value], "machten auf")
+
+    def test_unsupported_input_raises(self):
+        with self.assertRaises(MorphologyError):
+            self.conjugator.conjugate("Rad fahren")
+        with self.assertRaises(MorphologyError):
+            self.conjugator.conjugate("machen", tenses=[Tense.PERFEKT.value])
+
+
+class GenerateFormsTests(BaseCatalogTest):
+    def test_fills_gaps_and_reports_unhandled(self):
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("generate_forms", stdout=out)
+
+        forms = dict(
+            VerbForm.objects.filter(verb=self.verb, tense=Tense.PRAETERITUM.value).values_list("pronoun", "form")
+        )
+        self.assertEqual(forms[Pronoun.IHR.value], "machtet")
+        self.assertEqual(VerbForm.objects.filter(verb=self.verb).count(), 12)
+        # Существующая форма не перезаписана, сильный глагол попал в отчёт
+        self.assertEqual(
+            VerbForm.objects.get(verb=self.verb, tense=Tense.PRAESENS.value, pronoun=Pronoun.ICH.value).form,
+            "mache",
+        )
+        self.assertIn("UNHANDLED 'gehen'", out.getvalue())
+        self.assertFalse(Verb.objects.get(infinitive="gehen").forms.exists())
+        # Сгенерированные формы сразу находятся обратным поиском
+        self.assertEqual(
+            [(row["infinitive"], row["pronoun"]) for row in FormLookupService().lookup("machtet")],
+            [("machen", Pronoun.IHR.value)],
+        )
+
+    def test_counts_only_inserted_rows(self):
+        from unittest import mock
+
+        original = VerbForm.objects.bulk_create
+
+        def concurrent_insert(objs, **kwargs):
+            # Форму успели добавить из админки между чтением существующих и вставкой
+            VerbForm.objects.create(verb=self.verb, tense=Tense.PRAESENS.value, pronoun=Pronoun.DU.value, form="machest")
+            return original(objs, **kwargs)
+
+        out = StringIO()
+        with mock.patch.object(VerbForm.objects, "bulk_create", side_effect=concurrent_insert):
+            call_command("generate_forms", "--tense", "Präsens", stdout=out)
+        self.assertIn("Forms: created=4", out.getvalue())
+        self.assertIn("Verbs filled: 1", out.getvalue())
+
+    def test_dry_run_writes_nothing(self):
+        out = StringIO()
+        call_command("generate_forms", "--dry-run", "--tense", "Präsens", stdout=out)
+        self.assertIn("Forms: created=5", out.getvalue())
+        self.assertEqual(VerbForm.objects.count(), 1)
+
+
+class ParticipleGeneratorTests(SimpleTestCase):
+    def _suggest(self, infinitive, verb_type=VerbType.REGULAR.value, **extra):
+        return ParticipleGenerator().suggest(
+            {"infinitive": infinitive, "verb_type": verb_type, "reflexivitaet": Reflexiv.NREFL.value, **extra}
+        )
+
+    def test_participles(self):
+        self.assertEqual(self._suggest("arbeiten").participle_ii, "gearbeitet")
+        self.assertEqual(self._suggest("besuchen").participle_ii, "besucht")
+        self.assertEqual(self._suggest("studieren").participle_ii, "studiert")
+        self.assertEqual(self._suggest("aufmachen", is_trennbare=True).participle_ii, "aufgemacht")
+        self.assertEqual(self._suggest("verstehen", VerbType.STRONG.value).participle_ii, "verstanden")
+        self.assertTrue(self._suggest("schwingen", VerbType.STRONG.value).error)
+
+    def test_native_ieren_verbs_keep_ge(self):
+        self.assertEqual(self._suggest("schmieren").participle_ii, "geschmiert")
+        self.assertEqual(self._suggest("zieren").participle_ii, "geziert")
+        self.assertEqual(self._suggest("verzieren").participle_ii, "verziert")
+        self.assertEqual(self._suggest("beschmieren").participle_ii, "beschmiert")
+        self.assertEqual(self._suggest("frieren", VerbType.STRONG.value).participle_ii, "gefroren")
+        self.assertEqual(self._suggest("telefonieren").participle_ii, "telefoniert")
+
+    def test_auxiliary(self):
+        self.assertEqual(self._suggest("gehen", VerbType.STRONG.value).auxiliary, "sein")
+        ankommen = self._suggest("ankommen", VerbType.STRONG.value, is_trennbare=True)
+        self.assertEqual((ankommen.participle_ii, ankommen.auxiliary), ("angekommen", "sein"))
+        self.assertTrue(ankommen.needs_review)
+        self.assertEqual(self._suggest("machen").auxiliary, "haben")
+
+
+class FillPerfektTests(BaseCatalogTest):
+    def test_fills_only_empty_fields(self):
+        Verb.objects.create(infinitive="kaufen", verb_type=VerbType.REGULAR.value,
+                            reflexivitaet=Reflexiv.NREFL.value, auxiliary="haben")
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = Path(tmp) / "report.json"
+            catalog = ContentVersionService().get_catalog_version()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("fill_perfekt", "--report", str(report_path), stdout=StringIO())
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+
+        gehen = Verb.objects.get(infinitive="gehen")
+        self.assertEqual((gehen.auxiliary, gehen.participle_ii), ("sein", "gegangen"))
+        self.assertEqual(Verb.objects.get(infinitive="kaufen").participle_ii, "gekauft")
+        self.assertEqual(Verb.objects.get(infinitive="machen").participle_ii, "gemacht")
+        self.assertEqual({e["infinitive"] for e in report["filled"]}, {"gehen", "kaufen"})
+        # bulk_update идёт мимо сигналов: версия каталога и индекс форм обновлены командой
+        self.assertNotEqual(ContentVersionService().get_catalog_version(), catalog)
+        self.assertEqual(
+            [row["infinitive"] for row in FormLookupService().lookup("ist gegangen")], ["gehen"]
+        )
+
+
+class CourseListViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.teacher = User.objects.create_user(
+            username="list_teacher", email="list_teacher@test.com", password="password123", role="teacher"
+        )
+        self.student = User.objects.create_user(
+            username="list_student", email="list_student@test.com", password="password123"
+        )
+        self.client.force_login(self.student)
+
+    def _add_courses(self, count):
+        for i in range(count):
+            course = Course.objects.create(
+                title=f"Kurs {i}", author=self.teacher, visibility=Course.Visibility.PRIVATE,
+                description={"de": f"Beschreibung {i}\n\nZweite Zeile\nDritte Zeile"},
+            )
+            course.assigned_students.add(self.student)
+            for order in range(2):
+                LearningUnit.objects.create(course=course, title=f"Einheit {order}", order=order)
+
+    def _count_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("units-list"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_query_count_does_not_grow_with_courses(self):
+        self._add_courses(2)
+        few, _response = self._count_queries()
+        self._add_courses(5)
+        many, response = self._count_queries()
+
+        self.assertEqual(few, many)
+        self.assertEqual(len(response.context["courses"]), 7)
+        self.assertEqual({course.unit_count for course in response.context["courses"]}, {2})
+        # Превью посчитано при сохранении, fallback на de для остальных языков
+        course = next(c for c in response.context["courses"] if c.title == "Kurs 3")
+        self.assertEqual(course.preview, "Beschreibung 3\nZweite Zeile")
+
+    def test_access_set_follows_assignment_and_visibility(self):
+        course = Course.objects.create(title="Privat", author=self.teacher, visibility=Course.Visibility.PRIVATE)
+        self.assertFalse(course.is_accessible_by(self.student))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            course.assigned_students.add(self.student)
+        self.assertTrue(course.is_accessible_by(self.student))
+        with self.assertNumQueries(0):  # множество уже в кеше
+            self.assertTrue(course.is_accessible_by(self.student))
+        ContentVersionService().bump_catalog_version()  # правка юнитов/глаголов
+        with self.assertNumQueries(0):
+            self.assertTrue(course.is_accessible_by(self.student))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.assigned_courses.clear()
+        self.assertFalse(course.is_accessible_by(self.student))
+
+        course.visibility = Course.Visibility.PUBLIC
+        with self.captureOnCommitCallbacks(execute=True):
+            course.save()
+        response = self.client.get(reverse("units-list"))
+        self.assertEqual([c.pk for c in response.context["courses"]], [course.pk])
+
+
+class MarkdownPageTests(SimpleTestCase):
+    def setUp(self):
+        from src.common.markdown_pages import MarkdownPageService
+
+        cache.clear()
+        MarkdownPageService._memory.clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "page.md"
+        self.path.write_text("# Titel\n\nText", encoding="utf-8")
+        self.settings_override = override_settings(
+            MARKDOWN_PAGES={"hilfe": {"path": self.path, "title": "Hilfe"}},
+            MARKDOWN_DEFAULT_PAGE="hilfe",
+        )
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+    def test_page_served_from_cache_until_file_changes(self):
+        from unittest import mock
+
+        import markdown
+
+        out = StringIO()
+        call_command("render_markdown_pages", stdout=out)
+        self.assertIn("Pages rendered: 1/1", out.getvalue())
+
+        with mock.patch.object(markdown.Markdown, "convert", side_effect=AssertionError("re-rendered")):
+            response = self.client.get(reverse("web-markdown_page", args=["hilfe"]))
+        self.assertContains(response, '<h1 id="titel">Titel</h1>', html=True)
+
+        self.path.write_text("# Neu\n\nMehr Text", encoding="utf-8")
+        self.assertContains(self.client.get(reverse("web-markdown_page")), "Mehr Text")
+        self.assertEqual(self.client.get(reverse("web-markdown_page", args=["fehlt"])).status_code, 404)
+
+
+class AnonymousPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_warmed_page_served_with_fresh_csrf_token(self):
+        key = f"page:{settings.RELEASE_VERSION}:de:{reverse('web-impressum')}"
+        cache.set(key, ("<p>alte Version</p>", "text/html"))  # страница прошлого деплоя
+
+        out = StringIO()
+        call_command("warm_page_cache", stdout=out, stderr=StringIO())
+        self.assertIn("Pages warmed: 12", out.getvalue())
+        html, _content_type = cache.get(key)
+        self.assertNotIn("alte Version", html)  # прогрев перезаписывает, а не читает кеш
+        self.assertIn("__page_cache_csrf_token__", html)  # в кеше — плейсхолдер, а не чей-то токен
+
+        response = self.client.get(reverse("web-impressum"))
+        self.assertEqual(response["X-Page-Cache"], "hit")
+        self.assertIn("Accept-Language", response["Vary"])
+        html = response.content.decode()
+        self.assertNotIn("__page_cache_csrf_token__", html)
+        self.assertIn('name="csrfmiddlewaretoken"', html)
+        self.assertIn("csrftoken", response.cookies)
+
+        # Вошедший пользователь кеш не использует (лендинг перенаправляет в кабинет)
+        user = get_user_model().objects.create_user(
+            username="cache_user", email="cache_user@test.com", password="password123"
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(reverse("index")).status_code, 302)
+        self.assertNotIn("X-Page-Cache", self.client.get(reverse("web-privacy")))
+
+
+class TeacherDashboardTabsTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.teacher = User.objects.create_user(
+            username="tab_teacher", email="tab_teacher@test.com", password="password123", role="teacher"
+        )
+        self.client.force_login(self.teacher)
+
+    def _add_students(self, count):
+        User = get_user_model()
+        offset = self.teacher.students.count()
+        for i in range(offset, offset + count):
+            student = User.objects.create_user(
+                username=f"tab_student_{i}", email=f"tab_student_{i}@test.com", password="password123"
+            )
+            self.teacher.students.add(student)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_only_active_tab_rendered_and_students_tab_is_batched(self):
+        self._add_students(2)
+        _count, response = self._count_queries(reverse("web-teacher-dashboard"))
+        self.assertNotIn("students_data", response.context)
+        self.assertContains(response, reverse("web-teacher-tab", args=["students"]))
+
+        url = reverse("web-teacher-tab", args=["students"])
+        few, _response = self._count_queries(url)
+        self._add_students(5)
+        many, response = self._count_queries(url)
+        self.assertEqual(few, many)
+        self.assertEqual(len(response.context["students_data"]), 7)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        self.assertEqual(self.client.get(reverse("web-teacher-tab", args=["unknown"])).status_code, 404)
+
+
+class CourseProgressOverviewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.teacher = User.objects.create_user(
+            username="overview_teacher", email="overview_teacher@test.com", password="password123", role="teacher"
+        )
+        self.student = User.objects.create_user(
+            username="overview_student", email="overview_student@test.com", password="password123"
+        )
+        self.teacher.students.add(self.student)
+        self.client.force_login(self.teacher)
+
+        self.verbs = [
+            Verb.objects.create(infinitive=name, verb_type=VerbType.REGULAR.value, reflexivitaet=Reflexiv.NREFL.value)
+            for name in ("lernen", "machen")
+        ]
+        self.group = VerbGroup.objects.create(title="Basis", author=self.teacher)
+        self.group.verbs.add(*self.verbs)
+
+    def _add_courses(self, count):
+        for i in range(count):
+            course = Course.objects.create(title=f"Kurs {i}", author=self.teacher)
+            course.assigned_students.add(self.student)
+            for order in range(2):
+                LearningUnit.objects.create(
+                    course=course, title=f"Einheit {order}", order=order,
+                    skill_type=SkillType.TRANSLATION.value, verb_group=self.group,
+                )
+
+    def _get(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("web-student-detail", args=[self.student.pk]))
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_student_courses_progress_in_constant_queries(self):
+        UserVerbProgress.objects.create(
+            user=self.student, verb=self.verbs[0], skill_type=SkillType.TRANSLATION.value, mastered=True
+        )
+        self._add_courses(1)
+        few, _response = self._get()
+        self._add_courses(4)
+        many, response = self._get()
+
+        self.assertEqual(few, many)
+        self.assertEqual([item["percent"] for item in response.context["courses_data"]], [50] * 5)
+        self.assertEqual({item["unit_count"] for item in response.context["courses_data"]}, {2})
+
+
+class VerbSearchServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for name in ("abfahren", "fahren", "erfahren", "fangen", "ärgern", "heißen"):
+            Verb.objects.create(infinitive=name, verb_type=VerbType.REGULAR.value, reflexivitaet=Reflexiv.NREFL.value)
+
+    def _search(self, query):
+        return [row["text"] for row in VerbSearchService().search(query)]
+
+    def test_prefix_first_and_umlaut_folding(self):
+        self.assertEqual(self._search("fa"), ["fahren", "fangen", "abfahren", "erfahren"])
+        self.assertEqual(self._search("fahr"), ["fahren", "abfahren", "erfahren"])
+        self.assertEqual(self._search("Aerg"), ["ärgern"])
+        self.assertEqual(self._search("heiss"), ["heißen"])
+
+        with self.assertNumQueries(0):  # индекс уже построен
+            self._search("fang")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Verb.objects.create(infinitive="fallen", verb_type=VerbType.STRONG.value, reflexivitaet=Reflexiv.NREFL.value)
+            # Версия каталога меняется только после коммита: до него индекс не пересобирается
+            self.assertEqual(self._search("fal"), [])
+        self.assertEqual(self._search("fal"), ["fallen"])
+
+
+class FormLookupServiceTests(TestCase):
+    def setUp(self):
+        self.gehen = Verb.objects.create(
+            infinitive="gehen", verb_type=VerbType.STRONG.value, reflexivitaet=Reflexiv.NREFL.value,
+            auxiliary="sein", participle_ii="gegangen",
+        )
+        VerbForm.objects.create(verb=self.gehen, tense=Tense.PRAETERITUM.value, pronoun=Pronoun.ICH, form="ging")
+        VerbForm.objects.create(verb=self.gehen, tense=Tense.PRAETERITUM.value, pronoun=Pronoun.ER, form="ging")
+        self.fuehlen = Verb.objects.create(
+            infinitive="fühlen", verb_type=VerbType.REGULAR.value, reflexivitaet=Reflexiv.NREFL.value,
+        )
+        VerbForm.objects.create(verb=self.fuehlen, tense=Tense.PRAESENS.value, pronoun=Pronoun.DU, form="fühlst")
+
+    def _lookup(self, query):
+        return [(row["infinitive"], row["tense"], row["pronoun"]) for row in FormLookupService().lookup(query)]
+
+    def test_forms_and_generated_perfekt(self):
+        self.assertEqual(
+            self._lookup("ging"),
+            [("gehen", "Präteritum", "er/sie/es"), ("gehen", "Präteritum", "ich")],
+        )
+        self.assertEqual(self._lookup("FUEHLST"), [("fühlen", "Präsens", "du")])
+        self.assertEqual(self._lookup("du  bist gegangen"), [("gehen", "Perfekt", "du")])
+        self.assertEqual(self._lookup("gegangen"), [("gehen", "Perfekt", None)])
+
+    def test_index_follows_changes(self):
+        form = self.fuehlen.forms.get()
+        form.form = "fuhlst"
+        form.save()
+        self.assertEqual(self._lookup("fühlst"), [])
+        form.delete()
+        self.assertEqual(self._lookup("fuhlst"), [])
+
+        self.gehen.auxiliary = "haben"
+        self.gehen.save()
+        self.assertEqual(self._lookup("bin gegangen"), [])
+        self.assertEqual(self._lookup("habe gegangen"), [("gehen", "Perfekt", "ich")])
+
+    def test_command_rebuilds_after_bulk_writes(self):
+        VerbForm.objects.bulk_create([
+            VerbForm(verb=self.fuehlen, tense=Tense.PRAESENS.value, pronoun=Pronoun.ICH, form="fühle"),
+        ])
+        self.assertEqual(self._lookup("fühle"), [])
+        call_command("build_form_index", stdout=StringIO())
+        self.assertEqual(self._lookup("fühle"), [("fühlen", "Präsens", "ich")])
+
+    def test_api_endpoint(self):
+        user = get_user_model().objects.create_user(username="form-lookup", password="pw")
+        self.client.force_login(user)
+        url = reverse("verbs-lookup-form")
+        self.assertEqual(self.client.get(url).status_code, 400)
+        response = self.client.get(url, {"q": "ist gegangen"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["infinitive"], "gehen")
+
+
+class CourseProgressExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.teacher = User.objects.create_user(
+            username="export_teacher", email="export_teacher@test.com", password="password123", role="teacher"
+        )
+        self.client.force_login(self.teacher)
+        self.verbs = [
+            Verb.objects.create(infinitive=name, verb_type=VerbType.REGULAR.value, reflexivitaet=Reflexiv.NREFL.value)
+            for name in ("lernen", "machen")
+        ]
+        group = VerbGroup.objects.create(title="Basis", author=self.teacher)
+        group.verbs.add(*self.verbs)
+        self.course = Course.objects.create(title="Kurs Ä", author=self.teacher)
+        LearningUnit.objects.create(
+            course=self.course, title="Einheit", order=1, skill_type=SkillType.TRANSLATION.value, verb_group=group,
+        )
+        self._add_students(1)
+        UserVerbProgress.objects.create(
+            user=self.students[0], verb=self.verbs[0], skill_type=SkillType.TRANSLATION.value, mastered=True
+        )
+
+    def _add_students(self, count):
+        User = get_user_model()
+        start = User.objects.count()
+        for i in range(start, start + count):
+            student = User.objects.create_user(username=f"export_student_{i}", email=f"s{i}@test.com", password="x")
+            self.teacher.students.add(student)
+            self.course.assigned_students.add(student)
+        self.students = list(self.teacher.students.order_by("date_joined"))
+
+    def _export(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("web-course-progress-export", args=[self.course.pk]), params)
+            body = b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response, body
+
+    def test_csv_rows_in_constant_queries(self):
+        few, _response, body = self._export()
+        lines = body.decode("utf-8-sig").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith("export_student_1,"))
+        self.assertIn(",1,2,50,False", lines[1])
+
+        self._add_students(3)
+        many, _response, body = self._export(atoms="1")
+        self.assertEqual(few, many)
+        self.assertEqual(len(body.decode("utf-8-sig").splitlines()), 1 + 4 * 2)
+
+    def test_xlsx_is_valid_workbook(self):
+        _queries, response, body = self._export(format="xlsx")
+        self.assertIn(".xlsx", response["Content-Disposition"])
+        with zipfile.ZipFile(BytesIO(body)) as book:
+            self.assertIsNone(book.testzip())
+            sheet = ElementTree.fromstring(book.read("xl/worksheets/sheet1.xml"))
+        namespace = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        self.assertEqual(len(sheet.findall(".//s:row", namespace)), 2)
+        self.assertEqual(sheet.find(".//s:row[2]/s:c[1]/s:is/s:t", namespace).text, "export_student_1")
@@ -1,7 +1,10 @@
+import hashlib
 import secrets
 import string
+from django.core.cache import caches
 from django.core.mail import send_mail
 from django.conf import settings
+from rest_framework.authtoken.models import Token
 from src.users.models import StudentInvitation
 
 
@@ -44,4 +47,41 @@ class InvitationService:
             [email],
             fail_silently=False,
         )
-        return invitation
\ No newline at end of file
+        return invitation
+
+class TokenCacheService:
+    """
+    Кеш token -> user для CachedTokenAuthentication.
+    Ключ — sha256 токена (сам токен в кеш не пишется).
+    Инвалидация: удаление токена (logout) и сохранение пользователя — см. src/users/signals.py.
+    Алиас кеша задаётся settings.AUTH_TOKEN_CACHE_ALIAS (по умолчанию "default", Redis);
+    для одного процесса можно указать locmem-алиас.
+    """
+
+    KEY_PREFIX = "auth:token"
+    TTL = 15 * 60
+
+    @classmethod
+    def _cache(cls):
+        return caches[getattr(settings, "AUTH_TOKEN_CACHE_ALIAS", "default")]
+
+    @classmethod
+    def _key(cls, token_key: str) -> str:
+        return f"{cls.KEY_PREFIX}:{hashlib.sha256(token_key.encode()).hexdigest()}"
+
+    @classmethod
+    def get_user(cls, token_key: str):
+        return cls._cache().get(cls._key(token_key))
+
+    @classmethod
+    def set_user(cls, token_key: str, user) -> None:
+        cls._cache().set(cls._key(token_key), user, cls.TTL)
+
+    @classmethod
+    def invalidate(cls, *token_keys: str) -> None:
+        if token_keys:
+            cls._cache().delete_many([cls._key(key) for key in token_keys])
+
+    @classmethod
+    def invalidate_user(cls, user_id) -> None:
+        cls.invalidate(*Token.objects.filter(user_id=user_id).values_list("key", flat=True))
@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from src.users.services import TokenCacheService
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    # В кеше лежит копия пользователя: роль, язык, is_active должны обновиться сразу
+    TokenCacheService.invalidate_user(instance.pk)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    # logout удаляет токен — он должен перестать работать сразу, а не через TTL
+    TokenCacheService.invalidate(instance.key)
@@ -1,4 +1,3 @@
-import json
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -19,11 +18,8 @@ class CourseForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Получаем текущие значения из JSON
-        try:
-            current_data = json.loads(self.instance.description or '{}')
-        except ValueError:
-            current_data = {}
+        # Текущие значения по языкам (JSONField)
+        current_data = self.instance.description if isinstance(self.instance.description, dict) else {}
 
         # Динамически создаем поля для каждого языка в форме
         for lang_code, lang_name in settings.LANGUAGES:
@@ -54,8 +50,8 @@ class CourseForm(forms.ModelForm):
             if value:
                 description_json[lang_code] = value
 
-        # Записываем JSON-строку в основное поле
-        cleaned_data['description'] = json.dumps(description_json, ensure_ascii=False)
+        # Словарь по языкам в основное поле; превью посчитает Course.save()
+        cleaned_data['description'] = description_json
         return cleaned_data
 
 class CourseAssignmentForm(forms.ModelForm):
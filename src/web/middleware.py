@@ -0,0 +1,36 @@
+import math
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.translation import gettext as _
+from rest_framework.throttling import BaseThrottle
+
+from src.common.rate_limit import limiter
+
+
+class TokenBucketMiddleware:
+    # Ограничение частоты для обычных (HTMX) view — те же вёдра, что у TokenBucketThrottle в API.
+    # Эндпоинты выбираются по url_name: settings.THROTTLE_URL_SCOPES = {"submit-answer": "training-answer"}.
+    # Проверка в process_view — после AuthenticationMiddleware, request.user уже есть.
+    # При превышении — 429 с Retry-After; HTMX не подменяет контент на 4xx, карточка остаётся на месте.
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.ident = BaseThrottle().get_ident  # IP с учётом NUM_PROXIES, как в DRF
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        url_name = request.resolver_match.url_name if request.resolver_match else None
+        scope = getattr(settings, "THROTTLE_URL_SCOPES", {}).get(url_name)
+        if not scope:
+            return None
+
+        user_id = request.user.pk if request.user.is_authenticated else None
+        result = limiter.check(scope, user_id=user_id, ip=self.ident(request))
+        if result.allowed:
+            return None
+
+        response = HttpResponse(_("Zu viele Anfragen. Bitte kurz warten."), status=429)
+        response["Retry-After"] = str(math.ceil(result.retry_after))
+        return response
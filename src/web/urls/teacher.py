@@ -5,6 +5,7 @@ from src.web import views
 urlpatterns = [
     # Кабинет Учителя (Tabs)
     path('', views.TeacherDashboardView.as_view(), name='web-teacher-dashboard'),
+    path('tab/<slug:tab>/', views.TeacherDashboardTabView.as_view(), name='web-teacher-tab'),
     path('students/<uuid:student_id>/', views.StudentDetailView.as_view(), name='web-student-detail'),
     path('students/<uuid:student_id>/course/<uuid:course_id>/', views.StudentCourseDetailView.as_view(), name='web-teacher-student-course-detail'),
     path('invitation/add/', views.CreateInvitationView.as_view(), name='web-create-invitation'),
@@ -17,6 +18,7 @@ urlpatterns = [
     path('courses/<uuid:pk>/edit/', views.CourseUpdateView.as_view(), name='web-course-edit'),
     path('courses/<uuid:pk>/delete/', views.CourseDeleteView.as_view(), name='web-course-delete'),
     path('courses/<uuid:course_id>/assign/', views.CourseAssignmentView.as_view(), name='web-course-assign'),
+    path('courses/<uuid:course_id>/export/', views.CourseProgressExportView.as_view(), name='web-course-progress-export'),
 
     # Управление Юнитами (LearningUnit)
     path('courses/<uuid:course_id>/unit/add/', views.UnitCreateView.as_view(), name='web-unit-create'),
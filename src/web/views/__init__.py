@@ -15,6 +15,7 @@ from src.web.views.teacher.students import (
     StudentDetailView,
     UnitStatsView,
     StudentCourseDetailView,
+    CourseProgressExportView,
 )
 from src.web.views.teacher.invitations import (
     CreateInvitationView,
@@ -23,6 +24,7 @@ from src.web.views.teacher.invitations import (
 )
 from src.web.views.teacher.dashboard import (
     TeacherDashboardView,
+    TeacherDashboardTabView,
 )
 from src.web.views.course import (
     CourseCreateView,
@@ -61,12 +63,14 @@ __all__ = [
 
     'StudentDetailView',
     'StudentCourseDetailView',
+    'CourseProgressExportView',
     'UnitStatsView',
 
     'CreateInvitationView',
     'InvitationUpdateView',
     'InvitationDeleteView',
     'TeacherDashboardView',
+    'TeacherDashboardTabView',
     'HomeView',
 
     'CourseListView',
@@ -1,7 +1,9 @@
 from django.views.generic import TemplateView
 from django.shortcuts import redirect
 
-class HomeView(TemplateView):
+from src.web.views.mixins import AnonymousPageCacheMixin
+
+class HomeView(AnonymousPageCacheMixin, TemplateView):
     template_name = 'landing.html'
 
     def dispatch(self, request, *args, **kwargs):
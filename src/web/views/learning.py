@@ -1,10 +1,13 @@
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+from django.db.models.fields.json import KT
+from django.utils.translation import get_language
 from django.views.generic import ListView, DetailView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404, render
 
 from src.personal_forms.models import LearningUnit, Course
-from src.personal_forms.services import TrainingService, LearningUnitProgressService
+from src.personal_forms.services import CourseAccessService, TrainingService, LearningUnitProgressService
 
 
 class CourseListView(LoginRequiredMixin, ListView):
@@ -14,16 +17,24 @@ class CourseListView(LoginRequiredMixin, ListView):
 
     def get_queryset(self):
         user = self.request.user
+        # Число юнитов и автор — в том же запросе: карточка курса не делает своих запросов
+        # Из описания — только готовое превью на текущем языке (Course.description_previews)
+        language = get_language() or settings.LANGUAGE_CODE
+        queryset = Course.objects.select_related('author').defer(
+            'description', 'description_previews',
+        ).annotate(
+            unit_count=Count('learning_units'),
+            is_own=ExpressionWrapper(Q(author=user), output_field=BooleanField()),
+            preview=KT(f'description_previews__{language}'),
+        ).order_by('-created_at')
+
         # Если админ — видит всё
         if user.is_staff:
-            return Course.objects.all().order_by('-created_at')
+            return queryset
 
-        # Логика доступа: Публичные ИЛИ (Приватные и назначен ученику) ИЛИ (Автор курса)
-        return Course.objects.filter(
-            Q(visibility=Course.Visibility.PUBLIC) |
-            Q(assigned_students=user) |
-            Q(author=user)
-        ).distinct().order_by('-created_at')
+        # Логика доступа: Публичные ИЛИ (Приватные и назначен ученику) ИЛИ (Автор курса) —
+        # кешированное множество id (CourseAccessService), без OR по JOIN и distinct()
+        return CourseAccessService().filter_accessible(queryset, user)
 
 
 class CourseDetailView(LoginRequiredMixin, DetailView):
@@ -37,11 +48,8 @@ class CourseDetailView(LoginRequiredMixin, DetailView):
         service = LearningUnitProgressService()
         course = self.get_object()
 
-        # 1. Получаем юниты только этого курса
-        units = course.learning_units.all().order_by('order')
-
-        # 2. Используем ваш сервис для расчета прогресса по этим юнитам
-        context['units_overview'] = service.get_units_overview(self.request.user, list(units))
+        # 1-2. Юниты только этого курса (с глаголами наборов) и прогресс по ним
+        context['units_overview'] = service.get_courses_overview(self.request.user, [course])[0]['units']
 
         # 3. Общая статистика пользователя (остается глобальной)
         context['stats'] = service.get_global_stats(self.request.user)
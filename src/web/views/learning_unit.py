@@ -4,7 +4,8 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404, redirect
 from django.http import JsonResponse
 
-from src.personal_forms.models import Course, LearningUnit, Verb, VerbGroup
+from src.personal_forms.models import Course, LearningUnit, VerbGroup
+from src.personal_forms.services import VerbSearchService
 from src.web.forms import UnitForm
 from src.web.views.mixins import TeacherRequiredMixin
 
@@ -63,9 +64,8 @@ class VerbLookupView(LoginRequiredMixin, View):
         if len(query) < 2:  # Начинаем поиск от 2-х символов
             return JsonResponse({'results': []})
 
-        verbs = Verb.objects.filter(infinitive__icontains=query).order_by('infinitive')[:20]
-        results = [{'id': v.id, 'text': v.infinitive} for v in verbs]
-        return JsonResponse({'results': results})
+        # Индекс в памяти: сначала совпадения с начала слова, ä = ae, ß = ss
+        return JsonResponse({'results': VerbSearchService().search(query, limit=20)})
 
 
 class VerbGroupCreateView(LoginRequiredMixin, TeacherRequiredMixin, CreateView):
@@ -1,7 +1,9 @@
 from django.views.generic import TemplateView
 
-class ImpressumView(TemplateView):
+from src.web.views.mixins import AnonymousPageCacheMixin
+
+class ImpressumView(AnonymousPageCacheMixin, TemplateView):
     template_name = 'legal/impressum.html'
 
-class PrivacyView(TemplateView):
-    template_name = 'legal/privacy.html'
\ No newline at end of file
+class PrivacyView(AnonymousPageCacheMixin, TemplateView):
+    template_name = 'legal/privacy.html'
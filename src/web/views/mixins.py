@@ -1,5 +1,7 @@
 from django.shortcuts import redirect
 
+from src.common.page_cache import PageCacheService
+
 class TeacherRequiredMixin:
     """
     Миксин для проверки прав учителя.
@@ -8,4 +10,28 @@ class TeacherRequiredMixin:
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_teacher_admin():
             return redirect('web-profile')
-        return super().dispatch(request, *args, **kwargs)
\ No newline at end of file
+        return super().dispatch(request, *args, **kwargs)
+
+class AnonymousPageCacheMixin:
+    """
+    Полностраничный кеш для анонимных посетителей (src/common/page_cache.py).
+    Вошедшие пользователи, запросы с параметрами и с flash-сообщениями рендерятся как обычно.
+    """
+    def dispatch(self, request, *args, **kwargs):
+        service = PageCacheService()
+        if not service.is_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        response = service.get(request)
+        if response is not None:
+            return response
+
+        self.render_for_page_cache = True
+        return service.store(request, super().dispatch(request, *args, **kwargs))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if getattr(self, 'render_for_page_cache', False):
+            # Контекст view перекрывает context processor csrf
+            context['csrf_token'] = PageCacheService.CSRF_PLACEHOLDER
+        return context
@@ -1,21 +1,14 @@
-from pathlib import Path
-import markdown
-
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import render
 
+from src.common.markdown_pages import MarkdownPageService
 
-def markdown_page(request):
-
-    file_path = Path("content/work_1c.md")
-    with open(file_path, "r", encoding="utf-8") as f:
-        md_text = f.read()
 
-    html = markdown.markdown(
-        md_text,
-        extensions=[
-            'markdown.extensions.extra',
-            'markdown.extensions.toc',
-        ]
-    )
+def markdown_page(request, slug=None):
+    # Готовый HTML из кеша (MarkdownPageService): без чтения файла и парсинга markdown на запрос
+    page = MarkdownPageService().get_page(slug or settings.MARKDOWN_DEFAULT_PAGE)
+    if page is None:
+        raise Http404
 
-    return render(request, "markdown.html", {"content": html})
\ No newline at end of file
+    return render(request, "markdown.html", {"content": page.html, "page": page})
@@ -1,4 +1,9 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Count
+from django.http import Http404
+from django.utils.decorators import method_decorator
+from django.utils.translation import gettext_lazy as _
+from django.views.decorators.cache import cache_control
 from django.views.generic import TemplateView
 
 from src.personal_forms.models import Course, VerbGroup
@@ -9,36 +14,84 @@ from src.web.forms import InvitationForm
 from src.web.views.mixins import TeacherRequiredMixin
 
 
-class TeacherDashboardView(LoginRequiredMixin, TeacherRequiredMixin, TemplateView):
+class TeacherDashboardTabsMixin:
+    """
+    Данные вкладок кабинета учителя; каждая вкладка считается только когда её показывают.
+    Шаблон вкладки — teacher/partials/tab_<tab>.html.
+    """
+    # (код вкладки, иконка, заголовок)
+    TABS = (
+        ('courses', '📚', _("Kurse")),
+        ('invites', '✉️', _("Einladungen")),
+        ('students', '👨‍🎓', _("Meine Schüler")),
+        ('vocab', '', _("Wortschatz")),
+    )
+    TAB_NAMES = [tab for tab, _icon, _label in TABS]
+
+    def get_tab_context(self, tab):
+        return getattr(self, f'get_{tab}_context')()
+
+    @staticmethod
+    def get_tab_template(tab):
+        return f'teacher/partials/tab_{tab}.html'
+
+    def get_courses_context(self):
+        return {
+            'courses': Course.objects.filter(author=self.request.user).prefetch_related('learning_units'),
+        }
+
+    def get_invites_context(self):
+        return {
+            'invitations': StudentInvitation.objects.filter(teacher=self.request.user).order_by('-created_at'),
+            'invite_form': InvitationForm(),
+        }
+
+    def get_students_context(self):
+        # Статистика всех учеников одним GROUP BY вместо запроса на ученика
+        students = list(self.request.user.students.all())
+        stats = LearningUnitProgressService().get_global_stats_bulk([student.pk for student in students])
+        return {
+            'students_data': [{'user': student, 'stats': stats[student.pk]} for student in students],
+        }
+
+    def get_vocab_context(self):
+        return {
+            'verb_groups': VerbGroup.objects.filter(
+                author=self.request.user
+            ).annotate(verb_count=Count('verbs')).order_by('title'),
+        }
+
+
+class TeacherDashboardView(LoginRequiredMixin, TeacherRequiredMixin, TeacherDashboardTabsMixin, TemplateView):
     template_name = 'teacher/dashboard_main.html'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Получаем таб из URL, если его нет — ставим 'courses'
-        context['active_tab'] = self.request.GET.get('tab', 'courses')
-        user = self.request.user
-        service = LearningUnitProgressService()
-
-        # Данные для вкладки 1: Курсы
-        context['courses'] = Course.objects.filter(author=user).prefetch_related('learning_units')
-
-        # Данные для вкладки 2: Приглашения
-        context['invitations'] = StudentInvitation.objects.filter(teacher=user).order_by('-created_at')
-        context['invite_form'] = InvitationForm()
-
-        # Данные для вкладки 3: Ученики
-        students = user.students.all()
-        students_data = []
-        for student in students:
-            students_data.append({
-                'user': student,
-                'stats': service.get_global_stats(student)
-            })
-        context['students_data'] = students_data
-
-        # Данные для вкладки 4: Списки глаголов
-        context['verb_groups'] = VerbGroup.objects.filter(
-            author=self.request.user
-        ).prefetch_related('verbs').order_by('title')
-
-        return context
\ No newline at end of file
+        active_tab = self.request.GET.get('tab', 'courses')
+        if active_tab not in self.TAB_NAMES:
+            active_tab = 'courses'
+
+        context['tabs'] = self.TABS
+        context['active_tab'] = active_tab
+        context['active_tab_template'] = self.get_tab_template(active_tab)
+        context.update(self.get_tab_context(active_tab))
+        return context
+
+
+@method_decorator(cache_control(private=True, no_cache=True, must_revalidate=True), name='dispatch')
+class TeacherDashboardTabView(LoginRequiredMixin, TeacherRequiredMixin, TeacherDashboardTabsMixin, TemplateView):
+    """HTMX-фрагмент одной вкладки кабинета (ленивая загрузка по клику)"""
+
+    def get(self, request, *args, **kwargs):
+        if kwargs['tab'] not in self.TAB_NAMES:
+            raise Http404
+        return super().get(request, *args, **kwargs)
+
+    def get_template_names(self):
+        return [self.get_tab_template(self.kwargs['tab'])]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(self.get_tab_context(self.kwargs['tab']))
+        return context
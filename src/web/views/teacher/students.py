@@ -1,11 +1,19 @@
 
+from django.views import View
 from django.views.generic import DetailView, TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.text import slugify
 
 from src.personal_forms.models import LearningUnit
-from src.personal_forms.services import LearningUnitProgressService
+from src.common.tabular_export import FORMATS, streaming_table_response
+from src.personal_forms.services import (
+    ClassProgressExportService,
+    CourseAccessService,
+    LearningUnitProgressService,
+)
 from src.users.models import User
 from src.personal_forms.models import Course
 from src.web.views.mixins import TeacherRequiredMixin
@@ -24,27 +32,13 @@ class StudentDetailView(LoginRequiredMixin, TeacherRequiredMixin, DetailView):
         service = LearningUnitProgressService()
 
         # 1. Получаем курсы, доступные ЭТОМУ студенту
-        courses = Course.objects.filter(
-            Q(visibility=Course.Visibility.PUBLIC)
-            | (Q(assigned_students=student)
-            & Q(author=self.request.user))
-        ).distinct().order_by('-created_at')
-
-        # 2. Рассчитываем прогресс по каждому курсу для этого студента
-        courses_with_progress = []
-        for course in courses:
-            units = list(course.learning_units.all())
-            overview = service.get_units_overview(student, units)
-
-            # Считаем средний процент по курсу
-            total_pct = sum(u['percent'] for u in overview) if overview else 0
-            avg_pct = int(total_pct / len(overview)) if overview else 0
-
-            courses_with_progress.append({
-                'course': course,
-                'percent': avg_pct,
-                'unit_count': len(units)
-            })
+        # (публичные или курсы этого учителя) из множества доступных ученику
+        courses = CourseAccessService().filter_accessible(Course.objects, student).filter(
+            Q(visibility=Course.Visibility.PUBLIC) | Q(author=self.request.user)
+        ).select_related('author').order_by('-created_at')
+
+        # 2. Прогресс по всем курсам сразу: один запрос прогресса и один запрос юнитов
+        courses_with_progress = service.get_courses_overview(student, courses)
 
         context['courses_data'] = courses_with_progress
         context['global_stats'] = service.get_global_stats(student)
@@ -67,12 +61,43 @@ class StudentCourseDetailView(LoginRequiredMixin, TeacherRequiredMixin, DetailVi
         course = self.get_object()
 
         # Юниты этого курса с прогрессом ЭТОГО студента
-        units = list(course.learning_units.all().order_by('order'))
-        context['units_overview'] = service.get_units_overview(student, units)
+        context['units_overview'] = service.get_courses_overview(student, [course])[0]['units']
         context['student'] = student
         context['global_stats'] = service.get_global_stats(student)
         return context
 
+class CourseProgressExportView(LoginRequiredMixin, TeacherRequiredMixin, View):
+    """
+    Выгрузка прогресса учеников учителя по курсу: ?format=csv|xlsx, ?atoms=1 — строка на атом.
+    Ответ потоковый: строки пишутся по мере чтения курсоров БД, класс целиком в память не грузится.
+    """
+
+    def get(self, request, course_id):
+        course = get_object_or_404(
+            Course.objects.filter(Q(visibility=Course.Visibility.PUBLIC) | Q(author=request.user)),
+            pk=course_id,
+        )
+        # Ученики этого учителя, которым курс доступен
+        students = request.user.students.all()
+        if course.visibility != Course.Visibility.PUBLIC:
+            students = students.filter(assigned_courses=course)
+
+        export_format = request.GET.get("format", "csv")
+        if export_format not in FORMATS:
+            export_format = "csv"
+        atoms = request.GET.get("atoms") in ("1", "true")
+
+        service = ClassProgressExportService()
+        header = service.header(atoms)
+
+        def rows():
+            yield header
+            yield from service.iter_rows(course, students, atoms=atoms)
+
+        filename = f"{slugify(course.title) or 'course'}-{timezone.localdate():%Y-%m-%d}"
+        return streaming_table_response(rows(), filename, export_format)
+
+
 class UnitStatsView(LoginRequiredMixin, DetailView):
     model = LearningUnit
     template_name = 'personal_forms/unit_stats.html'